@@ -757,6 +757,64 @@ class UnaryUnaryMultiCallable(six.with_metaclass(abc.ABCMeta)):
         """
         raise NotImplementedError()
 
+    def batch(self,
+              requests,
+              timeout=None,
+              metadata=None,
+              credentials=None,
+              wait_for_ready=None,
+              compression=None):
+        """Synchronously invokes the underlying RPC once per request.
+
+        This is an EXPERIMENTAL API.
+
+        The RPCs are started concurrently and share the given timeout,
+        metadata and options. This method returns once all of them have
+        terminated. The default implementation starts each RPC with future.
+
+        Args:
+          requests: An iterable of request values, one per RPC.
+          timeout: An optional duration of time in seconds to allow for
+            each of the RPCs.
+          metadata: Optional :term:`metadata` to be transmitted to the
+            service-side of each RPC.
+          credentials: An optional CallCredentials for the RPCs. Only valid
+            for secure Channel.
+          wait_for_ready: An optional flag to enable :term:`wait_for_ready`
+            mechanism.
+          compression: An element of grpc.compression, e.g.
+            grpc.compression.Gzip.
+
+        Returns:
+          A tuple with one (response, call) pair per request, in the order of
+          the requests. For an RPC that terminated with OK status, the pair
+          holds the response value and a Call for the RPC. For any other RPC,
+          the response is None and the call is an RpcError that is also a Call
+          affording the RPC's metadata, status code, and details.
+        """
+        started = []
+        for request in requests:
+            try:
+                started.append((self.future(request,
+                                            timeout=timeout,
+                                            metadata=metadata,
+                                            credentials=credentials,
+                                            wait_for_ready=wait_for_ready,
+                                            compression=compression), None))
+            except RpcError as rpc_error:
+                # E.g. the request could not be serialized.
+                started.append((None, rpc_error))
+        results = []
+        for call, rpc_error in started:
+            if call is not None:
+                try:
+                    results.append((call.result(), call))
+                    continue
+                except RpcError as call_rpc_error:
+                    rpc_error = call_rpc_error
+            results.append((None, rpc_error))
+        return tuple(results)
+
 
 class UnaryStreamMultiCallable(six.with_metaclass(abc.ABCMeta)):
     """Affords invoking a unary-stream RPC from client-side."""
@@ -1367,7 +1425,21 @@ class ServiceRpcHandler(six.with_metaclass(abc.ABCMeta, GenericRpcHandler)):
 
 
 class ServerInterceptor(six.with_metaclass(abc.ABCMeta)):
-    """Affords intercepting incoming RPCs on the service-side."""
+    """Affords intercepting incoming RPCs on the service-side.
+
+    Attributes:
+      method_scoped: Whether the RpcMethodHandler returned by
+        intercept_service depends only on the method of the RPC and on the
+        RpcMethodHandler returned by the continuation, and not on the
+        invocation metadata. When all of a server's interceptors are method
+        scoped and all of its generic handlers were created by
+        method_handlers_generic_handler, the server reuses the
+        RpcMethodHandler they return for a method rather than running them
+        again for every RPC, until further generic handlers are added. This
+        is an EXPERIMENTAL API. Defaults to False.
+    """
+
+    method_scoped = False
 
     @abc.abstractmethod
     def intercept_service(self, continuation, handler_call_details):
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Invocation-side implementation of gRPC Python."""
 
+import collections
 import copy
 import functools
 import logging
@@ -23,8 +24,10 @@ import time
 
 import grpc
 import grpc.experimental
+from grpc.experimental import _PYTHON_CHANNEL_OPTIONS
 from grpc import _compression
 from grpc import _common
+from grpc import _deadline_propagation
 from grpc import _grpcio_metadata
 from grpc._cython import cygrpc
 
@@ -39,6 +42,22 @@ _EMPTY_FLAGS = 0
 _DEFAULT_SINGLE_THREADED_UNARY_STREAM = os.getenv(
     "GRPC_SINGLE_THREADED_UNARY_STREAM") is not None
 
+_DEFAULT_COMPLETION_QUEUE_POLLERS = 1
+
+_DEFAULT_READ_AHEAD_MESSAGES = 0
+_DEFAULT_READ_AHEAD_BYTES = 4 * 1024 * 1024
+
+_DEFAULT_COALESCED_WRITE_BYTES = 0
+
+# The receive operations a unary-unary multicallable keeps for reuse, and the
+# size of the largest response whose operation is kept.
+_MAXIMUM_POOLED_RECEIVE_OPERATIONS = 16
+_MAXIMUM_POOLED_RESPONSE_BYTES = 64 * 1024
+
+# An operation without per-call state, which is thus shared by every call.
+_SEND_CLOSE_FROM_CLIENT_OPERATION = cygrpc.SendCloseFromClientOperation(
+    _EMPTY_FLAGS)
+
 _UNARY_UNARY_INITIAL_DUE = (
     cygrpc.OperationType.send_initial_metadata,
     cygrpc.OperationType.send_message,
@@ -82,7 +101,7 @@ _NON_OK_RENDEZVOUS_REPR_FORMAT = ('<{} of RPC that terminated with:\n'
 
 
 def _deadline(timeout):
-    return None if timeout is None else time.time() + timeout
+    return None if timeout is None else cygrpc.monotonic_time() + timeout
 
 
 def _unknown_code_details(unknown_cygrpc_code, details):
@@ -119,10 +138,177 @@ class _RPCState(object):
         self.callbacks = []
         self.fork_epoch = cygrpc.get_fork_epoch()
 
+        # A _ReadAhead if responses are received ahead of the application,
+        # in which case they are buffered there rather than in `response`.
+        self.read_ahead = None
+        # A _WriteQueue if requests are consumed ahead of their writes.
+        self.write_queue = None
+
     def reset_postfork_child(self):
         self.condition = threading.Condition()
 
 
+class _ReadAhead(object):
+    """The responses of an RPC received ahead of the application.
+
+    Attributes:
+      depth: The maximum number of buffered responses.
+      maximum_bytes: The serialized size of the buffered responses at which
+        no further message is received until the application catches up.
+      zero_copy_receive: Whether messages are received as memoryviews.
+      responses: A collections.deque of buffered responses, each with its
+        serialized size.
+      buffered_bytes: The serialized size of the buffered responses.
+      exhausted: Whether the end of the response stream has been received.
+      call: The call on which to receive messages, once it exists.
+      event_handler: The tag of the receive operations of the call.
+    """
+
+    def __init__(self, depth, maximum_bytes, zero_copy_receive):
+        self.depth = depth
+        self.maximum_bytes = maximum_bytes
+        self.zero_copy_receive = zero_copy_receive
+        self.responses = collections.deque()
+        self.buffered_bytes = 0
+        self.exhausted = False
+        self.call = None
+        self.event_handler = None
+
+    def append(self, response, size):
+        self.responses.append((response, size))
+        self.buffered_bytes += size
+
+    def pop(self):
+        response, size = self.responses.popleft()
+        self.buffered_bytes -= size
+        return response
+
+
+def _receive_ahead(state):
+    """Receives the next message if the read-ahead buffer has room for it.
+
+    Core allows a single outstanding receive on a call, so this is called
+    whenever a message arrives or a buffered response is taken. Must be
+    called with state.condition held.
+    """
+    read_ahead = state.read_ahead
+    if (state.code is None and not read_ahead.exhausted and
+            read_ahead.call is not None and
+            cygrpc.OperationType.receive_message not in state.due and
+            len(read_ahead.responses) < read_ahead.depth and
+            read_ahead.buffered_bytes < read_ahead.maximum_bytes):
+        state.due.add(cygrpc.OperationType.receive_message)
+        operating = read_ahead.call.operate((cygrpc.ReceiveMessageOperation(
+            _EMPTY_FLAGS, read_ahead.zero_copy_receive),),
+                                            read_ahead.event_handler)
+        if not operating:
+            state.due.remove(cygrpc.OperationType.receive_message)
+
+
+class _WriteQueue(object):
+    """The serialized requests of an RPC waiting for earlier ones to be sent.
+
+    Attributes:
+      maximum_bytes: The serialized size of the queued requests, including
+        the one being sent, at which consumption of the request iterator
+        pauses until earlier requests have been sent.
+      requests: A collections.deque of serialized requests.
+      buffered_bytes: The serialized size of the queued requests, including
+        the one being sent.
+      sending_bytes: The serialized size of the request being sent.
+      closed: Whether the request iterator has been exhausted.
+      close_sent: Whether the end of the request stream has been sent.
+      call: The call on which to send the requests.
+      event_handler: The tag of the send operations of the call.
+    """
+
+    def __init__(self, maximum_bytes, call, event_handler):
+        self.maximum_bytes = maximum_bytes
+        self.requests = collections.deque()
+        self.buffered_bytes = 0
+        self.sending_bytes = 0
+        self.closed = False
+        self.close_sent = False
+        self.call = call
+        self.event_handler = event_handler
+
+
+def _send_queued(state):
+    """Sends the next queued request once the previous one has been sent.
+
+    Core allows a single outstanding write on a call, so this is called
+    whenever a request is queued or a write completes. Each request with
+    further requests queued behind it is written with a buffer hint, letting
+    Core coalesce a burst of requests into as few writes as possible; the
+    last request of a burst flushes them. Must be called with
+    state.condition held.
+    """
+    write_queue = state.write_queue
+    if (cygrpc.OperationType.send_message in state.due or
+            cygrpc.OperationType.send_close_from_client in state.due):
+        return
+    write_queue.buffered_bytes -= write_queue.sending_bytes
+    write_queue.sending_bytes = 0
+    if state.code is not None:
+        return
+    if write_queue.requests:
+        serialized_request = write_queue.requests.popleft()
+        if write_queue.requests:
+            operations = (cygrpc.SendMessageOperation(
+                serialized_request, cygrpc.WriteFlag.buffer_hint),)
+        elif write_queue.closed:
+            operations = (
+                cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+                cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
+            )
+        else:
+            operations = (cygrpc.SendMessageOperation(serialized_request,
+                                                      _EMPTY_FLAGS),)
+        write_queue.sending_bytes = len(serialized_request)
+    elif write_queue.closed and not write_queue.close_sent:
+        operations = (cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),)
+    else:
+        return
+    operation_types = tuple(operation.type() for operation in operations)
+    state.due.update(operation_types)
+    if cygrpc.OperationType.send_close_from_client in operation_types:
+        write_queue.close_sent = True
+    operating = write_queue.call.operate(operations, write_queue.event_handler)
+    if not operating:
+        state.due.difference_update(operation_types)
+
+
+def _queue_request(state, serialized_request):
+    """Queues a request, then waits for room for the next one.
+
+    Must be called with state.condition held.
+
+    Returns:
+      Whether the RPC is still active.
+    """
+    write_queue = state.write_queue
+    write_queue.requests.append(serialized_request)
+    write_queue.buffered_bytes += len(serialized_request)
+    _send_queued(state)
+
+    def _room():
+        return (state.code is not None or
+                write_queue.buffered_bytes < write_queue.maximum_bytes)
+
+    _common.wait(state.condition.wait,
+                 _room,
+                 spin_cb=functools.partial(cygrpc.block_if_fork_in_progress,
+                                           state))
+    return state.code is None
+
+
+def _start_read_ahead(state, call, event_handler):
+    with state.condition:
+        state.read_ahead.call = call
+        state.read_ahead.event_handler = event_handler
+        _receive_ahead(state)
+
+
 def _abort(state, code, details):
     if state.code is None:
         state.code = code
@@ -147,8 +333,12 @@ def _handle_event(event, state, response_deserializer):
                 if response is None:
                     details = 'Exception deserializing response!'
                     _abort(state, grpc.StatusCode.INTERNAL, details)
-                else:
+                elif state.read_ahead is None:
                     state.response = response
+                else:
+                    state.read_ahead.append(response, len(serialized_response))
+            elif state.read_ahead is not None:
+                state.read_ahead.exhausted = True
         elif operation_type == cygrpc.OperationType.receive_status_on_client:
             state.trailing_metadata = batch_operation.trailing_metadata()
             if state.code is None:
@@ -172,6 +362,10 @@ def _event_handler(state, response_deserializer):
     def handle_event(event):
         with state.condition:
             callbacks = _handle_event(event, state, response_deserializer)
+            if state.read_ahead is not None:
+                _receive_ahead(state)
+            if state.write_queue is not None:
+                _send_queued(state)
             state.condition.notify_all()
             done = not state.due
         for callback in callbacks:
@@ -187,10 +381,46 @@ def _event_handler(state, response_deserializer):
     return handle_event
 
 
+class _BatchState(object):
+    """The state shared by the RPCs of a UnaryUnaryMultiCallable.batch call."""
+
+    def __init__(self):
+        # `condition` guards `outstanding` and the _RPCState of each RPC of the
+        # batch. `notify_all` is called once, when all RPCs have terminated.
+        self.condition = threading.Condition()
+        self.outstanding = 0
+
+
+def _batch_event_handler(batch_state, state, response_deserializer):
+
+    def handle_event(event):
+        with batch_state.condition:
+            callbacks = _handle_event(event, state, response_deserializer)
+            done = not state.due
+            if done:
+                batch_state.outstanding -= 1
+                if not batch_state.outstanding:
+                    batch_state.condition.notify_all()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:  # pylint: disable=broad-except
+                # NOTE(rbellevi): We suppress but log errors here so as not to
+                # kill the channel spin thread.
+                logging.error('Exception in callback %s: %s',
+                              repr(callback.func), repr(e))
+        return done and state.fork_epoch >= cygrpc.get_fork_epoch()
+
+    return handle_event
+
+
 #pylint: disable=too-many-statements
 def _consume_request_iterator(request_iterator, state, call, request_serializer,
-                              event_handler):
+                              event_handler, coalesced_write_bytes):
     """Consume a request iterator supplied by the user."""
+    if coalesced_write_bytes:
+        state.write_queue = _WriteQueue(coalesced_write_bytes, call,
+                                        event_handler)
 
     def consume_request_iterator():  # pylint: disable=too-many-branches
         # Iterate over the request iterator until it is exhausted or an error
@@ -227,6 +457,9 @@ def _consume_request_iterator(request_iterator, state, call, request_serializer,
                             details)
                         _abort(state, code, details)
                         return
+                    elif state.write_queue is not None:
+                        if not _queue_request(state, serialized_request):
+                            return
                     else:
                         state.due.add(cygrpc.OperationType.send_message)
                         operations = (cygrpc.SendMessageOperation(
@@ -251,7 +484,10 @@ def _consume_request_iterator(request_iterator, state, call, request_serializer,
                 else:
                     return
         with state.condition:
-            if state.code is None:
+            if state.write_queue is not None:
+                state.write_queue.closed = True
+                _send_queued(state)
+            elif state.code is None:
                 state.due.add(cygrpc.OperationType.send_close_from_client)
                 operations = (
                     cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),)
@@ -368,16 +604,21 @@ class _Rendezvous(grpc.RpcError, grpc.RpcContext):
         and next_event methods.
       _response_deserializer: A callable taking bytes and return a Python
         object.
-      _deadline: A float representing the deadline of the RPC in seconds. Or
-        possibly None, to represent an RPC with no deadline at all.
+      _deadline: A float representing the deadline of the RPC in seconds on
+        the clock of cygrpc.monotonic_time. Or possibly None, to represent an
+        RPC with no deadline at all.
+      _zero_copy_receive: Whether responses are received as memoryviews over
+        Core's buffers rather than as bytes.
     """
 
-    def __init__(self, state, call, response_deserializer, deadline):
+    def __init__(self, state, call, response_deserializer, deadline,
+                 zero_copy_receive):
         super(_Rendezvous, self).__init__()
         self._state = state
         self._call = call
         self._response_deserializer = response_deserializer
         self._deadline = deadline
+        self._zero_copy_receive = zero_copy_receive
 
     def is_active(self):
         """See grpc.RpcContext.is_active"""
@@ -390,7 +631,7 @@ class _Rendezvous(grpc.RpcError, grpc.RpcContext):
             if self._deadline is None:
                 return None
             else:
-                return max(self._deadline - time.time(), 0)
+                return max(self._deadline - cygrpc.monotonic_time(), 0)
 
     def cancel(self):
         """See grpc.RpcContext.cancel"""
@@ -596,6 +837,8 @@ class _SingleThreadedRendezvous(_Rendezvous, grpc.Call, grpc.Future):  # pylint:
         with self._state.condition:
             callbacks = _handle_event(event, self._state,
                                       self._response_deserializer)
+            if self._state.read_ahead is not None:
+                _receive_ahead(self._state)
             for callback in callbacks:
                 # NOTE(gnossen): We intentionally allow exceptions to bubble up
                 # to the user when running on a single thread.
@@ -616,7 +859,25 @@ class _SingleThreadedRendezvous(_Rendezvous, grpc.Call, grpc.Future):  # pylint:
                     elif self._state.code is not None:
                         raise self
 
+    def _next_read_ahead(self):
+        read_ahead = self._state.read_ahead
+        while True:
+            with self._state.condition:
+                if read_ahead.responses and not self._state.cancelled:
+                    response = read_ahead.pop()
+                    _receive_ahead(self._state)
+                    return response
+                elif (cygrpc.OperationType.receive_message
+                      not in self._state.due and self._state.code is not None):
+                    if self._state.code is grpc.StatusCode.OK:
+                        raise StopIteration()
+                    else:
+                        raise self
+            self._consume_next_event()
+
     def _next(self):
+        if self._state.read_ahead is not None:
+            return self._next_read_ahead()
         with self._state.condition:
             if self._state.code is None:
                 # We tentatively add the operation as expected and remove
@@ -631,8 +892,8 @@ class _SingleThreadedRendezvous(_Rendezvous, grpc.Call, grpc.Future):  # pylint:
                 # Note that, since `condition` is held through this block, there is
                 # no data race on `due`.
                 self._state.due.add(cygrpc.OperationType.receive_message)
-                operating = self._call.operate(
-                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),), None)
+                operating = self._call.operate((cygrpc.ReceiveMessageOperation(
+                    _EMPTY_FLAGS, self._zero_copy_receive),), None)
                 if not operating:
                     self._state.due.remove(cygrpc.OperationType.receive_message)
             elif self._state.code is grpc.StatusCode.OK:
@@ -792,15 +1053,36 @@ class _MultiThreadedRendezvous(_Rendezvous, grpc.Call, grpc.Future):  # pylint:
 
         fn(self)
 
+    def _next_read_ahead(self):
+        read_ahead = self._state.read_ahead
+        with self._state.condition:
+
+            def _response_ready():
+                return ((read_ahead.responses and not self._state.cancelled) or
+                        (cygrpc.OperationType.receive_message
+                         not in self._state.due and
+                         self._state.code is not None))
+
+            _common.wait(self._state.condition.wait, _response_ready)
+            if read_ahead.responses and not self._state.cancelled:
+                response = read_ahead.pop()
+                _receive_ahead(self._state)
+                return response
+            elif self._state.code is grpc.StatusCode.OK:
+                raise StopIteration()
+            else:
+                raise self
+
     def _next(self):
+        if self._state.read_ahead is not None:
+            return self._next_read_ahead()
         with self._state.condition:
             if self._state.code is None:
                 event_handler = _event_handler(self._state,
                                                self._response_deserializer)
                 self._state.due.add(cygrpc.OperationType.receive_message)
-                operating = self._call.operate(
-                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
-                    event_handler)
+                operating = self._call.operate((cygrpc.ReceiveMessageOperation(
+                    _EMPTY_FLAGS, self._zero_copy_receive),), event_handler)
                 if not operating:
                     self._state.due.remove(cygrpc.OperationType.receive_message)
             elif self._state.code is grpc.StatusCode.OK:
@@ -841,7 +1123,8 @@ def _start_unary_request(request, timeout, request_serializer):
 def _end_unary_response_blocking(state, call, with_call, deadline):
     if state.code is grpc.StatusCode.OK:
         if with_call:
-            rendezvous = _MultiThreadedRendezvous(state, call, None, deadline)
+            rendezvous = _MultiThreadedRendezvous(state, call, None, deadline,
+                                                  False)
             return state.response, rendezvous
         else:
             return state.response
@@ -849,12 +1132,13 @@ def _end_unary_response_blocking(state, call, with_call, deadline):
         raise _InactiveRpcError(state)
 
 
-def _stream_unary_invocation_operationses(metadata, initial_metadata_flags):
+def _stream_unary_invocation_operationses(metadata, initial_metadata_flags,
+                                          zero_copy_receive):
     return (
         (
             cygrpc.SendInitialMetadataOperation(metadata,
                                                 initial_metadata_flags),
-            cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
+            cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS, zero_copy_receive),
             cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
         ),
         (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
@@ -862,16 +1146,78 @@ def _stream_unary_invocation_operationses(metadata, initial_metadata_flags):
 
 
 def _stream_unary_invocation_operationses_and_tags(metadata,
-                                                   initial_metadata_flags):
+                                                   initial_metadata_flags,
+                                                   zero_copy_receive):
     return tuple((
         operations,
         None,
     ) for operations in _stream_unary_invocation_operationses(
-        metadata, initial_metadata_flags))
+        metadata, initial_metadata_flags, zero_copy_receive))
+
+
+class _UnaryUnaryCallTemplate(object):
+    """The parts of the unary-unary RPCs of a multicallable common to all.
+
+    Receive operations hold the results of their batch, so they may not be
+    shared by concurrent RPCs. Instead, the blocking RPCs of a multicallable
+    take them from a bounded pool and return them once their batch has
+    completed and its results have been read.
+    """
+
+    def __init__(self, zero_copy_receive):
+        self._zero_copy_receive = zero_copy_receive
+        self._initial_metadata_flags = {
+            wait_for_ready:
+            _InitialMetadataFlags().with_wait_for_ready(wait_for_ready)
+            for wait_for_ready in (None, True, False)
+        }
+        self._receive_operationses = collections.deque(
+            maxlen=_MAXIMUM_POOLED_RECEIVE_OPERATIONS)
+
+    def initial_metadata_flags(self, wait_for_ready):
+        initial_metadata_flags = self._initial_metadata_flags.get(
+            wait_for_ready)
+        if initial_metadata_flags is None:
+            return _InitialMetadataFlags().with_wait_for_ready(wait_for_ready)
+        else:
+            return initial_metadata_flags
+
+    def receive_operations(self):
+        return (
+            cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
+            cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS,
+                                           self._zero_copy_receive),
+            cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
+        )
+
+    def acquire_receive_operations(self):
+        try:
+            return self._receive_operationses.pop()
+        except IndexError:
+            return self.receive_operations()
+
+    def release_receive_operations(self, receive_operations):
+        """Returns receive operations whose batch has completed to the pool.
+
+        Operations holding a large response are dropped rather than keeping
+        the response alive.
+        """
+        message = receive_operations[1].message()
+        if message is None or len(message) <= _MAXIMUM_POOLED_RESPONSE_BYTES:
+            self._receive_operationses.append(receive_operations)
+
+    def operations(self, serialized_request, metadata, initial_metadata_flags,
+                   receive_operations):
+        return (
+            cygrpc.SendInitialMetadataOperation(metadata,
+                                                initial_metadata_flags),
+            cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+            _SEND_CLOSE_FROM_CLIENT_OPERATION,
+        ) + receive_operations
 
 
 def _determine_deadline(user_deadline):
-    parent_deadline = cygrpc.get_deadline_from_context()
+    parent_deadline = _deadline_propagation.parent_deadline()
     if parent_deadline is None and user_deadline is None:
         return None
     elif parent_deadline is not None and user_deadline is None:
@@ -886,41 +1232,40 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
 
     # pylint: disable=too-many-arguments
     def __init__(self, channel, managed_call, method, request_serializer,
-                 response_deserializer):
+                 response_deserializer, zero_copy_receive):
         self._channel = channel
         self._managed_call = managed_call
         self._method = method
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        self._zero_copy_receive = zero_copy_receive
+        self._template = _UnaryUnaryCallTemplate(zero_copy_receive)
         self._context = cygrpc.build_census_context()
 
-    def _prepare(self, request, timeout, metadata, wait_for_ready, compression):
+    def _prepare(self, request, timeout, metadata, wait_for_ready, compression,
+                 receive_operations):
         deadline, serialized_request, rendezvous = _start_unary_request(
             request, timeout, self._request_serializer)
-        initial_metadata_flags = _InitialMetadataFlags().with_wait_for_ready(
-            wait_for_ready)
-        augmented_metadata = _compression.augment_metadata(
-            metadata, compression)
         if serialized_request is None:
             return None, None, None, rendezvous
         else:
+            augmented_metadata = _compression.augment_metadata(
+                metadata, compression)
             state = _RPCState(_UNARY_UNARY_INITIAL_DUE, None, None, None, None)
-            operations = (
-                cygrpc.SendInitialMetadataOperation(augmented_metadata,
-                                                    initial_metadata_flags),
-                cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
-                cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
-                cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
-                cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
-                cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
-            )
+            operations = self._template.operations(
+                serialized_request, augmented_metadata,
+                self._template.initial_metadata_flags(wait_for_ready),
+                receive_operations)
             return state, operations, deadline, None
 
     def _blocking(self, request, timeout, metadata, credentials, wait_for_ready,
                   compression):
+        receive_operations = self._template.acquire_receive_operations()
         state, operations, deadline, rendezvous = self._prepare(
-            request, timeout, metadata, wait_for_ready, compression)
+            request, timeout, metadata, wait_for_ready, compression,
+            receive_operations)
         if state is None:
+            self._template.release_receive_operations(receive_operations)
             raise rendezvous  # pylint: disable-msg=raising-bad-type
         else:
             call = self._channel.segregated_call(
@@ -932,6 +1277,7 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
                 ),), self._context)
             event = call.next_event()
             _handle_event(event, state, self._response_deserializer)
+            self._template.release_receive_operations(receive_operations)
             return state, call
 
     def __call__(self,
@@ -964,30 +1310,110 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
                wait_for_ready=None,
                compression=None):
         state, operations, deadline, rendezvous = self._prepare(
-            request, timeout, metadata, wait_for_ready, compression)
+            request, timeout, metadata, wait_for_ready, compression,
+            self._template.receive_operations())
         if state is None:
             raise rendezvous  # pylint: disable-msg=raising-bad-type
         else:
             event_handler = _event_handler(state, self._response_deserializer)
             call = self._managed_call(
                 cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
-                self._method, None, deadline, metadata,
+                self._method, None, _determine_deadline(deadline), metadata,
                 None if credentials is None else credentials._credentials,
                 (operations,), event_handler, self._context)
             return _MultiThreadedRendezvous(state, call,
                                             self._response_deserializer,
-                                            deadline)
+                                            deadline, self._zero_copy_receive)
+
+    def batch(self,
+              requests,
+              timeout=None,
+              metadata=None,
+              credentials=None,
+              wait_for_ready=None,
+              compression=None):
+        deadline = _deadline(timeout)
+        call_deadline = _determine_deadline(deadline)
+        initial_metadata_flags = self._template.initial_metadata_flags(
+            wait_for_ready)
+        augmented_metadata = _compression.augment_metadata(
+            metadata, compression)
+        call_credentials = None if credentials is None else credentials._credentials
+        batch_state = _BatchState()
+        states = []
+        operationses = []
+        for request in requests:
+            serialized_request = _common.serialize(request,
+                                                   self._request_serializer)
+            if serialized_request is None:
+                state = _RPCState((), (), (), grpc.StatusCode.INTERNAL,
+                                  'Exception serializing request!')
+                operations = None
+            else:
+                state = _RPCState(_UNARY_UNARY_INITIAL_DUE, None, None, None,
+                                  None)
+                operations = self._template.operations(
+                    serialized_request, augmented_metadata,
+                    initial_metadata_flags, self._template.receive_operations())
+                batch_state.outstanding += 1
+            # All RPCs of the batch share one condition so that terminating
+            # them costs a single wakeup of the invoking thread.
+            state.condition = batch_state.condition
+            states.append(state)
+            operationses.append(operations)
+
+        calls = []
+        try:
+            for state, operations in zip(states, operationses):
+                if operations is None:
+                    calls.append(None)
+                else:
+                    calls.append(
+                        self._managed_call(
+                            cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
+                            self._method, None, call_deadline, metadata,
+                            call_credentials, (operations,),
+                            _batch_event_handler(batch_state, state,
+                                                 self._response_deserializer),
+                            self._context))
+        except:
+            code = grpc.StatusCode.CANCELLED
+            details = 'Batch aborted before all of its RPCs were started!'
+            for call in calls:
+                if call is not None:
+                    call.cancel(_common.STATUS_CODE_TO_CYGRPC_STATUS_CODE[code],
+                                details)
+            raise
+
+        with batch_state.condition:
+            _common.wait(batch_state.condition.wait,
+                         lambda: not batch_state.outstanding)
+
+        results = []
+        for state, call in zip(states, calls):
+            if state.code is grpc.StatusCode.OK:
+                results.append(
+                    (state.response,
+                     _MultiThreadedRendezvous(state, call, None, deadline,
+                                              False)))
+            else:
+                results.append((None, _InactiveRpcError(state)))
+        return tuple(results)
 
 
 class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
 
     # pylint: disable=too-many-arguments
     def __init__(self, channel, method, request_serializer,
-                 response_deserializer):
+                 response_deserializer, zero_copy_receive, read_ahead_messages,
+                 read_ahead_bytes):
         self._channel = channel
         self._method = method
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        self._zero_copy_receive = zero_copy_receive
+        self._read_ahead_messages = read_ahead_messages
+        self._read_ahead_bytes = read_ahead_bytes
         self._context = cygrpc.build_census_context()
 
     def __call__(  # pylint: disable=too-many-locals
@@ -1025,20 +1451,30 @@ class _SingleThreadedUnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
             cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS, self._method,
             None, _determine_deadline(deadline), metadata, call_credentials,
             operations_and_tags, self._context)
+        if self._read_ahead_messages:
+            state.read_ahead = _ReadAhead(self._read_ahead_messages,
+                                          self._read_ahead_bytes,
+                                          self._zero_copy_receive)
+            _start_read_ahead(state, call, None)
         return _SingleThreadedRendezvous(state, call,
-                                         self._response_deserializer, deadline)
+                                         self._response_deserializer, deadline,
+                                         self._zero_copy_receive)
 
 
 class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
 
     # pylint: disable=too-many-arguments
     def __init__(self, channel, managed_call, method, request_serializer,
-                 response_deserializer):
+                 response_deserializer, zero_copy_receive, read_ahead_messages,
+                 read_ahead_bytes):
         self._channel = channel
         self._managed_call = managed_call
         self._method = method
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        self._zero_copy_receive = zero_copy_receive
+        self._read_ahead_messages = read_ahead_messages
+        self._read_ahead_bytes = read_ahead_bytes
         self._context = cygrpc.build_census_context()
 
     def __call__(  # pylint: disable=too-many-locals
@@ -1070,28 +1506,36 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
                 ),
                 (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
             )
+            if self._read_ahead_messages:
+                state.read_ahead = _ReadAhead(self._read_ahead_messages,
+                                              self._read_ahead_bytes,
+                                              self._zero_copy_receive)
+            event_handler = _event_handler(state, self._response_deserializer)
             call = self._managed_call(
                 cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS,
                 self._method, None, _determine_deadline(deadline), metadata,
                 None if credentials is None else credentials._credentials,
-                operationses, _event_handler(state,
-                                             self._response_deserializer),
-                self._context)
+                operationses, event_handler, self._context)
+            if state.read_ahead is not None:
+                _start_read_ahead(state, call, event_handler)
             return _MultiThreadedRendezvous(state, call,
                                             self._response_deserializer,
-                                            deadline)
+                                            deadline, self._zero_copy_receive)
 
 
 class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
 
     # pylint: disable=too-many-arguments
     def __init__(self, channel, managed_call, method, request_serializer,
-                 response_deserializer):
+                 response_deserializer, zero_copy_receive,
+                 coalesced_write_bytes):
         self._channel = channel
         self._managed_call = managed_call
         self._method = method
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        self._zero_copy_receive = zero_copy_receive
+        self._coalesced_write_bytes = coalesced_write_bytes
         self._context = cygrpc.build_census_context()
 
     def _blocking(self, request_iterator, timeout, metadata, credentials,
@@ -1107,13 +1551,17 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             None, _determine_deadline(deadline), augmented_metadata,
             None if credentials is None else credentials._credentials,
             _stream_unary_invocation_operationses_and_tags(
-                augmented_metadata, initial_metadata_flags), self._context)
+                augmented_metadata, initial_metadata_flags,
+                self._zero_copy_receive), self._context)
         _consume_request_iterator(request_iterator, state, call,
-                                  self._request_serializer, None)
+                                  self._request_serializer, None,
+                                  self._coalesced_write_bytes)
         while True:
             event = call.next_event()
             with state.condition:
                 _handle_event(event, state, self._response_deserializer)
+                if state.write_queue is not None:
+                    _send_queued(state)
                 state.condition.notify_all()
                 if not state.due:
                     break
@@ -1157,27 +1605,35 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             metadata, compression)
         call = self._managed_call(
             cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS, self._method,
-            None, deadline, augmented_metadata,
+            None, _determine_deadline(deadline), augmented_metadata,
             None if credentials is None else credentials._credentials,
             _stream_unary_invocation_operationses(metadata,
-                                                  initial_metadata_flags),
+                                                  initial_metadata_flags,
+                                                  self._zero_copy_receive),
             event_handler, self._context)
         _consume_request_iterator(request_iterator, state, call,
-                                  self._request_serializer, event_handler)
+                                  self._request_serializer, event_handler,
+                                  self._coalesced_write_bytes)
         return _MultiThreadedRendezvous(state, call,
-                                        self._response_deserializer, deadline)
+                                        self._response_deserializer, deadline,
+                                        self._zero_copy_receive)
 
 
 class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
 
     # pylint: disable=too-many-arguments
     def __init__(self, channel, managed_call, method, request_serializer,
-                 response_deserializer):
+                 response_deserializer, zero_copy_receive, read_ahead_messages,
+                 read_ahead_bytes, coalesced_write_bytes):
         self._channel = channel
         self._managed_call = managed_call
         self._method = method
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        self._zero_copy_receive = zero_copy_receive
+        self._read_ahead_messages = read_ahead_messages
+        self._read_ahead_bytes = read_ahead_bytes
+        self._coalesced_write_bytes = coalesced_write_bytes
         self._context = cygrpc.build_census_context()
 
     def __call__(self,
@@ -1201,16 +1657,24 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
             ),
             (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
         )
+        if self._read_ahead_messages:
+            state.read_ahead = _ReadAhead(self._read_ahead_messages,
+                                          self._read_ahead_bytes,
+                                          self._zero_copy_receive)
         event_handler = _event_handler(state, self._response_deserializer)
         call = self._managed_call(
             cygrpc.PropagationConstants.GRPC_PROPAGATE_DEFAULTS, self._method,
             None, _determine_deadline(deadline), augmented_metadata,
             None if credentials is None else credentials._credentials,
             operationses, event_handler, self._context)
+        if state.read_ahead is not None:
+            _start_read_ahead(state, call, event_handler)
         _consume_request_iterator(request_iterator, state, call,
-                                  self._request_serializer, event_handler)
+                                  self._request_serializer, event_handler,
+                                  self._coalesced_write_bytes)
         return _MultiThreadedRendezvous(state, call,
-                                        self._response_deserializer, deadline)
+                                        self._response_deserializer, deadline,
+                                        self._zero_copy_receive)
 
 
 class _InitialMetadataFlags(int):
@@ -1236,11 +1700,13 @@ class _ChannelCallState(object):
     def __init__(self, channel):
         self.lock = threading.Lock()
         self.channel = channel
-        self.managed_calls = 0
+        # The number of managed calls on each of the channel's call completion
+        # queues. A queue is polled by a spin thread while its count is nonzero.
+        self.managed_calls = [0] * channel.call_completion_queue_count()
         self.threading = False
 
     def reset_postfork_child(self):
-        self.managed_calls = 0
+        self.managed_calls = [0] * len(self.managed_calls)
 
     def __del__(self):
         try:
@@ -1250,19 +1716,19 @@ class _ChannelCallState(object):
             pass
 
 
-def _run_channel_spin_thread(state):
+def _run_channel_spin_thread(state, completion_queue_index):
 
     def channel_spin():
         while True:
             cygrpc.block_if_fork_in_progress(state)
-            event = state.channel.next_call_event()
+            event = state.channel.next_call_event(completion_queue_index)
             if event.completion_type == cygrpc.CompletionType.queue_timeout:
                 continue
             call_completed = event.tag(event)
             if call_completed:
                 with state.lock:
-                    state.managed_calls -= 1
-                    if state.managed_calls == 0:
+                    state.managed_calls[completion_queue_index] -= 1
+                    if state.managed_calls[completion_queue_index] == 0:
                         return
 
     channel_spin_thread = cygrpc.ForkManagedThread(target=channel_spin)
@@ -1281,8 +1747,9 @@ def _channel_managed_call_management(state):
           flags: An integer bitfield of call flags.
           method: The RPC method.
           host: A host string for the created call.
-          deadline: A float to be the deadline of the created call or None if
-            the call is to have an infinite deadline.
+          deadline: A float to be the deadline of the created call on the
+            clock of cygrpc.monotonic_time or None if the call is to have an
+            infinite deadline.
           metadata: The metadata for the call or None.
           credentials: A cygrpc.CallCredentials or None.
           operationses: An iterable of iterables of cygrpc.Operations to be
@@ -1298,14 +1765,21 @@ def _channel_managed_call_management(state):
             event_handler,
         ) for operations in operationses)
         with state.lock:
+            if len(state.managed_calls) == 1:
+                completion_queue_index = 0
+            else:
+                completion_queue_index = min(
+                    range(len(state.managed_calls)),
+                    key=state.managed_calls.__getitem__)
             call = state.channel.integrated_call(flags, method, host, deadline,
                                                  metadata, credentials,
-                                                 operationses_and_tags, context)
-            if state.managed_calls == 0:
-                state.managed_calls = 1
-                _run_channel_spin_thread(state)
+                                                 operationses_and_tags, context,
+                                                 completion_queue_index)
+            if state.managed_calls[completion_queue_index] == 0:
+                state.managed_calls[completion_queue_index] = 1
+                _run_channel_spin_thread(state, completion_queue_index)
             else:
-                state.managed_calls += 1
+                state.managed_calls[completion_queue_index] += 1
             return call
 
     return create
@@ -1447,18 +1921,6 @@ def _augment_options(base_options, compression):
     ),)
 
 
-def _separate_channel_options(options):
-    """Separates core channel options from Python channel options."""
-    core_options = []
-    python_options = []
-    for pair in options:
-        if pair[0] == grpc.experimental.ChannelOptions.SingleThreadedUnaryStream:
-            python_options.append(pair)
-        else:
-            core_options.append(pair)
-    return python_options, core_options
-
-
 class Channel(grpc.Channel):
     """A cygrpc.Channel-backed implementation of grpc.Channel."""
 
@@ -1472,22 +1934,36 @@ class Channel(grpc.Channel):
           compression: An optional value indicating the compression method to be
             used over the lifetime of the channel.
         """
-        python_options, core_options = _separate_channel_options(options)
-        self._single_threaded_unary_stream = _DEFAULT_SINGLE_THREADED_UNARY_STREAM
-        self._process_python_options(python_options)
+        python_options, core_options = _common.separate_options(
+            options, _PYTHON_CHANNEL_OPTIONS)
+        self._single_threaded_unary_stream = (
+            _DEFAULT_SINGLE_THREADED_UNARY_STREAM or
+            grpc.experimental.ChannelOptions.SingleThreadedUnaryStream
+            in python_options)
+        self._zero_copy_receive = bool(
+            python_options.get(grpc.experimental.ChannelOptions.ZeroCopyReceive,
+                               False))
+        self._completion_queue_pollers = _common.integer_option(
+            python_options,
+            grpc.experimental.ChannelOptions.CompletionQueuePollers,
+            _DEFAULT_COMPLETION_QUEUE_POLLERS, 1)
+        self._read_ahead_messages = _common.integer_option(
+            python_options, grpc.experimental.ChannelOptions.ReadAheadMessages,
+            _DEFAULT_READ_AHEAD_MESSAGES, 0)
+        self._read_ahead_bytes = _common.integer_option(
+            python_options, grpc.experimental.ChannelOptions.ReadAheadBytes,
+            _DEFAULT_READ_AHEAD_BYTES, 1)
+        self._coalesced_write_bytes = _common.integer_option(
+            python_options,
+            grpc.experimental.ChannelOptions.CoalescedWriteBytes,
+            _DEFAULT_COALESCED_WRITE_BYTES, 0)
         self._channel = cygrpc.Channel(
             _common.encode(target), _augment_options(core_options, compression),
-            credentials)
+            credentials, self._completion_queue_pollers)
         self._call_state = _ChannelCallState(self._channel)
         self._connectivity_state = _ChannelConnectivityState(self._channel)
         cygrpc.fork_register_channel(self)
 
-    def _process_python_options(self, python_options):
-        """Sets channel attributes according to python-only channel options."""
-        for pair in python_options:
-            if pair[0] == grpc.experimental.ChannelOptions.SingleThreadedUnaryStream:
-                self._single_threaded_unary_stream = True
-
     def subscribe(self, callback, try_to_connect=None):
         _subscribe(self._connectivity_state, callback, try_to_connect)
 
@@ -1500,7 +1976,8 @@ class Channel(grpc.Channel):
                     response_deserializer=None):
         return _UnaryUnaryMultiCallable(
             self._channel, _channel_managed_call_management(self._call_state),
-            _common.encode(method), request_serializer, response_deserializer)
+            _common.encode(method), request_serializer, response_deserializer,
+            self._zero_copy_receive)
 
     def unary_stream(self,
                      method,
@@ -1513,13 +1990,15 @@ class Channel(grpc.Channel):
         if self._single_threaded_unary_stream:
             return _SingleThreadedUnaryStreamMultiCallable(
                 self._channel, _common.encode(method), request_serializer,
-                response_deserializer)
+                response_deserializer, self._zero_copy_receive,
+                self._read_ahead_messages, self._read_ahead_bytes)
         else:
             return _UnaryStreamMultiCallable(
                 self._channel,
                 _channel_managed_call_management(self._call_state),
                 _common.encode(method), request_serializer,
-                response_deserializer)
+                response_deserializer, self._zero_copy_receive,
+                self._read_ahead_messages, self._read_ahead_bytes)
 
     def stream_unary(self,
                      method,
@@ -1527,7 +2006,8 @@ class Channel(grpc.Channel):
                      response_deserializer=None):
         return _StreamUnaryMultiCallable(
             self._channel, _channel_managed_call_management(self._call_state),
-            _common.encode(method), request_serializer, response_deserializer)
+            _common.encode(method), request_serializer, response_deserializer,
+            self._zero_copy_receive, self._coalesced_write_bytes)
 
     def stream_stream(self,
                       method,
@@ -1535,7 +2015,9 @@ class Channel(grpc.Channel):
                       response_deserializer=None):
         return _StreamStreamMultiCallable(
             self._channel, _channel_managed_call_management(self._call_state),
-            _common.encode(method), request_serializer, response_deserializer)
+            _common.encode(method), request_serializer, response_deserializer,
+            self._zero_copy_receive, self._read_ahead_messages,
+            self._read_ahead_bytes, self._coalesced_write_bytes)
 
     def _unsubscribe_all(self):
         state = self._connectivity_state
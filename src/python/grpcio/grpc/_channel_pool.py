@@ -0,0 +1,373 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A Channel spreading RPCs across several channels to one target."""
+
+import operator
+import threading
+
+import grpc
+
+# Channels with identical arguments share their connections through the global
+# subchannel pool, which would leave a channel pool with a single connection.
+_LOCAL_SUBCHANNEL_POOL_OPTION = ('grpc.use_local_subchannel_pool', 1)
+
+
+def _pool_options(size, options):
+    if size < 1:
+        raise ValueError(
+            'A channel pool needs at least one channel, got {}'.format(size))
+    return (() if options is None else
+            tuple(options)) + (_LOCAL_SUBCHANNEL_POOL_OPTION,)
+
+
+class _Load(object):
+    """Counts the RPCs in flight on each channel of a pool."""
+
+    def __init__(self, size):
+        self._lock = threading.Lock()
+        self._in_flight = [0] * size
+        self._next = 0
+
+    def acquire(self):
+        """Counts an RPC on the least loaded channel and returns its index.
+
+        Ties are broken in rotation so that an idle pool still spreads its
+        RPCs across all of its connections.
+        """
+        with self._lock:
+            size = len(self._in_flight)
+            start = self._next
+            self._next = (start + 1) % size
+            index = start
+            for offset in range(1, size):
+                candidate = (start + offset) % size
+                if self._in_flight[candidate] < self._in_flight[index]:
+                    index = candidate
+            self._in_flight[index] += 1
+            return index
+
+    def release(self, index):
+        with self._lock:
+            self._in_flight[index] -= 1
+
+    def in_flight(self):
+        with self._lock:
+            return tuple(self._in_flight)
+
+
+def _invoke_blocking(load, multi_callables, invocation):
+    index = load.acquire()
+    try:
+        return invocation(multi_callables[index])
+    finally:
+        load.release(index)
+
+
+def _invoke_non_blocking(load, multi_callables, invocation):
+    index = load.acquire()
+    try:
+        call = invocation(multi_callables[index])
+    except:
+        load.release(index)
+        raise
+    call.add_done_callback(lambda unused_call: load.release(index))
+    return call
+
+
+class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+
+    def __init__(self, load, multi_callables):
+        self._load = load
+        self._multi_callables = multi_callables
+
+    def __call__(self,
+                 request,
+                 timeout=None,
+                 metadata=None,
+                 credentials=None,
+                 wait_for_ready=None,
+                 compression=None):
+        return _invoke_blocking(
+            self._load, self._multi_callables,
+            operator.methodcaller('__call__',
+                                  request,
+                                  timeout=timeout,
+                                  metadata=metadata,
+                                  credentials=credentials,
+                                  wait_for_ready=wait_for_ready,
+                                  compression=compression))
+
+    def with_call(self,
+                  request,
+                  timeout=None,
+                  metadata=None,
+                  credentials=None,
+                  wait_for_ready=None,
+                  compression=None):
+        return _invoke_blocking(
+            self._load, self._multi_callables,
+            operator.methodcaller('with_call',
+                                  request,
+                                  timeout=timeout,
+                                  metadata=metadata,
+                                  credentials=credentials,
+                                  wait_for_ready=wait_for_ready,
+                                  compression=compression))
+
+    def future(self,
+               request,
+               timeout=None,
+               metadata=None,
+               credentials=None,
+               wait_for_ready=None,
+               compression=None):
+        return _invoke_non_blocking(
+            self._load, self._multi_callables,
+            operator.methodcaller('future',
+                                  request,
+                                  timeout=timeout,
+                                  metadata=metadata,
+                                  credentials=credentials,
+                                  wait_for_ready=wait_for_ready,
+                                  compression=compression))
+
+    def batch(self,
+              requests,
+              timeout=None,
+              metadata=None,
+              credentials=None,
+              wait_for_ready=None,
+              compression=None):
+        # The default implementation starts each RPC with future, so every
+        # request is made on the least loaded channel and counts toward its
+        # load.
+        return super(_UnaryUnaryMultiCallable,
+                     self).batch(requests,
+                                 timeout=timeout,
+                                 metadata=metadata,
+                                 credentials=credentials,
+                                 wait_for_ready=wait_for_ready,
+                                 compression=compression)
+
+
+class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
+
+    def __init__(self, load, multi_callables):
+        self._load = load
+        self._multi_callables = multi_callables
+
+    def __call__(self,
+                 request,
+                 timeout=None,
+                 metadata=None,
+                 credentials=None,
+                 wait_for_ready=None,
+                 compression=None):
+        return _invoke_non_blocking(
+            self._load, self._multi_callables,
+            operator.methodcaller('__call__',
+                                  request,
+                                  timeout=timeout,
+                                  metadata=metadata,
+                                  credentials=credentials,
+                                  wait_for_ready=wait_for_ready,
+                                  compression=compression))
+
+
+class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
+
+    def __init__(self, load, multi_callables):
+        self._load = load
+        self._multi_callables = multi_callables
+
+    def __call__(self,
+                 request_iterator,
+                 timeout=None,
+                 metadata=None,
+                 credentials=None,
+                 wait_for_ready=None,
+                 compression=None):
+        return _invoke_blocking(
+            self._load, self._multi_callables,
+            operator.methodcaller('__call__',
+                                  request_iterator,
+                                  timeout=timeout,
+                                  metadata=metadata,
+                                  credentials=credentials,
+                                  wait_for_ready=wait_for_ready,
+                                  compression=compression))
+
+    def with_call(self,
+                  request_iterator,
+                  timeout=None,
+                  metadata=None,
+                  credentials=None,
+                  wait_for_ready=None,
+                  compression=None):
+        return _invoke_blocking(
+            self._load, self._multi_callables,
+            operator.methodcaller('with_call',
+                                  request_iterator,
+                                  timeout=timeout,
+                                  metadata=metadata,
+                                  credentials=credentials,
+                                  wait_for_ready=wait_for_ready,
+                                  compression=compression))
+
+    def future(self,
+               request_iterator,
+               timeout=None,
+               metadata=None,
+               credentials=None,
+               wait_for_ready=None,
+               compression=None):
+        return _invoke_non_blocking(
+            self._load, self._multi_callables,
+            operator.methodcaller('future',
+                                  request_iterator,
+                                  timeout=timeout,
+                                  metadata=metadata,
+                                  credentials=credentials,
+                                  wait_for_ready=wait_for_ready,
+                                  compression=compression))
+
+
+class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
+
+    def __init__(self, load, multi_callables):
+        self._load = load
+        self._multi_callables = multi_callables
+
+    def __call__(self,
+                 request_iterator,
+                 timeout=None,
+                 metadata=None,
+                 credentials=None,
+                 wait_for_ready=None,
+                 compression=None):
+        return _invoke_non_blocking(
+            self._load, self._multi_callables,
+            operator.methodcaller('__call__',
+                                  request_iterator,
+                                  timeout=timeout,
+                                  metadata=metadata,
+                                  credentials=credentials,
+                                  wait_for_ready=wait_for_ready,
+                                  compression=compression))
+
+
+class ChannelPool(grpc.Channel):
+    """A Channel spreading RPCs across several channels to one target.
+
+    This is an EXPERIMENTAL API.
+
+    Each of the channels keeps its own connections, so the pool sidesteps the
+    limit on concurrent streams per connection. Every RPC is made on the
+    channel with the fewest RPCs in flight.
+
+    Args:
+      target: The server address.
+      size: The number of channels in the pool, as a positive integer.
+      credentials: An optional ChannelCredentials instance. The channels are
+        insecure if None.
+      options: An optional list of key-value pairs (:term:`channel_arguments`
+        in gRPC Core runtime) to configure each channel.
+      compression: An optional value indicating the compression method to be
+        used over the lifetime of each channel.
+    """
+
+    def __init__(self,
+                 target,
+                 size,
+                 credentials=None,
+                 options=None,
+                 compression=None):
+        options = _pool_options(size, options)
+        if credentials is None:
+            self._channels = tuple(
+                grpc.insecure_channel(target, options, compression)
+                for _ in range(size))
+        else:
+            self._channels = tuple(
+                grpc.secure_channel(target, credentials, options, compression)
+                for _ in range(size))
+        self._load = _Load(size)
+
+    def subscribe(self, callback, try_to_connect=False):
+        """Subscribes to the connectivity of each channel of the pool.
+
+        The callback is called with the connectivity of every channel, each of
+        which may be in a different state.
+        """
+        for channel in self._channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self._channels:
+            channel.unsubscribe(callback)
+
+    def unary_unary(self,
+                    method,
+                    request_serializer=None,
+                    response_deserializer=None):
+        return _UnaryUnaryMultiCallable(
+            self._load,
+            tuple(
+                channel.unary_unary(method, request_serializer,
+                                    response_deserializer)
+                for channel in self._channels))
+
+    def unary_stream(self,
+                     method,
+                     request_serializer=None,
+                     response_deserializer=None):
+        return _UnaryStreamMultiCallable(
+            self._load,
+            tuple(
+                channel.unary_stream(method, request_serializer,
+                                     response_deserializer)
+                for channel in self._channels))
+
+    def stream_unary(self,
+                     method,
+                     request_serializer=None,
+                     response_deserializer=None):
+        return _StreamUnaryMultiCallable(
+            self._load,
+            tuple(
+                channel.stream_unary(method, request_serializer,
+                                     response_deserializer)
+                for channel in self._channels))
+
+    def stream_stream(self,
+                      method,
+                      request_serializer=None,
+                      response_deserializer=None):
+        return _StreamStreamMultiCallable(
+            self._load,
+            tuple(
+                channel.stream_stream(method, request_serializer,
+                                      response_deserializer)
+                for channel in self._channels))
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -102,6 +102,49 @@ def fully_qualified_method(group, method):
     return '/{}/{}'.format(group, method)
 
 
+def separate_options(options, python_option_names):
+    """Separates the options handled by gRPC Python from gRPC Core options.
+
+    Args:
+      options: An iterable of key-value pairs.
+      python_option_names: The keys of the options handled by gRPC Python.
+
+    Returns:
+      A dict from the key of each option handled by gRPC Python to its last
+      given value, and a tuple of the options to be passed to gRPC Core.
+    """
+    python_options = {}
+    core_options = []
+    for key, value in options:
+        if key in python_option_names:
+            python_options[key] = value
+        else:
+            core_options.append((key, value))
+    return python_options, tuple(core_options)
+
+
+def integer_option(python_options, name, default, minimum):
+    """Returns the value of an integer option handled by gRPC Python.
+
+    Args:
+      python_options: A dict as returned by separate_options.
+      name: The key of the option.
+      default: The value of the option if it was not given.
+      minimum: The smallest valid value of the option, either 0 or 1.
+
+    Raises:
+      ValueError: If the given value is smaller than minimum.
+    """
+    if name not in python_options:
+        return default
+    value = int(python_options[name])
+    if value < minimum:
+        raise ValueError('{} must be {}, got {}'.format(
+            name, 'positive' if minimum > 0 else 'non-negative',
+            python_options[name]))
+    return value
+
+
 def _wait_once(wait_fn, timeout, spin_cb):
     wait_fn(timeout=timeout)
     if spin_cb is not None:
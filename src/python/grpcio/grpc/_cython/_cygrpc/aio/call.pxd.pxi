@@ -42,6 +42,10 @@ cdef class _AioCall(GrpcCallWrapper):
 
         int _send_initial_metadata_flags
 
+        # Receives messages ahead of the application once it reads them in
+        # batches.
+        _MessageBatchReceiver _message_receiver
+
     cdef void _create_grpc_call(self, object timeout, bytes method, CallCredentials credentials) except *
     cdef void _set_status(self, AioRpcStatus status) except *
     cdef void _set_initial_metadata(self, tuple initial_metadata) except *
@@ -17,6 +17,14 @@ _EMPTY_FLAGS = 0
 _EMPTY_MASK = 0
 _IMMUTABLE_EMPTY_METADATA = tuple()
 
+# Bounds of the receive operations of unary-unary RPCs pooled by each channel.
+cdef int _MAXIMUM_POOLED_RECEIVE_OPERATIONS = 16
+cdef Py_ssize_t _MAXIMUM_POOLED_RESPONSE_BYTES = 64 * 1024
+
+# Sending close carries no per-call state, so every RPC shares one operation.
+cdef SendCloseFromClientOperation _SEND_CLOSE_FROM_CLIENT_OPERATION = (
+    SendCloseFromClientOperation(_EMPTY_FLAGS))
+
 _UNKNOWN_CANCELLATION_DETAILS = 'RPC cancelled for unknown reason.'
 _OK_CALL_REPRESENTATION = ('<{} of RPC that terminated with:\n'
                            '\tstatus = {}\n'
@@ -59,6 +67,7 @@ cdef class _AioCall(GrpcCallWrapper):
         self._is_locally_cancelled = False
         self._deadline = deadline
         self._send_initial_metadata_flags = _get_send_initial_metadata_flags(wait_for_ready)
+        self._message_receiver = None
         self._create_grpc_call(deadline, method, call_credentials)
 
     def __dealloc__(self):
@@ -286,7 +295,7 @@ cdef class _AioCall(GrpcCallWrapper):
         return False
 
     async def unary_unary(self,
-                          bytes request,
+                          object request,
                           tuple outbound_initial_metadata):
         """Performs a unary unary RPC.
 
@@ -295,19 +304,31 @@ cdef class _AioCall(GrpcCallWrapper):
           outbound_initial_metadata: optional outbound metadata.
         """
         cdef tuple ops
+        cdef tuple receive_ops
+        cdef list pooled_receive_ops = self._channel.unary_unary_receive_ops
+
+        # Receive operations hold the results of their batch, so they are
+        # taken from the channel's pool rather than shared between RPCs.
+        if pooled_receive_ops:
+            receive_ops = pooled_receive_ops.pop()
+        else:
+            receive_ops = (
+                ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
+                ReceiveMessageOperation(_EMPTY_FLAGS,
+                                        self._channel.zero_copy_receive),
+                ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
+            )
 
         cdef SendInitialMetadataOperation initial_metadata_op = SendInitialMetadataOperation(
             outbound_initial_metadata,
             self._send_initial_metadata_flags)
         cdef SendMessageOperation send_message_op = SendMessageOperation(request, _EMPTY_FLAGS)
-        cdef SendCloseFromClientOperation send_close_op = SendCloseFromClientOperation(_EMPTY_FLAGS)
-        cdef ReceiveInitialMetadataOperation receive_initial_metadata_op = ReceiveInitialMetadataOperation(_EMPTY_FLAGS)
-        cdef ReceiveMessageOperation receive_message_op = ReceiveMessageOperation(_EMPTY_FLAGS)
-        cdef ReceiveStatusOnClientOperation receive_status_on_client_op = ReceiveStatusOnClientOperation(_EMPTY_FLAGS)
+        cdef ReceiveInitialMetadataOperation receive_initial_metadata_op = receive_ops[0]
+        cdef ReceiveMessageOperation receive_message_op = receive_ops[1]
+        cdef ReceiveStatusOnClientOperation receive_status_on_client_op = receive_ops[2]
 
-        ops = (initial_metadata_op, send_message_op, send_close_op,
-               receive_initial_metadata_op, receive_message_op,
-               receive_status_on_client_op)
+        ops = (initial_metadata_op, send_message_op,
+               _SEND_CLOSE_FROM_CLIENT_OPERATION) + receive_ops
 
         # Executes all operations in one batch.
         # Might raise CancelledError, handling it in Python UnaryUnaryCall.
@@ -327,8 +348,17 @@ cdef class _AioCall(GrpcCallWrapper):
             receive_status_on_client_op.error_string(),
         ))
 
+        message = receive_message_op.message()
+
+        # Operations holding a large response are dropped rather than keeping
+        # the response alive.
+        if (len(pooled_receive_ops) < _MAXIMUM_POOLED_RECEIVE_OPERATIONS and
+                (message is None or
+                 len(message) <= _MAXIMUM_POOLED_RESPONSE_BYTES)):
+            pooled_receive_ops.append(receive_ops)
+
         if code == StatusCode.ok:
-            return receive_message_op.message()
+            return message
         else:
             return None
 
@@ -350,8 +380,20 @@ cdef class _AioCall(GrpcCallWrapper):
         ))
 
     async def receive_serialized_message(self):
-        """Receives one single raw message in bytes."""
-        cdef bytes received_message
+        """Receives one single raw message in bytes.
+
+        The message is a read-only memoryview instead if the channel enables
+        zero-copy receiving.
+        """
+        cdef object received_message
+
+        # Messages may already be received ahead of the application.
+        if self._message_receiver is not None:
+            received_message = await self._message_receiver.receive_many(1)
+            if received_message is EOF:
+                return EOF
+            else:
+                return received_message[0]
 
         # Receives a message. Returns None when failed:
         # * EOF, no more messages to read;
@@ -359,19 +401,48 @@ cdef class _AioCall(GrpcCallWrapper):
         # * The server sends final status.
         received_message = await _receive_message(
             self,
-            self._loop
+            self._loop,
+            self._channel.zero_copy_receive
         )
         if received_message is not None:
             return received_message
         else:
             return EOF
 
-    async def send_serialized_message(self, bytes message):
-        """Sends one single raw message in bytes."""
+    def has_received_messages(self):
+        """Returns whether messages were received ahead of the application."""
+        return (self._message_receiver is not None and
+                self._message_receiver.has_messages())
+
+    async def receive_serialized_messages(self,
+                                          Py_ssize_t max_messages,
+                                          object max_bytes=None):
+        """Receives the raw messages received so far, at least one.
+
+        Once called, the following messages are received ahead of the
+        application, up to as many messages and bytes as the last call asked
+        for. Returns a list of messages, or EOF if no more messages will be
+        received.
+        """
+        if self._message_receiver is None:
+            self._message_receiver = _MessageBatchReceiver(
+                self,
+                self._loop,
+                self._channel.zero_copy_receive)
+        return await self._message_receiver.receive_many(max_messages,
+                                                         max_bytes)
+
+    async def send_serialized_message(self, object message,
+                                      bint buffer_hint=False):
+        """Sends one single raw message in a bytes-like object.
+
+        A message sent with buffer_hint may be held back by Core until a
+        later message without it is sent.
+        """
         await _send_message(self,
                             message,
                             None,
-                            False,
+                            GRPC_WRITE_BUFFER_HINT if buffer_hint else _EMPTY_FLAGS,
                             self._loop)
 
     async def send_receive_close(self):
@@ -381,7 +452,7 @@ cdef class _AioCall(GrpcCallWrapper):
         await execute_batch(self, ops, self._loop)
 
     async def initiate_unary_stream(self,
-                           bytes request,
+                           object request,
                            tuple outbound_initial_metadata):
         """Implementation of the start of a unary-stream call."""
         # Peer may prematurely end this RPC at any point. We need a corutine
@@ -450,7 +521,8 @@ cdef class _AioCall(GrpcCallWrapper):
             return None
 
         cdef tuple inbound_ops
-        cdef ReceiveMessageOperation receive_message_op = ReceiveMessageOperation(_EMPTY_FLAGS)
+        cdef ReceiveMessageOperation receive_message_op = ReceiveMessageOperation(
+            _EMPTY_FLAGS, self._channel.zero_copy_receive)
         cdef ReceiveStatusOnClientOperation receive_status_on_client_op = ReceiveStatusOnClientOperation(_EMPTY_FLAGS)
         inbound_ops = (receive_message_op, receive_status_on_client_op)
 
@@ -55,3 +55,20 @@ cdef class CallbackWrapper:
 
 cdef class GrpcCallWrapper:
     cdef grpc_call* call
+
+
+cdef class _MessageBatchReceiver:
+    cdef GrpcCallWrapper _call_wrapper
+    cdef object _loop  # asyncio.AbstractEventLoop
+    cdef bint _zero_copy
+    cdef object _messages  # collections.deque
+    cdef Py_ssize_t _buffered_bytes
+    cdef Py_ssize_t _maximum_messages
+    cdef object _maximum_bytes  # Optional[int]
+    cdef object _receiver  # Optional[asyncio.Task]
+    cdef object _received  # asyncio.Event
+    cdef bint _eof
+
+    cdef bint _full(self)
+    cdef bint has_messages(self)
+    cdef void _start_receiving(self) except *
@@ -112,14 +112,18 @@ cdef prepend_send_initial_metadata_op(tuple ops, tuple metadata):
 
 
 async def _receive_message(GrpcCallWrapper grpc_call_wrapper,
-                           object loop):
+                           object loop,
+                           bint zero_copy=False):
     """Retrives parsed messages from Core.
 
     The messages maybe already in Core's buffer, so there isn't a 1-to-1
     mapping between this and the underlying "socket.read()". Also, eventually,
     this function will end with an EOF, which reads empty message.
+
+    If zero_copy is set, the message is returned as a read-only memoryview
+    backed by Core's buffer instead of bytes.
     """
-    cdef ReceiveMessageOperation receive_op = ReceiveMessageOperation(_EMPTY_FLAG)
+    cdef ReceiveMessageOperation receive_op = ReceiveMessageOperation(_EMPTY_FLAG, zero_copy)
     cdef tuple ops = (receive_op,)
     try:
         await execute_batch(grpc_call_wrapper, ops, loop)
@@ -135,8 +139,105 @@ async def _receive_message(GrpcCallWrapper grpc_call_wrapper,
     return receive_op.message()
 
 
+cdef class _MessageBatchReceiver:
+    """Receives the messages of a call ahead of the application.
+
+    Core accepts a single outstanding receive per call, so a Task keeps
+    receiving messages into a buffer until it holds as many messages, or as
+    many bytes, as the last batch asked for. Each batch then takes whatever
+    has been received meanwhile at once.
+    """
+
+    def __cinit__(self, GrpcCallWrapper call_wrapper, object loop,
+                  bint zero_copy=False):
+        self._call_wrapper = call_wrapper
+        self._loop = loop
+        self._zero_copy = zero_copy
+        self._messages = collections.deque()
+        self._buffered_bytes = 0
+        self._maximum_messages = 1
+        self._maximum_bytes = None
+        self._receiver = None
+        self._received = asyncio.Event(loop=loop)
+        self._eof = False
+
+    cdef bint _full(self):
+        if len(self._messages) >= self._maximum_messages:
+            return True
+        return (self._maximum_bytes is not None and
+                self._buffered_bytes >= self._maximum_bytes)
+
+    cdef bint has_messages(self):
+        return bool(self._messages)
+
+    cdef void _start_receiving(self) except *:
+        if self._receiver is None and not self._eof and not self._full():
+            self._receiver = self._loop.create_task(self._receive())
+
+    async def _receive(self):
+        cdef object message
+        try:
+            while not self._full():
+                message = await _receive_message(self._call_wrapper,
+                                                 self._loop,
+                                                 self._zero_copy)
+                if message is None:
+                    self._eof = True
+                    break
+                self._messages.append(message)
+                self._buffered_bytes += len(message)
+                self._received.set()
+        finally:
+            self._receiver = None
+            self._received.set()
+
+    async def receive_many(self, Py_ssize_t max_messages,
+                           object max_bytes=None):
+        """Receives the raw messages received so far, waiting for at least one.
+
+        Returns up to max_messages messages, and only as many as fit in
+        max_bytes unless the first one alone exceeds it. Returns EOF once
+        no more messages will be received.
+        """
+        cdef list messages = []
+        cdef Py_ssize_t received_bytes = 0
+        cdef object message
+        if max_messages < 1:
+            raise ValueError(
+                'max_messages must be positive, got {}'.format(
+                    max_messages))
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(
+                'max_bytes must be positive, got {}'.format(max_bytes))
+        self._maximum_messages = max_messages
+        self._maximum_bytes = max_bytes
+
+        while not self._messages and not self._eof:
+            self._received.clear()
+            self._start_receiving()
+            await self._received.wait()
+
+        while self._messages and len(messages) < max_messages:
+            message = self._messages[0]
+            if (messages and max_bytes is not None and
+                    received_bytes + len(message) > max_bytes):
+                break
+            self._messages.popleft()
+            messages.append(message)
+            received_bytes += len(message)
+        self._buffered_bytes -= received_bytes
+
+        # Receives the following messages while the application handles
+        # these ones.
+        self._start_receiving()
+        if messages:
+            return messages
+        else:
+            return EOF
+
+
 async def _send_message(GrpcCallWrapper grpc_call_wrapper,
-                        bytes message,
+                        object message,
                         Operation send_initial_metadata_op,
                         int write_flag,
                         object loop):
@@ -25,3 +25,7 @@ cdef class AioChannel:
         bytes _target
         AioChannelStatus _status
         bint _is_secure
+        readonly bint zero_copy_receive
+        readonly Py_ssize_t coalesced_write_bytes
+        readonly Py_ssize_t coalesced_write_messages
+        list unary_unary_receive_ops
@@ -26,7 +26,10 @@ cdef CallbackFailureHandler _WATCH_CONNECTIVITY_FAILURE_HANDLER = CallbackFailur
 
 
 cdef class AioChannel:
-    def __cinit__(self, bytes target, tuple options, ChannelCredentials credentials, object loop):
+    def __cinit__(self, bytes target, tuple options, ChannelCredentials credentials, object loop,
+                  bint zero_copy_receive=False,
+                  Py_ssize_t coalesced_write_bytes=0,
+                  Py_ssize_t coalesced_write_messages=0):
         init_grpc_aio()
         if options is None:
             options = ()
@@ -34,6 +37,10 @@ cdef class AioChannel:
         self._target = target
         self.loop = loop
         self._status = AIO_CHANNEL_STATUS_READY
+        self.zero_copy_receive = zero_copy_receive
+        self.coalesced_write_bytes = coalesced_write_bytes
+        self.coalesced_write_messages = coalesced_write_messages
+        self.unary_unary_receive_ops = []
 
         if credentials is None:
             self._is_secure = False
@@ -28,7 +28,7 @@ cdef grpc_status_code get_status_code(object code) except *:
             return StatusCode.unknown
 
 
-cdef object deserialize(object deserializer, bytes raw_message):
+cdef object deserialize(object deserializer, object raw_message):
     """Perform deserialization on raw bytes.
 
     Failure to deserialize is a fatal error.
@@ -39,7 +39,7 @@ cdef object deserialize(object deserializer, bytes raw_message):
         return raw_message
 
 
-cdef bytes serialize(object serializer, object message):
+cdef object serialize(object serializer, object message):
     """Perform serialization on a message.
 
     Failure to serialize is a fatal error.
@@ -22,6 +22,7 @@ cdef extern from "<queue>" namespace "std" nogil:
         void pop()
         void push(T&)
         size_t size()
+        void swap(queue&)
 
 
 cdef extern from "<mutex>" namespace "std" nogil:
@@ -65,6 +66,14 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
     cdef object _read_socket    # socket.socket
     cdef object _write_socket   # socket.socket
     cdef dict _loops            # Mapping[asyncio.AbstractLoop, _BoundEventLoop]
+    # Guarded by _queue_mutex: set once the loops have been signaled about
+    # queued events, until a loop takes the queued events.
+    cdef bint _wakeup_pending
+    cdef unsigned long long _queued_events      # Guarded by _queue_mutex
+    cdef unsigned long long _wakeups            # Guarded by _queue_mutex
+    cdef unsigned long long _drains             # Guarded by _queue_mutex
+    cdef unsigned long long _cross_loop_events  # Guarded by _queue_mutex
+    cdef unsigned long long _cross_loop_calls   # Guarded by _queue_mutex
 
     cdef void _poll(self) nogil
     cdef shutdown(self)
@@ -31,8 +31,11 @@ ELSE:
         unistd.write(fd, b"1", 1)
 
 
-def _handle_callback_wrapper(CallbackWrapper callback_wrapper, int success):
-    CallbackWrapper.functor_run(callback_wrapper.c_functor(), success)
+def _handle_callback_wrappers(list events):
+    cdef CallbackWrapper callback_wrapper
+    cdef int success
+    for callback_wrapper, success in events:
+        CallbackWrapper.functor_run(callback_wrapper.c_functor(), success)
 
 
 cdef class BaseCompletionQueue:
@@ -87,6 +90,12 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
         self._read_socket.setblocking(False)
 
         self._queue = cpp_event_queue()
+        self._wakeup_pending = False
+        self._queued_events = 0
+        self._wakeups = 0
+        self._drains = 0
+        self._cross_loop_events = 0
+        self._cross_loop_calls = 0
 
     def bind_loop(self, object loop):
         if loop in self._loops:
@@ -97,6 +106,7 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
     cdef void _poll(self) nogil:
         cdef grpc_event event
         cdef CallbackContext *context
+        cdef bint signal
 
         while not self._shutdown:
             event = grpc_completion_queue_next(self._cq,
@@ -111,9 +121,17 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
             else:
                 self._queue_mutex.lock()
                 self._queue.push(event)
+                self._queued_events += 1
+                # Only the first event since the loops last drained the queue
+                # needs to wake them up; they take every queued event at once.
+                signal = not self._wakeup_pending
+                if signal:
+                    self._wakeup_pending = True
+                    self._wakeups += 1
                 self._queue_mutex.unlock()
                 if _has_fd_monitoring:
-                    _unified_socket_write(self._write_fd)
+                    if signal:
+                        _unified_socket_write(self._write_fd)
                 else:
                     with gil:
                         # Event loops can be paused or killed at any time. So,
@@ -141,22 +159,32 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
         self._write_socket.close()
 
     def _handle_events(self, object context_loop):
-        cdef bytes data
-        if _has_fd_monitoring:
-            # If fd monitoring is working, clean the socket without blocking.
-            data = self._read_socket.recv(1)
+        cdef cpp_event_queue events
         cdef grpc_event event
         cdef CallbackContext *context
+        cdef dict cross_loop_events = None
+        cdef list loop_events
+        cdef unsigned long long cross_loop_event_count = 0
+        if _has_fd_monitoring:
+            # If fd monitoring is working, clean the socket without blocking.
+            try:
+                self._read_socket.recv(1)
+            except BlockingIOError:
+                # Another loop bound to this queue took the wakeup.
+                pass
+
+        self._queue_mutex.lock()
+        self._queue.swap(events)
+        self._wakeup_pending = False
+        if not events.empty():
+            self._drains += 1
+        self._queue_mutex.unlock()
+        if events.empty():
+            return
 
-        while True:
-            self._queue_mutex.lock()
-            if self._queue.empty():
-                self._queue_mutex.unlock()
-                break
-            else:
-                event = self._queue.front()
-                self._queue.pop()
-                self._queue_mutex.unlock()
+        while not events.empty():
+            event = events.front()
+            events.pop()
 
             context = <CallbackContext *>event.tag
             loop = <object>context.loop
@@ -167,11 +195,54 @@ cdef class PollerCompletionQueue(BaseCompletionQueue):
                     event.success
                 )
             else:
-                loop.call_soon_threadsafe(
-                    _handle_callback_wrapper,
+                if cross_loop_events is None:
+                    cross_loop_events = {}
+                loop_events = cross_loop_events.get(loop)
+                if loop_events is None:
+                    loop_events = []
+                    cross_loop_events[loop] = loop_events
+                loop_events.append((
                     <CallbackWrapper>context.callback_wrapper,
-                    event.success
-                )
+                    event.success,
+                ))
+
+        if cross_loop_events is not None:
+            # One thread-safe call per loop, not per event.
+            for loop, loop_events in cross_loop_events.items():
+                cross_loop_event_count += len(loop_events)
+                loop.call_soon_threadsafe(_handle_callback_wrappers,
+                                          loop_events)
+            self._queue_mutex.lock()
+            self._cross_loop_events += cross_loop_event_count
+            self._cross_loop_calls += len(cross_loop_events)
+            self._queue_mutex.unlock()
+
+    def stats(self):
+        """Reports how well events were batched, as a dict of counters.
+
+        "queued_events" events from Core woke the loops up "wakeups" times and
+        were dispatched in "drains" batches. Of them, "cross_loop_events" were
+        handed to other loops with "cross_loop_calls" thread-safe calls.
+        """
+        cdef unsigned long long queued_events
+        cdef unsigned long long wakeups
+        cdef unsigned long long drains
+        cdef unsigned long long cross_loop_events
+        cdef unsigned long long cross_loop_calls
+        self._queue_mutex.lock()
+        queued_events = self._queued_events
+        wakeups = self._wakeups
+        drains = self._drains
+        cross_loop_events = self._cross_loop_events
+        cross_loop_calls = self._cross_loop_calls
+        self._queue_mutex.unlock()
+        return {
+            'queued_events': queued_events,
+            'wakeups': wakeups,
+            'drains': drains,
+            'cross_loop_events': cross_loop_events,
+            'cross_loop_calls': cross_loop_calls,
+        }
 
 
 cdef class CallbackCompletionQueue(BaseCompletionQueue):
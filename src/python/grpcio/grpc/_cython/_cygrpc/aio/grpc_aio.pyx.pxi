@@ -141,3 +141,17 @@ cpdef shutdown_grpc_aio():
         _global_aio_state.refcount -= 1
         if not _global_aio_state.refcount:
             _actual_aio_shutdown()
+
+
+def completion_queue_stats():
+    """Reports the event batching of the poller completion queue.
+
+    Returns:
+      The dict of counters of PollerCompletionQueue.stats(), or None if the
+      poller engine hasn't been initialized.
+    """
+    with _global_aio_state.lock:
+        if (_global_aio_state.engine is AsyncIOEngine.POLLER and
+                _global_aio_state.cq is not None):
+            return (<PollerCompletionQueue>_global_aio_state.cq).stats()
+        return None
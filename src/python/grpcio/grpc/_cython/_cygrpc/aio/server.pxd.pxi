@@ -14,7 +14,7 @@
 
 cdef class _HandlerCallDetails:
     cdef readonly str method
-    cdef readonly tuple invocation_metadata
+    cdef readonly object invocation_metadata
 
 
 cdef class RPCState(GrpcCallWrapper):
@@ -33,9 +33,10 @@ cdef class RPCState(GrpcCallWrapper):
     cdef tuple trailing_metadata
     cdef object compression_algorithm
     cdef bint disable_next_compression
+    cdef _MetadataView _invocation_metadata
 
     cdef bytes method(self)
-    cdef tuple invocation_metadata(self)
+    cdef _MetadataView invocation_metadata(self)
     cdef void raise_for_termination(self) except *
     cdef int get_write_flag(self)
     cdef Operation create_send_initial_metadata_op_if_not_sent(self)
@@ -46,6 +47,7 @@ cdef class _ServicerContext:
     cdef object _loop  # asyncio.AbstractEventLoop
     cdef object _request_deserializer  # Callable[[bytes], Any]
     cdef object _response_serializer  # Callable[[Any], bytes]
+    cdef _MessageBatchReceiver _message_receiver
 
 
 cdef class _SyncServicerContext:
@@ -70,13 +72,18 @@ cdef enum AioServerStatus:
 cdef class _ConcurrentRpcLimiter:
     cdef int _maximum_concurrent_rpcs
     cdef int _active_rpcs
-    cdef object _active_rpcs_condition # asyncio.Condition
+    cdef object _waiters  # collections.deque of asyncio.Future
     cdef object _loop  # asyncio.EventLoop
 
+    cdef release(self)
+    cdef bint is_saturated(self)
+    cdef tuple metrics(self)
+
 
 cdef class AioServer:
     cdef Server _server
     cdef list _generic_handlers
+    cdef dict _method_handler_routes  # Optional[Dict[bytes, RpcMethodHandler]]
     cdef AioServerStatus _status
     cdef object _loop  # asyncio.EventLoop
     cdef object _serving_task  # asyncio.Task
@@ -85,7 +92,12 @@ cdef class AioServer:
     cdef CallbackWrapper _shutdown_callback_wrapper
     cdef object _crash_exception  # Exception
     cdef tuple _interceptors
+    cdef object _intercepted_method_handlers  # Optional[_interceptor.MethodHandlerCache]
     cdef object _thread_pool  # concurrent.futures.ThreadPoolExecutor
     cdef _ConcurrentRpcLimiter _limiter
+    cdef dict _method_limiters  # Optional[Dict[bytes, _ConcurrentRpcLimiter]]
+    cdef bint _zero_copy_receive
+    cdef int _pending_request_calls
 
     cdef thread_pool(self)
+    cdef _compile_method_handler_routes(self)
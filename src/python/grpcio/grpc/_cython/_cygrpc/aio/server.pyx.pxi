@@ -16,6 +16,7 @@
 import inspect
 import traceback
 import functools
+import collections
 
 
 cdef int _EMPTY_FLAG = 0
@@ -33,7 +34,7 @@ cdef _augment_metadata(tuple metadata, object compression):
 
 
 cdef class _HandlerCallDetails:
-    def __cinit__(self, str method, tuple invocation_metadata):
+    def __cinit__(self, str method, object invocation_metadata):
         self.method = method
         self.invocation_metadata = invocation_metadata
 
@@ -63,8 +64,10 @@ cdef class RPCState:
     cdef bytes method(self):
         return _slice_bytes(self.details.method)
 
-    cdef tuple invocation_metadata(self):
-        return _metadata(&self.request_metadata)
+    cdef _MetadataView invocation_metadata(self):
+        if self._invocation_metadata is None:
+            self._invocation_metadata = _metadata_view(&self.request_metadata)
+        return self._invocation_metadata
 
     cdef void raise_for_termination(self) except *:
         """Raise exceptions if RPC is not running.
@@ -121,12 +124,20 @@ cdef class _ServicerContext:
         self._request_deserializer = request_deserializer
         self._response_serializer = response_serializer
         self._loop = loop
+        self._message_receiver = None
 
     async def read(self):
-        cdef bytes raw_message
+        cdef object raw_message
         self._rpc_state.raise_for_termination()
 
-        raw_message = await _receive_message(self._rpc_state, self._loop)
+        if self._message_receiver is not None:
+            raw_message = await self._message_receiver.receive_many(1)
+            raw_message = None if raw_message is EOF else raw_message[0]
+        else:
+            raw_message = await _receive_message(
+                self._rpc_state,
+                self._loop,
+                self._rpc_state.server._zero_copy_receive)
         self._rpc_state.raise_for_termination()
 
         if raw_message is None:
@@ -135,6 +146,32 @@ cdef class _ServicerContext:
             return deserialize(self._request_deserializer,
                             raw_message)
 
+    async def read_many(self, Py_ssize_t max_messages, object max_bytes=None):
+        """Reads the requests received so far, waiting for at least one.
+
+        Once called, the following requests are received ahead of the
+        servicer, up to as many requests and bytes as the last call asked
+        for. Returns a list of requests, or EOF if the client is done
+        writing.
+        """
+        cdef object raw_messages
+        self._rpc_state.raise_for_termination()
+
+        if self._message_receiver is None:
+            self._message_receiver = _MessageBatchReceiver(
+                self._rpc_state,
+                self._loop,
+                self._rpc_state.server._zero_copy_receive)
+        raw_messages = await self._message_receiver.receive_many(max_messages,
+                                                                 max_bytes)
+        self._rpc_state.raise_for_termination()
+
+        if raw_messages is EOF:
+            return EOF
+        else:
+            return [deserialize(self._request_deserializer, raw_message)
+                    for raw_message in raw_messages]
+
     async def write(self, object message):
         self._rpc_state.raise_for_termination()
 
@@ -265,7 +302,10 @@ cdef class _ServicerContext:
         if self._rpc_state.details.deadline.seconds == _GPR_INF_FUTURE.seconds:
             return None
         else:
-            return max(_time_from_timespec(self._rpc_state.details.deadline) - time.time(), 0)
+            return max(
+                _monotonic_time_from_timespec(self._rpc_state.details.deadline) -
+                _monotonic_time_from_timespec(gpr_now(GPR_CLOCK_MONOTONIC)),
+                0)
 
 
 cdef class _SyncServicerContext:
@@ -346,21 +386,42 @@ def _is_async_handler(object handler):
     return inspect.isawaitable(handler) or inspect.iscoroutinefunction(handler) or inspect.isasyncgenfunction(handler)
 
 
-async def _find_method_handler(str method, tuple metadata, list generic_handlers,
-                          tuple interceptors):
-    def query_handlers(handler_call_details):
-        for generic_handler in generic_handlers:
-            method_handler = generic_handler.service(handler_call_details)
+async def _find_method_handler(bytes method, RPCState rpc_state, list generic_handlers,
+                               dict method_handler_routes, tuple interceptors,
+                               object method_handlers):
+    if method_handler_routes is not None:
+        if not interceptors:
+            return method_handler_routes.get(method)
+        if method_handlers is not None:
+            method_handler = method_handlers.get(method, method_handler_routes)
             if method_handler is not None:
                 return method_handler
-        return None
 
-    cdef _HandlerCallDetails handler_call_details = _HandlerCallDetails(method,
-                                                                        metadata)
+        def query_handlers(handler_call_details):
+            return method_handler_routes.get(
+                _encode(handler_call_details.method))
+    else:
+        # Generic handlers that cannot be tabulated may look at the
+        # invocation metadata, so their results are not cached.
+        method_handlers = None
+
+        def query_handlers(handler_call_details):
+            for generic_handler in generic_handlers:
+                method_handler = generic_handler.service(handler_call_details)
+                if method_handler is not None:
+                    return method_handler
+            return None
+
+    cdef _HandlerCallDetails handler_call_details = _HandlerCallDetails(
+        _decode(method), rpc_state.invocation_metadata())
     # interceptor
     if interceptors:
-        return await _run_interceptor(iter(interceptors), query_handlers,
-                                      handler_call_details)
+        method_handler = await _run_interceptor(iter(interceptors),
+                                                query_handlers,
+                                                handler_call_details)
+        if method_handlers is not None:
+            method_handlers.put(method, method_handler_routes, method_handler)
+        return method_handler
     else:
         return query_handlers(handler_call_details)
 
@@ -404,7 +465,7 @@ async def _finish_handler_with_unary_response(RPCState rpc_state,
     rpc_state.raise_for_termination()
 
     # Serializes the response message
-    cdef bytes response_raw
+    cdef object response_raw
     if rpc_state.status_code == StatusCode.ok:
         response_raw = serialize(
             response_serializer,
@@ -506,7 +567,10 @@ async def _handle_unary_unary_rpc(object method_handler,
                                   RPCState rpc_state,
                                   object loop):
     # Receives request message
-    cdef bytes request_raw = await _receive_message(rpc_state, loop)
+    cdef object request_raw = await _receive_message(
+        rpc_state,
+        loop,
+        rpc_state.server._zero_copy_receive)
     if request_raw is None:
         # The RPC was cancelled immediately after start on client side.
         return
@@ -540,7 +604,10 @@ async def _handle_unary_stream_rpc(object method_handler,
                                    RPCState rpc_state,
                                    object loop):
     # Receives request message
-    cdef bytes request_raw = await _receive_message(rpc_state, loop)
+    cdef object request_raw = await _receive_message(
+        rpc_state,
+        loop,
+        rpc_state.server._zero_copy_receive)
     if request_raw is None:
         return
 
@@ -736,15 +803,19 @@ async def _schedule_rpc_coro(object rpc_coro,
     await _handle_cancellation_from_core(rpc_task, rpc_state, loop)
 
 
-async def _handle_rpc(list generic_handlers, tuple interceptors,
-                      RPCState rpc_state, object loop):
+async def _handle_rpc(list generic_handlers, dict method_handler_routes,
+                      tuple interceptors, RPCState rpc_state, object loop):
     cdef object method_handler
+    cdef bytes method = rpc_state.method()
+    cdef _ConcurrentRpcLimiter method_limiter = None
     # Finds the method handler (application logic)
     method_handler = await _find_method_handler(
-        rpc_state.method().decode(),
-        rpc_state.invocation_metadata(),
+        method,
+        rpc_state,
         generic_handlers,
+        method_handler_routes,
         interceptors,
+        rpc_state.server._intercepted_method_handlers,
     )
     if method_handler is None:
         rpc_state.status_sent = True
@@ -758,6 +829,23 @@ async def _handle_rpc(list generic_handlers, tuple interceptors,
         )
         return
 
+    if rpc_state.server._method_limiters is not None:
+        method_limiter = rpc_state.server._method_limiters.get(method)
+    if method_limiter is None:
+        await _handle_rpc_with_method_handler(method_handler, rpc_state, loop)
+    else:
+        await method_limiter.acquire()
+        try:
+            await _handle_rpc_with_method_handler(method_handler,
+                                                  rpc_state,
+                                                  loop)
+        finally:
+            method_limiter.release()
+
+
+async def _handle_rpc_with_method_handler(object method_handler,
+                                          RPCState rpc_state,
+                                          object loop):
     # Handles unary-unary case
     if not method_handler.request_streaming and not method_handler.response_streaming:
         await _handle_unary_unary_rpc(method_handler,
@@ -800,43 +888,67 @@ cdef CallbackFailureHandler SERVER_SHUTDOWN_FAILURE_HANDLER = CallbackFailureHan
 
 
 cdef class _ConcurrentRpcLimiter:
+    """Caps the number of RPCs in flight.
+
+    A slot freed by a finished RPC is handed directly to the oldest waiter, so
+    neither admitting nor finishing an RPC schedules a task.
+    """
 
     def __cinit__(self, int maximum_concurrent_rpcs, object loop):
         if maximum_concurrent_rpcs <= 0:
             raise ValueError("maximum_concurrent_rpcs should be a postive integer")
         self._maximum_concurrent_rpcs = maximum_concurrent_rpcs
         self._active_rpcs = 0
-        self._active_rpcs_condition = asyncio.Condition()
+        self._waiters = collections.deque()
         self._loop = loop
 
-    async def check_before_request_call(self):
-        await self._active_rpcs_condition.acquire()
-        try:
-            predicate = lambda: self._active_rpcs < self._maximum_concurrent_rpcs
-            await self._active_rpcs_condition.wait_for(predicate)
+    async def acquire(self):
+        if (self._active_rpcs < self._maximum_concurrent_rpcs and
+                not self._waiters):
             self._active_rpcs += 1
-        finally:
-            self._active_rpcs_condition.release()
+            return
 
-    async def _decrease_active_rpcs_count_with_lock(self):
-        await self._active_rpcs_condition.acquire()
+        cdef object waiter = self._loop.create_future()
+        self._waiters.append(waiter)
         try:
-            self._active_rpcs -= 1
-            self._active_rpcs_condition.notify()
-        finally:
-            self._active_rpcs_condition.release()
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                # release() drops cancelled waiters it comes across.
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+            else:
+                # The slot was handed over before the cancellation arrived.
+                self.release()
+            raise
+
+    cdef release(self):
+        cdef object waiter
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active_rpcs -= 1
+
+    cdef bint is_saturated(self):
+        return self._active_rpcs >= self._maximum_concurrent_rpcs
 
-    def _decrease_active_rpcs_count(self, unused_future):
-        self._loop.create_task(self._decrease_active_rpcs_count_with_lock())
+    cdef tuple metrics(self):
+        return self._active_rpcs, len(self._waiters)
 
-    def decrease_once_finished(self, object rpc_task):
-        rpc_task.add_done_callback(self._decrease_active_rpcs_count)
+    def _release_once_done(self, unused_future):
+        self.release()
+
+    def release_once_finished(self, object rpc_task):
+        rpc_task.add_done_callback(self._release_once_done)
 
 
 cdef class AioServer:
 
     def __init__(self, loop, thread_pool, generic_handlers, interceptors,
-                 options, maximum_concurrent_rpcs):
+                 options, maximum_concurrent_rpcs, zero_copy_receive=False,
+                 pending_request_calls=1, method_concurrency_limits=None):
         init_grpc_aio()
         # NOTE(lidiz) Core objects won't be deallocated automatically.
         # If AioServer.shutdown is not called, those objects will leak.
@@ -851,6 +963,7 @@ cdef class AioServer:
         self._loop = loop
         self._status = AIO_SERVER_STATUS_READY
         self._generic_handlers = []
+        self._method_handler_routes = None
         self.add_generic_rpc_handlers(generic_handlers)
         self._serving_task = None
 
@@ -866,14 +979,47 @@ cdef class AioServer:
             self._interceptors = interceptors
         else:
             self._interceptors = ()
+        # This needs to be loaded at run time once everything
+        # has been loaded.
+        from grpc import _interceptor
+        self._intercepted_method_handlers = _interceptor.method_handler_cache(
+            self._interceptors)
 
         self._thread_pool = thread_pool
+        self._zero_copy_receive = zero_copy_receive
+        self._pending_request_calls = pending_request_calls
         if maximum_concurrent_rpcs is not None:
             self._limiter = _ConcurrentRpcLimiter(maximum_concurrent_rpcs,
                                                   loop)
+        if method_concurrency_limits:
+            self._method_limiters = {
+                _encode(method): _ConcurrentRpcLimiter(limit, loop)
+                for method, limit in method_concurrency_limits.items()
+            }
 
     def add_generic_rpc_handlers(self, object generic_rpc_handlers):
         self._generic_handlers.extend(generic_rpc_handlers)
+        if self._status == AIO_SERVER_STATUS_RUNNING:
+            self._compile_method_handler_routes()
+
+    def concurrency_metrics(self):
+        """Reports the (active, queued) RPC counts of each concurrency limit."""
+        cdef dict metrics = {}
+        if self._limiter is not None:
+            metrics[None] = self._limiter.metrics()
+        if self._method_limiters is not None:
+            for method, limiter in self._method_limiters.items():
+                metrics[_decode(method)] = (
+                    <_ConcurrentRpcLimiter>limiter).metrics()
+        return metrics
+
+    cdef _compile_method_handler_routes(self):
+        # This needs to be loaded at run time once everything
+        # has been loaded.
+        from grpc import _utilities
+
+        self._method_handler_routes = _utilities.method_handler_routes(
+            self._generic_handlers)
 
     def add_insecure_port(self, address):
         return self._server.add_http2_port(address)
@@ -882,7 +1028,12 @@ cdef class AioServer:
         return self._server.add_http2_port(address,
                                            server_credentials._credentials)
 
-    async def _request_call(self):
+    def _request_call(self, object accepted_calls):
+        """Asks Core for the next call without waiting for it to arrive.
+
+        Once Core completes the request, the RPCState and the future of the
+        request are put into accepted_calls, an asyncio.Queue.
+        """
         cdef grpc_call_error error
         cdef RPCState rpc_state = RPCState(self)
         cdef object future = self._loop.create_future()
@@ -890,6 +1041,11 @@ cdef class AioServer:
             future,
             self._loop,
             REQUEST_CALL_FAILURE_HANDLER)
+        # NOTE: The callback keeps rpc_state alive until Core has
+        # finished writing into it, even if the main loop has exited.
+        future.add_done_callback(
+            lambda unused_future: accepted_calls.put_nowait(
+                (rpc_state, future)))
         error = grpc_server_request_call(
             self._server.c_server, &rpc_state.call, &rpc_state.details,
             &rpc_state.request_metadata,
@@ -899,25 +1055,45 @@ cdef class AioServer:
         if error != GRPC_CALL_OK:
             raise InternalError("Error in grpc_server_request_call: %s" % error)
 
-        await future
-        return rpc_state
-
     async def _server_main_loop(self,
                                 object server_started):
         self._server.start(backup_queue=False)
         cdef RPCState rpc_state
+        cdef object future
+        cdef object accepted_calls = asyncio.Queue()
+        cdef int pending_request_calls = 0
         server_started.set_result(True)
 
         while True:
+            # Keeps up to _pending_request_calls requests posted to Core, so a
+            # burst of new RPCs doesn't wait for one loop iteration per call.
             # When shutdown begins, no more new connections.
-            if self._status != AIO_SERVER_STATUS_RUNNING:
+            while (self._status == AIO_SERVER_STATUS_RUNNING and
+                   pending_request_calls < self._pending_request_calls):
+                if self._limiter is not None:
+                    # Slots are released by finished RPCs, which can't start
+                    # if we block here while requests are already posted.
+                    if pending_request_calls and self._limiter.is_saturated():
+                        break
+                    await self._limiter.acquire()
+                self._request_call(accepted_calls)
+                pending_request_calls += 1
+
+            if pending_request_calls == 0:
                 break
 
-            if self._limiter is not None:
-                await self._limiter.check_before_request_call()
-
             # Accepts new request from Core
-            rpc_state = await self._request_call()
+            rpc_state, future = await accepted_calls.get()
+            pending_request_calls -= 1
+            if future.exception() is not None:
+                # The slot acquired for the failed request has no RPC to
+                # release it.
+                if self._limiter is not None:
+                    self._limiter.release()
+                if self._status == AIO_SERVER_STATUS_RUNNING:
+                    raise future.exception()
+                # The remaining requests are failed by the shutdown as well.
+                continue
 
             # Creates the dedicated RPC coroutine. If we schedule it right now,
             # there is no guarantee if the cancellation listening coroutine is
@@ -925,6 +1101,7 @@ cdef class AioServer:
             # the coroutine onto event loop inside of the cancellation
             # coroutine.
             rpc_coro = _handle_rpc(self._generic_handlers,
+                                   self._method_handler_routes,
                                    self._interceptors,
                                    rpc_state,
                                    self._loop)
@@ -939,7 +1116,7 @@ cdef class AioServer:
             )
 
             if self._limiter is not None:
-                self._limiter.decrease_once_finished(rpc_task)
+                self._limiter.release_once_finished(rpc_task)
 
     def _serving_task_crash_handler(self, object task):
         """Shutdown the server immediately if unexpectedly exited."""
@@ -959,6 +1136,7 @@ cdef class AioServer:
             raise UsageError('Server not in ready state')
 
         self._status = AIO_SERVER_STATUS_RUNNING
+        self._compile_method_handler_routes()
         cdef object server_started = self._loop.create_future()
         self._serving_task = self._loop.create_task(self._server_main_loop(server_started))
         self._serving_task.add_done_callback(self._serving_task_crash_handler)
@@ -44,7 +44,9 @@ cdef class _ChannelState:
 
   # A dict from _BatchOperationTag to _CallState
   cdef dict integrated_call_states
-  cdef grpc_completion_queue *c_call_completion_queue
+  # The completion queues of integrated calls, each polled by its own thread.
+  cdef grpc_completion_queue **c_call_completion_queues
+  cdef int c_call_completion_queue_count
 
   # A set of _CallState
   cdef set segregated_call_states
@@ -59,11 +61,20 @@ cdef class IntegratedCall:
   cdef _CallState _call_state
 
 
+cdef class _SegregatedCallCompletionQueue:
+
+  cdef grpc_completion_queue *c_completion_queue
+  cdef object _fork_epoch
+  cdef bint _idle
+
+  cdef destroy(self)
+
+
 cdef class SegregatedCall:
 
   cdef _ChannelState _channel_state
   cdef _CallState _call_state
-  cdef grpc_completion_queue *_c_completion_queue
+  cdef _SegregatedCallCompletionQueue _completion_queue
 
 
 cdef class Channel:
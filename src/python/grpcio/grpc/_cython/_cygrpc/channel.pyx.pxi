@@ -81,6 +81,13 @@ cdef class _ChannelState:
     self.segregated_call_states = set()
     self.connectivity_due = set()
     self.closed_reason = None
+    self.c_call_completion_queues = NULL
+    self.c_call_completion_queue_count = 0
+
+  def __dealloc__(self):
+    # The completion queues themselves are destroyed when the channel closes.
+    if self.c_call_completion_queues != NULL:
+      gpr_free(self.c_call_completion_queues)
 
 
 cdef tuple _operate(grpc_call *c_call, object operations, object user_tag):
@@ -198,8 +205,8 @@ cdef void _call(
     flags: Flags to be passed to gRPC Core as part of call creation.
     method: The fully-qualified name of the RPC method being invoked.
     host: A "host" string to be passed to gRPC Core as part of call creation.
-    deadline: A float for the deadline of the RPC, or None if the RPC is to have
-      no deadline.
+    deadline: A float for the deadline of the RPC on the clock of
+      monotonic_time, or None if the RPC is to have no deadline.
     credentials: A _CallCredentials for the RPC or None.
     operationses_and_user_tags: A sequence of length-two sequences the first
       element of which is a sequence of Operations and the second element of
@@ -226,7 +233,7 @@ cdef void _call(
       call_state.c_call = grpc_channel_create_call(
           channel_state.c_channel, NULL, flags,
           c_completion_queue, method_slice, host_slice_ptr,
-          _timespec_from_time(deadline), NULL)
+          _timespec_from_monotonic_time(deadline), NULL)
       grpc_slice_unref(method_slice)
       if host_slice_ptr:
         grpc_slice_unref(host_slice)
@@ -281,10 +288,19 @@ cdef class IntegratedCall:
     _cancel(self._channel_state, self._call_state, code, details)
 
 
+cdef grpc_completion_queue *_call_completion_queue(
+    _ChannelState state, int index) except *:
+  if not 0 <= index < state.c_call_completion_queue_count:
+    raise ValueError(
+        'Completion queue index %d out of range for %d completion queues!' % (
+            index, state.c_call_completion_queue_count))
+  return state.c_call_completion_queues[index]
+
+
 cdef IntegratedCall _integrated_call(
     _ChannelState state, int flags, method, host, object deadline,
     object metadata, CallCredentials credentials, operationses_and_user_tags,
-    object context):
+    object context, int completion_queue_index):
   call_state = _CallState()
 
   def on_success(started_tags):
@@ -292,21 +308,102 @@ cdef IntegratedCall _integrated_call(
       state.integrated_call_states[started_tag] = call_state
 
   _call(
-      state, call_state, state.c_call_completion_queue, on_success, flags,
-      method, host, deadline, credentials, operationses_and_user_tags, metadata, context)
+      state, call_state, _call_completion_queue(state, completion_queue_index),
+      on_success, flags, method, host, deadline, credentials,
+      operationses_and_user_tags, metadata, context)
 
   return IntegratedCall(state, call_state)
 
 
+cdef class _SegregatedCallCompletionQueue:
+  """A completion queue that serves one segregated call at a time.
+
+  Creating and destroying a completion queue per call is a measurable part of
+  the latency of small blocking RPCs, so each thread keeps the queue of its
+  last finished segregated call for the next one. At most
+  _MAXIMUM_IDLE_SEGREGATED_CALL_COMPLETION_QUEUES queues are kept across all
+  threads, and a thread's queue is destroyed when the thread exits.
+  """
+
+  def __cinit__(self):
+    fork_handlers_and_grpc_init()
+    self.c_completion_queue = grpc_completion_queue_create_for_next(NULL)
+    self._fork_epoch = get_fork_epoch()
+    self._idle = False
+
+  cdef destroy(self):
+    if self.c_completion_queue != NULL:
+      _destroy_c_completion_queue(self.c_completion_queue)
+      self.c_completion_queue = NULL
+
+  def __dealloc__(self):
+    if self._fork_epoch == get_fork_epoch():
+      if self._idle:
+        # The thread keeping the queue exited.
+        _count_idle_segregated_call_completion_queues(-1)
+      self.destroy()
+      grpc_shutdown()
+    # Otherwise the queue, and its reference to gRPC Core, belong to the
+    # parent process; they are abandoned.
+
+
+cdef int _MAXIMUM_IDLE_SEGREGATED_CALL_COMPLETION_QUEUES = 64
+
+_idle_segregated_call_completion_queues = threading.local()
+# The number of queues kept by all threads, and the fork epoch it counts in.
+cdef int _idle_segregated_call_completion_queue_count = 0
+_idle_segregated_call_completion_queues_fork_epoch = None
+
+
+cdef _count_idle_segregated_call_completion_queues(int delta):
+  global _idle_segregated_call_completion_queue_count
+  global _idle_segregated_call_completion_queues_fork_epoch
+  fork_epoch = get_fork_epoch()
+  if _idle_segregated_call_completion_queues_fork_epoch != fork_epoch:
+    # Only the forking thread, and none of the queues, survived the fork.
+    _idle_segregated_call_completion_queues_fork_epoch = fork_epoch
+    _idle_segregated_call_completion_queue_count = 0
+  _idle_segregated_call_completion_queue_count += delta
+
+
+cdef _SegregatedCallCompletionQueue _acquire_segregated_call_completion_queue():
+  cdef _SegregatedCallCompletionQueue completion_queue = getattr(
+      _idle_segregated_call_completion_queues, 'completion_queue', None)
+  if completion_queue is None:
+    return _SegregatedCallCompletionQueue()
+  _idle_segregated_call_completion_queues.completion_queue = None
+  completion_queue._idle = False
+  if completion_queue._fork_epoch != get_fork_epoch():
+    completion_queue.c_completion_queue = NULL
+    return _SegregatedCallCompletionQueue()
+  _count_idle_segregated_call_completion_queues(-1)
+  return completion_queue
+
+
+cdef _release_segregated_call_completion_queue(
+    _SegregatedCallCompletionQueue completion_queue):
+  """Keeps the queue, drained of all of its events, for the next call."""
+  _count_idle_segregated_call_completion_queues(0)
+  if (getattr(_idle_segregated_call_completion_queues, 'completion_queue',
+              None) is None and
+      _idle_segregated_call_completion_queue_count <
+      _MAXIMUM_IDLE_SEGREGATED_CALL_COMPLETION_QUEUES):
+    _idle_segregated_call_completion_queues.completion_queue = completion_queue
+    completion_queue._idle = True
+    _count_idle_segregated_call_completion_queues(1)
+  else:
+    completion_queue.destroy()
+
+
 cdef object _process_segregated_call_tag(
     _ChannelState state, _CallState call_state,
-    grpc_completion_queue *c_completion_queue, _BatchOperationTag tag):
+    _SegregatedCallCompletionQueue completion_queue, _BatchOperationTag tag):
   call_state.due.remove(tag)
   if not call_state.due:
     grpc_call_unref(call_state.c_call)
     call_state.c_call = NULL
     state.segregated_call_states.remove(call_state)
-    _destroy_c_completion_queue(c_completion_queue)
+    _release_segregated_call_completion_queue(completion_queue)
     return True
   else:
     return False
@@ -328,15 +425,16 @@ cdef class SegregatedCall:
   def next_event(self):
     def on_success(tag):
       _process_segregated_call_tag(
-        self._channel_state, self._call_state, self._c_completion_queue, tag)
+        self._channel_state, self._call_state, self._completion_queue, tag)
     def on_failure():
       self._call_state.due.clear()
       grpc_call_unref(self._call_state.c_call)
       self._call_state.c_call = NULL
       self._channel_state.segregated_call_states.remove(self._call_state)
-      _destroy_c_completion_queue(self._c_completion_queue)
+      self._completion_queue.destroy()
     return _next_call_event(
-        self._channel_state, self._c_completion_queue, on_success, on_failure, None)
+        self._channel_state, self._completion_queue.c_completion_queue,
+        on_success, on_failure, None)
 
 
 cdef SegregatedCall _segregated_call(
@@ -345,28 +443,28 @@ cdef SegregatedCall _segregated_call(
     object context):
   cdef _CallState call_state = _CallState()
   cdef SegregatedCall segregated_call
-  cdef grpc_completion_queue *c_completion_queue
+  cdef _SegregatedCallCompletionQueue completion_queue
 
   def on_success(started_tags):
     state.segregated_call_states.add(call_state)
 
   with state.condition:
     if state.open:
-      c_completion_queue = (grpc_completion_queue_create_for_next(NULL))
+      completion_queue = _acquire_segregated_call_completion_queue()
     else:
       raise ValueError('Cannot invoke RPC on closed channel!')
 
   try:
     _call(
-        state, call_state, c_completion_queue, on_success, flags, method, host,
-        deadline, credentials, operationses_and_user_tags, metadata,
-        context)
+        state, call_state, completion_queue.c_completion_queue, on_success,
+        flags, method, host, deadline, credentials, operationses_and_user_tags,
+        metadata, context)
   except:
-    _destroy_c_completion_queue(c_completion_queue)
+    completion_queue.destroy()
     raise
 
   segregated_call = SegregatedCall(state, call_state)
-  segregated_call._c_completion_queue = c_completion_queue
+  segregated_call._completion_queue = completion_queue
   return segregated_call
 
 
@@ -395,6 +493,7 @@ cdef _close(Channel channel, grpc_status_code code, object details,
     drain_calls):
   cdef _ChannelState state = channel._state
   cdef _CallState call_state
+  cdef int index
   encoded_details = _encode(details)
   with state.condition:
     if state.open:
@@ -411,17 +510,25 @@ cdef _close(Channel channel, grpc_status_code code, object details,
 
       if drain_calls:
         while not _calls_drained(state):
-          event = channel.next_call_event()
-          if event.completion_type == CompletionType.queue_timeout:
-              continue  
-          event.tag(event)
+          for index in range(state.c_call_completion_queue_count):
+            if state.c_call_completion_queue_count == 1:
+              event = channel.next_call_event(index)
+            else:
+              # Only polls each queue, so that an idle queue doesn't hold up
+              # the draining of the others.
+              event = channel.next_call_event(index, time.time())
+            if event.completion_type != CompletionType.queue_timeout:
+              event.tag(event)
+            if _calls_drained(state):
+              break
       else:
         while state.integrated_call_states:
           state.condition.wait()
         while state.connectivity_due:
           state.condition.wait()
 
-      _destroy_c_completion_queue(state.c_call_completion_queue)
+      for index in range(state.c_call_completion_queue_count):
+        _destroy_c_completion_queue(state.c_call_completion_queues[index])
       _destroy_c_completion_queue(state.c_connectivity_completion_queue)
       grpc_channel_destroy(state.c_channel)
       state.c_channel = NULL
@@ -442,12 +549,21 @@ cdef class Channel:
 
   def __cinit__(
       self, bytes target, object arguments,
-      ChannelCredentials channel_credentials):
+      ChannelCredentials channel_credentials, int call_completion_queues=1):
+    cdef int index
+    if call_completion_queues < 1:
+      raise ValueError(
+          'A channel needs at least one call completion queue, got %d!' % (
+              call_completion_queues))
     arguments = () if arguments is None else tuple(arguments)
     fork_handlers_and_grpc_init()
     self._state = _ChannelState()
-    self._state.c_call_completion_queue = (
-        grpc_completion_queue_create_for_next(NULL))
+    self._state.c_call_completion_queues = <grpc_completion_queue **>gpr_malloc(
+        call_completion_queues * sizeof(grpc_completion_queue *))
+    for index in range(call_completion_queues):
+      self._state.c_call_completion_queues[index] = (
+          grpc_completion_queue_create_for_next(NULL))
+    self._state.c_call_completion_queue_count = call_completion_queues
     self._state.c_connectivity_completion_queue = (
         grpc_completion_queue_create_for_next(NULL))
     self._arguments = arguments
@@ -472,24 +588,27 @@ cdef class Channel:
   def integrated_call(
       self, int flags, method, host, object deadline, object metadata,
       CallCredentials credentials, operationses_and_tags,
-      object context = None):
+      object context = None, int completion_queue_index = 0):
     return _integrated_call(
         self._state, flags, method, host, deadline, metadata, credentials,
-        operationses_and_tags, context)
+        operationses_and_tags, context, completion_queue_index)
+
+  def call_completion_queue_count(self):
+    return self._state.c_call_completion_queue_count
 
-  def next_call_event(self):
+  def next_call_event(
+      self, int completion_queue_index = 0, object queue_deadline = None):
     def on_success(tag):
       if tag is not None:
         _process_integrated_call_tag(self._state, tag)
-    if is_fork_support_enabled():
+    if queue_deadline is None and is_fork_support_enabled():
       queue_deadline = time.time() + 1.0
-    else:
-      queue_deadline = None
     # NOTE(gnossen): It is acceptable for on_failure to be None here because
     # failure conditions can only ever happen on the main thread and this
     # method is only ever invoked on the channel spin thread.
-    return _next_call_event(self._state, self._state.c_call_completion_queue,
-                            on_success, None, queue_deadline)
+    return _next_call_event(
+        self._state, _call_completion_queue(self._state, completion_queue_index),
+        on_success, None, queue_deadline)
 
   def segregated_call(
       self, int flags, method, host, object deadline, object metadata,
@@ -34,6 +34,17 @@ cdef extern from "grpc/support/alloc.h":
   void *gpr_realloc(void *p, size_t size) nogil
 
 
+cdef extern from "grpc/support/sync.h":
+
+  ctypedef struct gpr_mu:
+    # We don't care about the internals
+    pass
+
+  void gpr_mu_init(gpr_mu *mu) nogil
+  void gpr_mu_lock(gpr_mu *mu) nogil
+  void gpr_mu_unlock(gpr_mu *mu) nogil
+
+
 cdef extern from "grpc/byte_buffer_reader.h":
 
   struct grpc_byte_buffer_reader:
@@ -59,6 +70,8 @@ cdef extern from "grpc/grpc.h":
   grpc_slice grpc_slice_new(void *p, size_t len, void (*destroy)(void *)) nogil
   grpc_slice grpc_slice_new_with_len(
       void *p, size_t len, void (*destroy)(void *, size_t)) nogil
+  grpc_slice grpc_slice_new_with_user_data(
+      void *p, size_t len, void (*destroy)(void *), void *user_data) nogil
   grpc_slice grpc_slice_malloc(size_t length) nogil
   grpc_slice grpc_slice_from_copied_string(const char *source) nogil
   grpc_slice grpc_slice_from_copied_buffer(const char *source, size_t len) nogil
@@ -113,6 +126,8 @@ cdef extern from "grpc/grpc.h":
                                    grpc_byte_buffer *buffer) nogil
   int grpc_byte_buffer_reader_next(grpc_byte_buffer_reader *reader,
                                    grpc_slice *slice) nogil
+  grpc_slice grpc_byte_buffer_reader_readall(
+      grpc_byte_buffer_reader *reader) nogil
   void grpc_byte_buffer_reader_destroy(grpc_byte_buffer_reader *reader) nogil
 
   ctypedef enum grpc_status_code:
@@ -24,3 +24,15 @@ cdef tuple _metadatum(grpc_slice key_slice, grpc_slice value_slice)
 
 
 cdef tuple _metadata(grpc_metadata_array *c_metadata_array)
+
+
+cdef class _MetadataView:
+  cdef grpc_metadata *_c_metadata
+  cdef int _count
+  cdef list _items  # Optional[List[Optional[_Metadatum]]]
+
+  cdef bint _has_key(self, int index, bytes key)
+  cdef tuple _item(self, int index)
+
+
+cdef _MetadataView _metadata_view(grpc_metadata_array *c_metadata_array)
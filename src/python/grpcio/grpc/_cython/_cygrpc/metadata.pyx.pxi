@@ -13,6 +13,12 @@
 # limitations under the License.
 
 import collections
+from libc.string cimport memcmp
+
+try:
+  from collections.abc import Sequence as _Sequence
+except ImportError:  # Python 2
+  from collections import Sequence as _Sequence
 
 
 class InitialMetadataFlags:
@@ -58,16 +64,237 @@ cdef void _release_c_metadata(grpc_metadata *c_metadata, int count) except *:
     gpr_free(c_metadata)
 
 
+# The same keys, and often the same values, are received on every RPC. Decoded
+# keys and whole metadata items are cached so that they are neither decoded
+# nor allocated again. Once a cache holds too many entries, it is emptied
+# rather than evicting piecemeal. An item is only cached once its value has
+# been received a second time, so unique values (e.g. request IDs) only pass
+# through the bounded record of values seen once and never crowd out the
+# recurring ones.
+cdef Py_ssize_t _MAXIMUM_INTERNED_KEYS = 512
+cdef Py_ssize_t _MAXIMUM_INTERNED_METADATA = 4096
+cdef Py_ssize_t _MAXIMUM_SEEN_METADATA = 4096
+cdef Py_ssize_t _MAXIMUM_INTERNED_VALUE_LENGTH = 128
+cdef dict _interned_keys = {}
+# Maps key bytes to a dict from value bytes to _Metadatum.
+cdef dict _interned_metadata = {}
+cdef Py_ssize_t _interned_metadata_count = 0
+# Maps key bytes to the set of value bytes received once but not yet cached.
+cdef dict _seen_metadata = {}
+cdef Py_ssize_t _seen_metadata_count = 0
+
+
+cdef str _intern_key(bytes key):
+  cdef object decoded_key = _interned_keys.get(key)
+  if decoded_key is None:
+    decoded_key = _decode(key)
+    if len(_interned_keys) >= _MAXIMUM_INTERNED_KEYS:
+      _interned_keys.clear()
+    _interned_keys[key] = decoded_key
+  return <str>decoded_key
+
+
+cdef tuple _new_metadatum(bytes key, bytes value):
+  # tuple.__new__ skips the Python-level __new__ of the namedtuple.
+  return <tuple>tuple.__new__(_Metadatum, (
+      _intern_key(key), value if key[-4:] == b'-bin' else _decode(value)))
+
+
+cdef bint _seen_before(bytes key, bytes value) except *:
+  """Records that the value was received, returning whether it was before."""
+  global _seen_metadata_count
+  cdef set seen_values = _seen_metadata.get(key)
+  if seen_values is not None and value in seen_values:
+    seen_values.remove(value)
+    _seen_metadata_count -= 1
+    return True
+  if _seen_metadata_count >= _MAXIMUM_SEEN_METADATA:
+    _seen_metadata.clear()
+    _seen_metadata_count = 0
+    seen_values = None
+  if seen_values is None:
+    seen_values = set()
+    _seen_metadata[key] = seen_values
+  seen_values.add(value)
+  _seen_metadata_count += 1
+  return False
+
+
 cdef tuple _metadatum(grpc_slice key_slice, grpc_slice value_slice):
+  global _interned_metadata_count
   cdef bytes key = _slice_bytes(key_slice)
   cdef bytes value = _slice_bytes(value_slice)
-  return <tuple>_Metadatum(
-      _decode(key), value if key[-4:] == b'-bin' else _decode(value))
+  cdef dict interned_values
+  cdef object metadatum
+  if len(value) > _MAXIMUM_INTERNED_VALUE_LENGTH:
+    return _new_metadatum(key, value)
+  interned_values = _interned_metadata.get(key)
+  if interned_values is not None:
+    metadatum = interned_values.get(value)
+    if metadatum is not None:
+      return <tuple>metadatum
+  if not _seen_before(key, value):
+    return _new_metadatum(key, value)
+  if interned_values is None:
+    interned_values = {}
+    _interned_metadata[key] = interned_values
+  metadatum = _new_metadatum(key, value)
+  if _interned_metadata_count >= _MAXIMUM_INTERNED_METADATA:
+    _interned_metadata.clear()
+    _interned_metadata_count = 0
+    _interned_metadata[key] = interned_values
+    interned_values.clear()
+  interned_values[value] = metadatum
+  _interned_metadata_count += 1
+  return <tuple>metadatum
 
 
 cdef tuple _metadata(grpc_metadata_array *c_metadata_array):
-  return tuple(
-      _metadatum(
-          c_metadata_array.metadata[index].key,
+  cdef size_t index
+  cdef list metadata = []
+  for index in range(c_metadata_array.count):
+    metadata.append(_metadatum(
+        c_metadata_array.metadata[index].key,
+        c_metadata_array.metadata[index].value))
+  return tuple(metadata)
+
+
+cdef object _as_tuple(object metadata):
+  if isinstance(metadata, _MetadataView):
+    return tuple(metadata)
+  else:
+    return metadata
+
+
+cdef class _MetadataView:
+  """A read-only sequence of received metadata, decoded as it is accessed.
+
+  Compares equal to, and can be concatenated with, tuples of the same
+  metadata. get() and get_all() decode only the items with the given key.
+  """
+
+  def __cinit__(self):
+    self._c_metadata = NULL
+    self._count = 0
+
+  def __dealloc__(self):
+    _release_c_metadata(self._c_metadata, self._count)
+
+  def __len__(self):
+    return self._count
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return tuple(self)[index]
+    if index < 0:
+      index += self._count
+    if not 0 <= index < self._count:
+      raise IndexError('metadata index out of range')
+    return self._item(index)
+
+  def __iter__(self):
+    cdef int index
+    for index in range(self._count):
+      yield self._item(index)
+
+  def __reversed__(self):
+    cdef int index
+    for index in range(self._count - 1, -1, -1):
+      yield self._item(index)
+
+  def __contains__(self, metadatum):
+    return metadatum in tuple(self)
+
+  def __richcmp__(self, other, int op):
+    # Either operand may be the view.
+    left, right = _as_tuple(self), _as_tuple(other)
+    if op == 0:
+      return left < right
+    elif op == 1:
+      return left <= right
+    elif op == 2:
+      return left == right
+    elif op == 3:
+      return left != right
+    elif op == 4:
+      return left > right
+    else:
+      return left >= right
+
+  def __hash__(self):
+    return hash(tuple(self))
+
+  def __add__(self, other):
+    # Either operand may be the view.
+    return _as_tuple(self) + _as_tuple(other)
+
+  def __radd__(self, other):
+    return _as_tuple(other) + tuple(self)
+
+  def __repr__(self):
+    return repr(tuple(self))
+
+  def __reduce__(self):
+    return tuple, (tuple(self),)
+
+  def index(self, metadatum):
+    return tuple(self).index(metadatum)
+
+  def count(self, metadatum):
+    return tuple(self).count(metadatum)
+
+  def get(self, key, default=None):
+    """Returns the value of the first item with the given key, or default."""
+    cdef bytes encoded_key = _encode(key)
+    cdef int index
+    for index in range(self._count):
+      if self._has_key(index, encoded_key):
+        return self._item(index)[1]
+    return default
+
+  def get_all(self, key):
+    """Returns the values of all the items with the given key, in order."""
+    cdef bytes encoded_key = _encode(key)
+    cdef list values = []
+    cdef int index
+    for index in range(self._count):
+      if self._has_key(index, encoded_key):
+        values.append(self._item(index)[1])
+    return tuple(values)
+
+  cdef bint _has_key(self, int index, bytes key):
+    cdef grpc_slice key_slice = self._c_metadata[index].key
+    cdef size_t length = grpc_slice_length(key_slice)
+    return (length == len(key) and
+            memcmp(grpc_slice_start_ptr(key_slice), <char *>key, length) == 0)
+
+  cdef tuple _item(self, int index):
+    cdef tuple metadatum
+    if self._items is None:
+      self._items = [None] * self._count
+    metadatum = self._items[index]
+    if metadatum is None:
+      metadatum = _metadatum(
+          self._c_metadata[index].key, self._c_metadata[index].value)
+      self._items[index] = metadatum
+    return metadatum
+
+
+_Sequence.register(_MetadataView)
+
+
+cdef _MetadataView _metadata_view(grpc_metadata_array *c_metadata_array):
+  """Creates a view of the metadata, which remains valid after both the array
+  and the call that filled it have been destroyed."""
+  cdef _MetadataView view = _MetadataView()
+  cdef int index
+  if c_metadata_array.count:
+    view._c_metadata = <grpc_metadata *>gpr_malloc(
+        c_metadata_array.count * sizeof(grpc_metadata))
+    for index in range(c_metadata_array.count):
+      view._c_metadata[index].key = grpc_slice_ref(
+          c_metadata_array.metadata[index].key)
+      view._c_metadata[index].value = grpc_slice_ref(
           c_metadata_array.metadata[index].value)
-      for index in range(c_metadata_array.count))
+    view._count = c_metadata_array.count
+  return view
@@ -33,9 +33,20 @@ cdef class SendInitialMetadataOperation(Operation):
   cdef void un_c(self) except *
 
 
+# The buffer of a message borrowed by a slice handed to Core.
+cdef struct _MessageBuffer:
+  Py_buffer view
+  _MessageBuffer *next
+
+
+cdef void _release_message_buffer(void *user_data) nogil
+cdef void _drain_released_message_buffers() except *
+
+
 cdef class SendMessageOperation(Operation):
 
-  cdef readonly bytes _message
+  # Any object supporting the buffer protocol.
+  cdef readonly object _message
   cdef readonly int _flags
   cdef grpc_byte_buffer *_c_message_byte_buffer
 
@@ -75,11 +86,18 @@ cdef class ReceiveInitialMetadataOperation(Operation):
   cdef void un_c(self) except *
 
 
+cdef class _SliceView:
+
+  cdef grpc_slice _c_slice
+
+
 cdef class ReceiveMessageOperation(Operation):
 
   cdef readonly int _flags
+  cdef bint _zero_copy
   cdef grpc_byte_buffer *_c_message_byte_buffer
-  cdef bytes _message
+  # A bytes object, or a read-only memoryview in zero-copy mode.
+  cdef object _message
 
   cdef void c(self) except *
   cdef void un_c(self) except *
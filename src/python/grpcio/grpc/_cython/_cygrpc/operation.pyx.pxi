@@ -46,23 +46,89 @@ cdef class SendInitialMetadataOperation(Operation):
         self._c_initial_metadata, self._c_initial_metadata_count)
 
 
-cdef class SendMessageOperation(Operation):
+# Small bytes messages are cheaper to copy than to pin.
+cdef Py_ssize_t _MAXIMUM_COPIED_MESSAGE_BYTES = 16 * 1024
+
+
+# The message buffers whose slices Core has released, waiting for a thread
+# holding the GIL to release them. Core may release slices from any of its
+# threads, including during interpreter finalization, so the slice destructor
+# must not take the GIL.
+cdef gpr_mu _released_message_buffers_mu
+cdef _MessageBuffer *_released_message_buffers = NULL
+gpr_mu_init(&_released_message_buffers_mu)
+
+
+cdef void _release_message_buffer(void *user_data) nogil:
+  global _released_message_buffers
+  cdef _MessageBuffer *message_buffer = <_MessageBuffer *>user_data
+  gpr_mu_lock(&_released_message_buffers_mu)
+  message_buffer.next = _released_message_buffers
+  _released_message_buffers = message_buffer
+  gpr_mu_unlock(&_released_message_buffers_mu)
+
+
+cdef void _drain_released_message_buffers() except *:
+  global _released_message_buffers
+  cdef _MessageBuffer *message_buffer
+  cdef _MessageBuffer *next_message_buffer
+  gpr_mu_lock(&_released_message_buffers_mu)
+  message_buffer = _released_message_buffers
+  _released_message_buffers = NULL
+  gpr_mu_unlock(&_released_message_buffers_mu)
+  while message_buffer != NULL:
+    next_message_buffer = message_buffer.next
+    cpython.PyBuffer_Release(&message_buffer.view)
+    gpr_free(message_buffer)
+    message_buffer = next_message_buffer
+
 
-  def __cinit__(self, bytes message, int flags):
+cdef class SendMessageOperation(Operation):
+  """Sends one message to Core.
+
+  The message may be any object supporting the buffer protocol, e.g. bytes,
+  bytearray, memoryview or mmap. Except for small bytes objects, the message
+  is not copied: the slice handed to Core borrows the object's buffer and holds
+  it until Core releases the slice, which is no earlier than the completion of
+  the batch. Mutable buffers must not be modified in the meantime. Released
+  buffers are given back to their objects the next time a message operation
+  is built or completes.
+  """
+
+  def __cinit__(self, object message, int flags):
     if message is None:
       self._message = b''
-    else:
+    elif cpython.PyObject_CheckBuffer(message):
       self._message = message
+    else:
+      raise TypeError(
+          'Expected a bytes-like message, got {}'.format(type(message)))
     self._flags = flags
 
   def type(self):
     return GRPC_OP_SEND_MESSAGE
 
   cdef void c(self) except *:
+    cdef grpc_slice message_slice
+    cdef _MessageBuffer *message_buffer
+    _drain_released_message_buffers()
     self.c_op.type = GRPC_OP_SEND_MESSAGE
     self.c_op.flags = self._flags
-    cdef grpc_slice message_slice = grpc_slice_from_copied_buffer(
-        self._message, len(self._message))
+    if (type(self._message) is bytes and
+        len(self._message) <= _MAXIMUM_COPIED_MESSAGE_BYTES):
+      message_slice = grpc_slice_from_copied_buffer(
+          self._message, len(self._message))
+    else:
+      message_buffer = <_MessageBuffer *>gpr_malloc(sizeof(_MessageBuffer))
+      try:
+        cpython.PyObject_GetBuffer(
+            self._message, &message_buffer.view, cpython.PyBUF_SIMPLE)
+      except:
+        gpr_free(message_buffer)
+        raise
+      message_slice = grpc_slice_new_with_user_data(
+          message_buffer.view.buf, message_buffer.view.len,
+          _release_message_buffer, message_buffer)
     self._c_message_byte_buffer = grpc_raw_byte_buffer_create(
         &message_slice, 1)
     grpc_slice_unref(message_slice)
@@ -70,6 +136,7 @@ cdef class SendMessageOperation(Operation):
 
   cdef void un_c(self) except *:
     grpc_byte_buffer_destroy(self._c_message_byte_buffer)
+    _drain_released_message_buffers()
 
 
 cdef class SendCloseFromClientOperation(Operation):
@@ -142,10 +209,65 @@ cdef class ReceiveInitialMetadataOperation(Operation):
     return self._initial_metadata
 
 
+cdef class _SliceView:
+  """Exposes a single Core slice through the buffer protocol.
+
+  The view holds a reference on the slice until it is deallocated, so any
+  memoryview created over it remains valid after the originating byte buffer
+  has been destroyed.
+  """
+
+  def __cinit__(self):
+    self._c_slice = grpc_empty_slice()
+
+  def __getbuffer__(self, Py_buffer *buffer, int flags):
+    cpython.PyBuffer_FillInfo(
+        buffer, self, grpc_slice_start_ptr(self._c_slice),
+        grpc_slice_length(self._c_slice), 1, flags)
+
+  def __releasebuffer__(self, Py_buffer *buffer):
+    pass
+
+  def __dealloc__(self):
+    grpc_slice_unref(self._c_slice)
+
+
+cdef object _byte_buffer_view(grpc_byte_buffer *c_byte_buffer):
+  cdef grpc_byte_buffer_reader reader
+  cdef grpc_slice first_slice
+  cdef grpc_slice second_slice
+  cdef _SliceView view
+  if not grpc_byte_buffer_reader_init(&reader, c_byte_buffer):
+    return None
+  view = _SliceView()
+  if not grpc_byte_buffer_reader_next(&reader, &first_slice):
+    pass
+  elif not grpc_byte_buffer_reader_next(&reader, &second_slice):
+    # The common case: the whole message lives in one slice, which is shared
+    # with Core rather than copied.
+    view._c_slice = first_slice
+  else:
+    # Fragmented messages are flattened with a single copy.
+    grpc_slice_unref(first_slice)
+    grpc_slice_unref(second_slice)
+    grpc_byte_buffer_reader_destroy(&reader)
+    if not grpc_byte_buffer_reader_init(&reader, c_byte_buffer):
+      return None
+    view._c_slice = grpc_byte_buffer_reader_readall(&reader)
+  grpc_byte_buffer_reader_destroy(&reader)
+  return memoryview(view)
+
+
 cdef class ReceiveMessageOperation(Operation):
+  """Receives one message from Core.
 
-  def __cinit__(self, flags):
+  In zero-copy mode the message is a read-only memoryview backed by Core's
+  slices instead of a bytes object.
+  """
+
+  def __cinit__(self, flags, zero_copy=False):
     self._flags = flags
+    self._zero_copy = zero_copy
 
   def type(self):
     return GRPC_OP_RECV_MESSAGE
@@ -163,19 +285,22 @@ cdef class ReceiveMessageOperation(Operation):
     cdef size_t message_slice_length
     cdef void *message_slice_pointer
     if self._c_message_byte_buffer != NULL:
-      message_reader_status = grpc_byte_buffer_reader_init(
-          &message_reader, self._c_message_byte_buffer)
-      if message_reader_status:
-        message = bytearray()
-        while grpc_byte_buffer_reader_next(&message_reader, &message_slice):
-          message_slice_pointer = grpc_slice_start_ptr(message_slice)
-          message_slice_length = grpc_slice_length(message_slice)
-          message += (<char *>message_slice_pointer)[:message_slice_length]
-          grpc_slice_unref(message_slice)
-        grpc_byte_buffer_reader_destroy(&message_reader)
-        self._message = bytes(message)
+      if self._zero_copy:
+        self._message = _byte_buffer_view(self._c_message_byte_buffer)
       else:
-        self._message = None
+        message_reader_status = grpc_byte_buffer_reader_init(
+            &message_reader, self._c_message_byte_buffer)
+        if message_reader_status:
+          message = bytearray()
+          while grpc_byte_buffer_reader_next(&message_reader, &message_slice):
+            message_slice_pointer = grpc_slice_start_ptr(message_slice)
+            message_slice_length = grpc_slice_length(message_slice)
+            message += (<char *>message_slice_pointer)[:message_slice_length]
+            grpc_slice_unref(message_slice)
+          grpc_byte_buffer_reader_destroy(&message_reader)
+          self._message = bytes(message)
+        else:
+          self._message = None
       grpc_byte_buffer_destroy(self._c_message_byte_buffer)
     else:
       self._message = None
@@ -202,6 +327,9 @@ cdef class ReceiveStatusOnClientOperation(Operation):
         &self._c_code)
     self.c_op.data.receive_status_on_client.status_details = (
         &self._c_details)
+    # NOTE: Core leaves the error string untouched when there is none, and a
+    # pooled operation is filled in again after its previous string was freed.
+    self._c_error_string = NULL
     self.c_op.data.receive_status_on_client.error_string = (
         &self._c_error_string)
 
@@ -214,6 +342,7 @@ cdef class ReceiveStatusOnClientOperation(Operation):
     if self._c_error_string != NULL:
       self._error_string = _decode(self._c_error_string)
       gpr_free(<void*>self._c_error_string)
+      self._c_error_string = NULL
     else:
       self._error_string = ""
 
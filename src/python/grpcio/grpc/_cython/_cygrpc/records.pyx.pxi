@@ -151,6 +151,10 @@ cdef class CallDetails:
   def deadline(self):
     return _time_from_timespec(self.c_details.deadline)
 
+  @property
+  def monotonic_deadline(self):
+    return _monotonic_time_from_timespec(self.c_details.deadline)
+
 
 cdef class SslPemKeyCertPair:
 
@@ -41,7 +41,8 @@ cdef class _RequestCallTag(_Tag):
     grpc_metadata_array_init(&self.c_invocation_metadata)
 
   cdef RequestCallEvent event(self, grpc_event c_event):
-    cdef tuple invocation_metadata = _metadata(&self.c_invocation_metadata)
+    cdef _MetadataView invocation_metadata = _metadata_view(
+        &self.c_invocation_metadata)
     grpc_metadata_array_destroy(&self.c_invocation_metadata)
     return RequestCallEvent(
         c_event.type, c_event.success, self._user_tag, self.call,
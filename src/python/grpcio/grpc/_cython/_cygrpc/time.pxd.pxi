@@ -17,3 +17,9 @@ cdef gpr_timespec _timespec_from_time(object time) except *
 
 
 cdef double _time_from_timespec(gpr_timespec timespec) except *
+
+
+cdef gpr_timespec _timespec_from_monotonic_time(object time) except *
+
+
+cdef double _monotonic_time_from_timespec(gpr_timespec timespec) except *
@@ -27,3 +27,34 @@ cdef double _time_from_timespec(gpr_timespec timespec) except *:
   cdef gpr_timespec real_timespec = gpr_convert_clock_type(
       timespec, GPR_CLOCK_REALTIME)
   return gpr_timespec_to_micros(real_timespec) / GPR_US_PER_SEC
+
+
+# Times beyond this many nanoseconds overflow Core's representation, as do
+# deadlines derived from the remaining time of RPCs without a deadline.
+cdef double _MAXIMUM_NANOSECONDS = 9.2e18
+
+
+cdef gpr_timespec _timespec_from_monotonic_time(object time) except *:
+  cdef double nanoseconds
+  if time is None:
+    return gpr_inf_future(GPR_CLOCK_MONOTONIC)
+  nanoseconds = <double>time * GPR_NS_PER_SEC
+  if nanoseconds >= _MAXIMUM_NANOSECONDS:
+    return gpr_inf_future(GPR_CLOCK_MONOTONIC)
+  else:
+    return gpr_time_from_nanos(<int64_t>nanoseconds, GPR_CLOCK_MONOTONIC)
+
+
+cdef double _monotonic_time_from_timespec(gpr_timespec timespec) except *:
+  cdef gpr_timespec monotonic_timespec = gpr_convert_clock_type(
+      timespec, GPR_CLOCK_MONOTONIC)
+  return gpr_timespec_to_micros(monotonic_timespec) / GPR_US_PER_SEC
+
+
+def monotonic_time():
+  """Returns the current time in seconds on Core's monotonic clock.
+
+  Deadlines on this clock are handed to Core without conversion and are not
+  affected by changes to the system's wall clock.
+  """
+  return _monotonic_time_from_timespec(gpr_now(GPR_CLOCK_MONOTONIC))
@@ -0,0 +1,87 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Propagation of deadlines to the RPCs made while servicing an RPC."""
+
+import threading
+import time
+
+from grpc._cython import cygrpc
+
+
+class _PropagatedDeadline(threading.local):
+    """The deadline, on the clock of cygrpc.monotonic_time, propagated to the
+    RPCs made by the current thread, or None."""
+    deadline = None
+
+
+_propagated_deadline = _PropagatedDeadline()
+
+
+def parent_deadline():
+    """Returns the deadline bounding the RPCs made by the current thread.
+
+    A deadline propagated explicitly takes precedence over any found in the
+    tracing context, whose lookup it thereby saves.
+    """
+    propagated_deadline = _propagated_deadline.deadline
+    if propagated_deadline is not None:
+        return propagated_deadline
+    context_deadline = cygrpc.get_deadline_from_context()
+    if context_deadline is None:
+        return None
+    else:
+        return cygrpc.monotonic_time() + context_deadline - time.time()
+
+
+class _DeadlinePropagation(object):
+
+    def __init__(self, deadline):
+        self._deadline = deadline
+        self._enclosing_deadline = None
+
+    def __enter__(self):
+        self._enclosing_deadline = _propagated_deadline.deadline
+        if self._enclosing_deadline is not None and (
+                self._deadline is None or
+                self._enclosing_deadline < self._deadline):
+            _propagated_deadline.deadline = self._enclosing_deadline
+        else:
+            _propagated_deadline.deadline = self._deadline
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _propagated_deadline.deadline = self._enclosing_deadline
+        return False
+
+
+def propagate_deadline(servicer_context):
+    """Bounds the RPCs made by the current thread by the deadline of an RPC.
+
+    This is an EXPERIMENTAL API.
+
+    Within the returned context manager, every RPC made on the current thread
+    by a synchronous channel has the earlier of its own deadline and that of
+    the RPC being serviced. The remaining time of the serviced RPC is read
+    once, by this function, rather than for each RPC made.
+
+    Args:
+      servicer_context: The grpc.ServicerContext of the RPC being serviced.
+
+    Returns:
+      A context manager within which the deadline is propagated.
+    """
+    time_remaining = servicer_context.time_remaining()
+    return _DeadlinePropagation(
+        None if time_remaining is None else cygrpc.monotonic_time() +
+        time_remaining)
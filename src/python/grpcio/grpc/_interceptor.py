@@ -18,11 +18,56 @@ import sys
 
 import grpc
 
+_MAXIMUM_CACHED_METHOD_HANDLERS = 1024
+
+
+def _is_method_scoped(interceptor):
+    return getattr(interceptor, 'method_scoped', False)
+
+
+class MethodHandlerCache(object):
+    """The handlers returned by method-scoped interceptors for each method.
+
+    The handlers are keyed by the method as bytes, so a cached handler is
+    found without decoding the method or building handler call details. They
+    are only valid for the routing table of the server's generic handlers
+    they were computed with, and are dropped when the table is recompiled.
+    Servers whose generic handlers cannot be tabulated may look at the
+    invocation metadata and so cannot use the cache.
+    """
+
+    def __init__(self):
+        # The routing table and the handlers computed with it, replaced
+        # together so that a handler is never filed under another table.
+        self._entries = (None, {})
+
+    def get(self, method, method_handler_routes):
+        routes, method_handlers = self._entries
+        if routes is not method_handler_routes:
+            self._entries = (method_handler_routes, {})
+            return None
+        return method_handlers.get(method)
+
+    def put(self, method, method_handler_routes, method_handler):
+        routes, method_handlers = self._entries
+        if (routes is method_handler_routes and method_handler is not None and
+                len(method_handlers) < _MAXIMUM_CACHED_METHOD_HANDLERS):
+            method_handlers[method] = method_handler
+
+
+def method_handler_cache(interceptors):
+    if interceptors and all(
+            _is_method_scoped(interceptor) for interceptor in interceptors):
+        return MethodHandlerCache()
+    else:
+        return None
+
 
 class _ServicePipeline(object):
 
     def __init__(self, interceptors):
         self.interceptors = tuple(interceptors)
+        self.method_handlers = method_handler_cache(self.interceptors)
 
     def _continuation(self, thunk, index):
         return lambda context: self._intercept_at(thunk, index, context)
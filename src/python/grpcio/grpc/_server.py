@@ -23,15 +23,17 @@ from concurrent import futures
 import six
 
 import grpc
+import grpc.experimental
+from grpc.experimental import _PYTHON_SERVER_OPTIONS
 from grpc import _common
 from grpc import _compression
 from grpc import _interceptor
+from grpc import _utilities
 from grpc._cython import cygrpc
 
 _LOGGER = logging.getLogger(__name__)
 
 _SHUTDOWN_TAG = 'shutdown'
-_REQUEST_CALL_TAG = 'request_call'
 
 _RECEIVE_CLOSE_ON_SERVER_TOKEN = 'receive_close_on_server'
 _SEND_INITIAL_METADATA_TOKEN = 'send_initial_metadata'
@@ -52,6 +54,9 @@ _EMPTY_FLAGS = 0
 _DEALLOCATED_SERVER_CHECK_PERIOD_S = 1.0
 _INF_TIMEOUT = 1e9
 
+_DEFAULT_PENDING_REQUEST_CALLS = 1
+_DEFAULT_COMPLETION_QUEUE_POLLERS = 1
+
 
 def _serialized_request(request_event):
     return request_event.batch_operations[0].message()
@@ -90,7 +95,7 @@ class _HandlerCallDetails(
 
 class _RPCState(object):
 
-    def __init__(self):
+    def __init__(self, zero_copy_receive=False):
         self.condition = threading.Condition()
         self.due = set()
         self.request = None
@@ -105,6 +110,7 @@ class _RPCState(object):
         self.rpc_errors = []
         self.callbacks = []
         self.aborted = False
+        self.zero_copy_receive = zero_copy_receive
 
 
 def _raise_rpc_error(state):
@@ -246,7 +252,9 @@ class _Context(grpc.ServicerContext):
             return _is_rpc_state_active(self._state)
 
     def time_remaining(self):
-        return max(self._rpc_event.call_details.deadline - time.time(), 0)
+        return max(
+            self._rpc_event.call_details.monotonic_deadline -
+            cygrpc.monotonic_time(), 0)
 
     def cancel(self):
         self._rpc_event.call.cancel()
@@ -357,7 +365,8 @@ class _RequestIterator(object):
             raise StopIteration()
         else:
             self._call.start_server_batch(
-                (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+                (cygrpc.ReceiveMessageOperation(
+                    _EMPTY_FLAGS, self._state.zero_copy_receive),),
                 _receive_message(self._state, self._call,
                                  self._request_deserializer))
             self._state.due.add(_RECEIVE_MESSAGE_TOKEN)
@@ -402,7 +411,8 @@ def _unary_request(rpc_event, state, request_deserializer):
                 return None
             else:
                 rpc_event.call.start_server_batch(
-                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS,
+                                                    state.zero_copy_receive),),
                     _receive_message(state, rpc_event.call,
                                      request_deserializer))
                 state.due.add(_RECEIVE_MESSAGE_TOKEN)
@@ -677,22 +687,44 @@ def _handle_stream_stream(rpc_event, state, method_handler,
                               method_handler.response_serializer)
 
 
-def _find_method_handler(rpc_event, generic_handlers, interceptor_pipeline):
-
-    def query_handlers(handler_call_details):
-        for generic_handler in generic_handlers:
-            method_handler = generic_handler.service(handler_call_details)
+def _find_method_handler(rpc_event, generic_handlers, method_handler_routes,
+                         interceptor_pipeline):
+    if method_handler_routes is not None:
+        if interceptor_pipeline is None:
+            return method_handler_routes.get(rpc_event.call_details.method)
+        method_handlers = interceptor_pipeline.method_handlers
+        if method_handlers is not None:
+            method_handler = method_handlers.get(rpc_event.call_details.method,
+                                                 method_handler_routes)
             if method_handler is not None:
                 return method_handler
-        return None
+
+        def query_handlers(handler_call_details):
+            return method_handler_routes.get(
+                _common.encode(handler_call_details.method))
+    else:
+        # Generic handlers that cannot be tabulated may look at the
+        # invocation metadata, so their results are not cached.
+        method_handlers = None
+
+        def query_handlers(handler_call_details):
+            for generic_handler in generic_handlers:
+                method_handler = generic_handler.service(handler_call_details)
+                if method_handler is not None:
+                    return method_handler
+            return None
 
     handler_call_details = _HandlerCallDetails(
         _common.decode(rpc_event.call_details.method),
         rpc_event.invocation_metadata)
 
     if interceptor_pipeline is not None:
-        return interceptor_pipeline.execute(query_handlers,
-                                            handler_call_details)
+        method_handler = interceptor_pipeline.execute(query_handlers,
+                                                      handler_call_details)
+        if method_handlers is not None:
+            method_handlers.put(rpc_event.call_details.method,
+                                method_handler_routes, method_handler)
+        return method_handler
     else:
         return query_handlers(handler_call_details)
 
@@ -712,8 +744,9 @@ def _reject_rpc(rpc_event, status, details):
     return rpc_state
 
 
-def _handle_with_method_handler(rpc_event, method_handler, thread_pool):
-    state = _RPCState()
+def _handle_with_method_handler(rpc_event, method_handler, thread_pool,
+                                zero_copy_receive):
+    state = _RPCState(zero_copy_receive)
     with state.condition:
         rpc_event.call.start_server_batch(
             (cygrpc.ReceiveCloseOnServerOperation(_EMPTY_FLAGS),),
@@ -735,13 +768,15 @@ def _handle_with_method_handler(rpc_event, method_handler, thread_pool):
                                                   method_handler, thread_pool)
 
 
-def _handle_call(rpc_event, generic_handlers, interceptor_pipeline, thread_pool,
-                 concurrency_exceeded):
+def _handle_call(rpc_event, generic_handlers, method_handler_routes,
+                 interceptor_pipeline, thread_pool, concurrency_exceeded,
+                 zero_copy_receive):
     if not rpc_event.success:
         return None, None
     if rpc_event.call_details.method is not None:
         try:
             method_handler = _find_method_handler(rpc_event, generic_handlers,
+                                                  method_handler_routes,
                                                   interceptor_pipeline)
         except Exception as exception:  # pylint: disable=broad-except
             details = 'Exception servicing handler: {}'.format(exception)
@@ -756,11 +791,15 @@ def _handle_call(rpc_event, generic_handlers, interceptor_pipeline, thread_pool,
                                b'Concurrent RPC limit exceeded!'), None
         else:
             return _handle_with_method_handler(rpc_event, method_handler,
-                                               thread_pool)
+                                               thread_pool, zero_copy_receive)
     else:
         return None, None
 
 
+class _RequestCallTag(object):
+    """Identifies one of the request_call operations kept pending in Core."""
+
+
 @enum.unique
 class _ServerStage(enum.Enum):
     STOPPED = 'stopped'
@@ -768,15 +807,40 @@ class _ServerStage(enum.Enum):
     GRACE = 'grace'
 
 
+class _ServerShard(object):
+    """A completion queue of the server along with the calls it serves.
+
+    Each shard is polled by its own thread. Calls are requested on, and report
+    their events to, the completion queue of a single shard, so bookkeeping
+    for them only takes that shard's lock.
+    """
+
+    def __init__(self, completion_queue, pending_request_calls):
+        self.lock = threading.Lock()
+        self.completion_queue = completion_queue
+        self.request_call_tags = tuple(
+            _RequestCallTag() for _ in range(pending_request_calls))
+
+        # TODO(https://github.com/grpc/grpc/issues/6597): eliminate these fields.
+        self.rpc_states = set()
+        self.due = set()
+
+
 class _ServerState(object):
 
     # pylint: disable=too-many-arguments
-    def __init__(self, completion_queue, server, generic_handlers,
-                 interceptor_pipeline, thread_pool, maximum_concurrent_rpcs):
+    def __init__(self, completion_queues, server, generic_handlers,
+                 interceptor_pipeline, thread_pool, maximum_concurrent_rpcs,
+                 zero_copy_receive, pending_request_calls):
         self.lock = threading.RLock()
-        self.completion_queue = completion_queue
+        self.shards = tuple(
+            _ServerShard(completion_queue, pending_request_calls)
+            for completion_queue in completion_queues)
         self.server = server
         self.generic_handlers = list(generic_handlers)
+        # Compiled from generic_handlers when the server starts; None when
+        # they have to be queried one at a time.
+        self.method_handler_routes = None
         self.interceptor_pipeline = interceptor_pipeline
         self.thread_pool = thread_pool
         self.stage = _ServerStage.STOPPED
@@ -784,18 +848,21 @@ class _ServerState(object):
         self.shutdown_events = [self.termination_event]
         self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
         self.active_rpc_count = 0
+        self.zero_copy_receive = zero_copy_receive
 
-        # TODO(https://github.com/grpc/grpc/issues/6597): eliminate these fields.
-        self.rpc_states = set()
+        # Only ever holds _SHUTDOWN_TAG; calls are tracked by their shard.
         self.due = set()
 
-        # A "volatile" flag to interrupt the daemon serving thread
+        # A "volatile" flag to interrupt the daemon serving threads
         self.server_deallocated = False
 
 
 def _add_generic_handlers(state, generic_handlers):
     with state.lock:
         state.generic_handlers.extend(generic_handlers)
+        if state.stage is not _ServerStage.STOPPED:
+            state.method_handler_routes = _utilities.method_handler_routes(
+                state.generic_handlers)
 
 
 def _add_insecure_port(state, address):
@@ -809,22 +876,29 @@ def _add_secure_port(state, address, server_credentials):
                                            server_credentials._credentials)
 
 
-def _request_call(state):
-    state.server.request_call(state.completion_queue, state.completion_queue,
-                              _REQUEST_CALL_TAG)
-    state.due.add(_REQUEST_CALL_TAG)
+def _request_call(state, shard, tag):
+    state.server.request_call(shard.completion_queue, shard.completion_queue,
+                              tag)
+    shard.due.add(tag)
 
 
 # TODO(https://github.com/grpc/grpc/issues/6597): delete this function.
 def _stop_serving(state):
-    if not state.rpc_states and not state.due:
-        state.server.destroy()
-        for shutdown_event in state.shutdown_events:
-            shutdown_event.set()
-        state.stage = _ServerStage.STOPPED
+    # Must be called with state.lock held. Shard locks are only ever acquired
+    # after state.lock, never the other way around.
+    if state.stage is _ServerStage.STOPPED:
         return True
-    else:
+    if state.due:
         return False
+    for shard in state.shards:
+        with shard.lock:
+            if shard.rpc_states or shard.due:
+                return False
+    state.server.destroy()
+    for shutdown_event in state.shutdown_events:
+        shutdown_event.set()
+    state.stage = _ServerStage.STOPPED
+    return True
 
 
 def _on_call_completed(state):
@@ -832,33 +906,56 @@ def _on_call_completed(state):
         state.active_rpc_count -= 1
 
 
-def _process_event_and_continue(state, event):
-    should_continue = True
+def _reserve_rpc(state):
+    """Counts a new RPC against maximum_concurrent_rpcs.
+
+    Returns:
+      True if the RPC was counted, False if the limit has been reached.
+    """
+    with state.lock:
+        if state.active_rpc_count >= state.maximum_concurrent_rpcs:
+            return False
+        state.active_rpc_count += 1
+        return True
+
+
+def _process_request_call(state, shard, event):
+    if state.maximum_concurrent_rpcs is None:
+        reserved = False
+        concurrency_exceeded = False
+    else:
+        reserved = _reserve_rpc(state)
+        concurrency_exceeded = not reserved
+    with shard.lock:
+        shard.due.remove(event.tag)
+        rpc_state, rpc_future = _handle_call(event, state.generic_handlers,
+                                             state.method_handler_routes,
+                                             state.interceptor_pipeline,
+                                             state.thread_pool,
+                                             concurrency_exceeded,
+                                             state.zero_copy_receive)
+        if rpc_state is not None:
+            shard.rpc_states.add(rpc_state)
+        serving = state.stage is _ServerStage.STARTED
+        if serving:
+            _request_call(state, shard, event.tag)
+    if reserved:
+        if rpc_future is None:
+            _on_call_completed(state)
+        else:
+            rpc_future.add_done_callback(
+                lambda unused_future: _on_call_completed(state))
+    return serving
+
+
+def _process_event_and_continue(state, shard, event):
     if event.tag is _SHUTDOWN_TAG:
         with state.lock:
             state.due.remove(_SHUTDOWN_TAG)
-            if _stop_serving(state):
-                should_continue = False
-    elif event.tag is _REQUEST_CALL_TAG:
-        with state.lock:
-            state.due.remove(_REQUEST_CALL_TAG)
-            concurrency_exceeded = (
-                state.maximum_concurrent_rpcs is not None and
-                state.active_rpc_count >= state.maximum_concurrent_rpcs)
-            rpc_state, rpc_future = _handle_call(event, state.generic_handlers,
-                                                 state.interceptor_pipeline,
-                                                 state.thread_pool,
-                                                 concurrency_exceeded)
-            if rpc_state is not None:
-                state.rpc_states.add(rpc_state)
-            if rpc_future is not None:
-                state.active_rpc_count += 1
-                rpc_future.add_done_callback(
-                    lambda unused_future: _on_call_completed(state))
-            if state.stage is _ServerStage.STARTED:
-                _request_call(state)
-            elif _stop_serving(state):
-                should_continue = False
+            return not _stop_serving(state)
+    elif isinstance(event.tag, _RequestCallTag):
+        if _process_request_call(state, shard, event):
+            return True
     else:
         rpc_state, callbacks = event.tag(event)
         for callback in callbacks:
@@ -866,23 +963,28 @@ def _process_event_and_continue(state, event):
                 callback()
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception('Exception calling callback!')
-        if rpc_state is not None:
-            with state.lock:
-                state.rpc_states.remove(rpc_state)
-                if _stop_serving(state):
-                    should_continue = False
-    return should_continue
+        if rpc_state is None:
+            return True
+        with shard.lock:
+            shard.rpc_states.remove(rpc_state)
+        if state.stage is _ServerStage.STARTED:
+            return True
+    with state.lock:
+        return not _stop_serving(state)
 
 
-def _serve(state):
+def _serve(state, shard):
     while True:
         timeout = time.time() + _DEALLOCATED_SERVER_CHECK_PERIOD_S
-        event = state.completion_queue.poll(timeout)
+        event = shard.completion_queue.poll(timeout)
         if state.server_deallocated:
             _begin_shutdown_once(state)
         if event.completion_type != cygrpc.CompletionType.queue_timeout:
-            if not _process_event_and_continue(state, event):
+            if not _process_event_and_continue(state, shard, event):
                 return
+        elif state.stage is _ServerStage.STOPPED:
+            # Another shard completed the shutdown of the server.
+            return
         # We want to force the deletion of the previous event
         # ~before~ we poll again; if the event has a reference
         # to a shutdown Call object, this can induce spinlock.
@@ -892,7 +994,8 @@ def _serve(state):
 def _begin_shutdown_once(state):
     with state.lock:
         if state.stage is _ServerStage.STARTED:
-            state.server.shutdown(state.completion_queue, _SHUTDOWN_TAG)
+            state.server.shutdown(state.shards[0].completion_queue,
+                                  _SHUTDOWN_TAG)
             state.stage = _ServerStage.GRACE
             state.due.add(_SHUTDOWN_TAG)
 
@@ -927,13 +1030,18 @@ def _start(state):
     with state.lock:
         if state.stage is not _ServerStage.STOPPED:
             raise ValueError('Cannot start already-started server!')
+        state.method_handler_routes = _utilities.method_handler_routes(
+            state.generic_handlers)
         state.server.start()
         state.stage = _ServerStage.STARTED
-        _request_call(state)
+        for shard in state.shards:
+            for tag in shard.request_call_tags:
+                _request_call(state, shard, tag)
 
-        thread = threading.Thread(target=_serve, args=(state,))
-        thread.daemon = True
-        thread.start()
+        for shard in state.shards:
+            thread = threading.Thread(target=_serve, args=(state, shard))
+            thread.daemon = True
+            thread.start()
 
 
 def _validate_generic_rpc_handlers(generic_rpc_handlers):
@@ -955,12 +1063,32 @@ class _Server(grpc.Server):
     # pylint: disable=too-many-arguments
     def __init__(self, thread_pool, generic_handlers, interceptors, options,
                  maximum_concurrent_rpcs, compression, xds):
-        completion_queue = cygrpc.CompletionQueue()
-        server = cygrpc.Server(_augment_options(options, compression), xds)
-        server.register_completion_queue(completion_queue)
-        self._state = _ServerState(completion_queue, server, generic_handlers,
+        python_options, core_options = _common.separate_options(
+            options, _PYTHON_SERVER_OPTIONS)
+        if (grpc.experimental.ServerOptions.MaximumConcurrentRpcsPerMethod
+                in python_options):
+            raise ValueError(
+                'MaximumConcurrentRpcsPerMethod is only supported by AsyncIO '
+                'servers')
+        zero_copy_receive = bool(
+            python_options.get(grpc.experimental.ChannelOptions.ZeroCopyReceive,
+                               False))
+        pending_request_calls = _common.integer_option(
+            python_options, grpc.experimental.ServerOptions.PendingRequestCalls,
+            _DEFAULT_PENDING_REQUEST_CALLS, 1)
+        completion_queue_pollers = _common.integer_option(
+            python_options,
+            grpc.experimental.ServerOptions.CompletionQueuePollers,
+            _DEFAULT_COMPLETION_QUEUE_POLLERS, 1)
+        completion_queues = tuple(
+            cygrpc.CompletionQueue() for _ in range(completion_queue_pollers))
+        server = cygrpc.Server(_augment_options(core_options, compression), xds)
+        for completion_queue in completion_queues:
+            server.register_completion_queue(completion_queue)
+        self._state = _ServerState(completion_queues, server, generic_handlers,
                                    _interceptor.service_pipeline(interceptors),
-                                   thread_pool, maximum_concurrent_rpcs)
+                                   thread_pool, maximum_concurrent_rpcs,
+                                   zero_copy_receive, pending_request_calls)
 
     def add_generic_rpc_handlers(self, generic_rpc_handlers):
         _validate_generic_rpc_handlers(generic_rpc_handlers)
@@ -18,8 +18,9 @@ import datetime
 import os
 import logging
 import threading
-from typing import (Any, AnyStr, Callable, Dict, Iterator, Optional, Sequence,
-                    Tuple, TypeVar, Union)
+import time
+from typing import (Any, AnyStr, Callable, Dict, Iterator, List, NamedTuple,
+                    Optional, Sequence, Tuple, TypeVar, Union)
 
 import grpc
 from grpc.experimental import experimental_api
@@ -41,6 +42,7 @@ if _EVICTION_PERIOD_KEY in os.environ:
                   _EVICTION_PERIOD)
 else:
     _EVICTION_PERIOD = datetime.timedelta(minutes=10)
+_EVICTION_PERIOD_SECONDS = _EVICTION_PERIOD.total_seconds()
 
 _MAXIMUM_CHANNELS_KEY = "GRPC_PYTHON_MANAGED_CHANNEL_MAXIMUM"
 if _MAXIMUM_CHANNELS_KEY in os.environ:
@@ -56,6 +58,14 @@ if _DEFAULT_TIMEOUT_KEY in os.environ:
 else:
     _DEFAULT_TIMEOUT = 60.0
 
+# The number of independently locked partitions of the channel cache.
+_CACHE_SHARDS = 16
+# The number of cache keys kept for reuse by later lookups.
+_MAXIMUM_REUSED_CACHE_KEYS = 4 * _MAXIMUM_CHANNELS
+
+_default_ssl_channel_credentials_lock = threading.Lock()
+_default_ssl_channel_credentials = None
+
 
 def _create_channel(target: str, options: Sequence[Tuple[str, str]],
                     channel_credentials: Optional[grpc.ChannelCredentials],
@@ -69,100 +79,429 @@ def _create_channel(target: str, options: Sequence[Tuple[str, str]],
                                compression=compression)
 
 
+def _channel_credentials(channel_credentials: Optional[grpc.ChannelCredentials],
+                         insecure: bool) -> grpc.ChannelCredentials:
+    global _default_ssl_channel_credentials
+    if insecure and channel_credentials:
+        raise ValueError("The insecure option is mutually exclusive with " +
+                         "the channel_credentials option. Please use one " +
+                         "or the other.")
+    if insecure:
+        return grpc.experimental.insecure_channel_credentials()
+    elif channel_credentials is None:
+        _LOGGER.debug("Defaulting to SSL channel credentials.")
+        # Like the insecure credentials, the default credentials are a single
+        # object so that their channels are found in the cache.
+        with _default_ssl_channel_credentials_lock:
+            if _default_ssl_channel_credentials is None:
+                _default_ssl_channel_credentials = grpc.ssl_channel_credentials(
+                )
+            return _default_ssl_channel_credentials
+    else:
+        return channel_credentials
+
+
+class _CacheKey:
+    """A channel configuration whose hash is computed only once."""
+    configuration: CacheKey
+    hash: int
+    # The options object the key was built from, kept alive so that its id
+    # identifies it for as long as the key is reused.
+    given_options: OptionsType
+
+    def __init__(self, configuration: CacheKey, given_options: OptionsType):
+        self.configuration = configuration
+        self.hash = hash(configuration)
+        self.given_options = given_options
+
+    def __hash__(self) -> int:
+        return self.hash
+
+    def __eq__(self, other: Any) -> bool:
+        return (self.hash == other.hash and
+                self.configuration == other.configuration)
+
+    def __repr__(self) -> str:
+        return repr(self.configuration)
+
+
+class _CacheShard:
+    """A partition of the channel cache guarded by its own lock."""
+    lock: threading.Lock
+    # The unpinned channels, from the least to the most recently used, each
+    # with its eviction time on the time.monotonic clock.
+    channels: Dict[_CacheKey, List[Any]]
+    pinned_channels: Dict[_CacheKey, grpc.Channel]
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.channels = collections.OrderedDict()
+        self.pinned_channels = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def oldest_eviction_time(self) -> Optional[float]:
+        if self.channels:
+            return next(iter(self.channels.values()))[1]
+        else:
+            return None
+
+    def evict_oldest(self) -> Tuple[_CacheKey, grpc.Channel]:
+        key, (channel, _) = self.channels.popitem(last=False)
+        self.evictions += 1
+        return key, channel
+
+
+class ChannelCacheStats(NamedTuple):
+    """Counters describing the channel cache backing the simple stubs.
+
+    This is an EXPERIMENTAL API.
+
+    Attributes:
+      hits: The number of lookups that found a cached channel.
+      misses: The number of lookups that created a channel.
+      evictions: The number of channels closed by the cache.
+      channels: The number of channels currently cached and not pinned.
+      pinned_channels: The number of channels currently pinned.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    channels: int
+    pinned_channels: int
+
+
 class ChannelCache:
     # NOTE(rbellevi): Untyped due to reference cycle.
     _singleton = None
-    _lock: threading.RLock = threading.RLock()
-    _condition: threading.Condition = threading.Condition(lock=_lock)
-    _eviction_ready: threading.Event = threading.Event()
-
-    _mapping: Dict[CacheKey, Tuple[grpc.Channel, datetime.datetime]]
+    _lock: threading.Lock = threading.Lock()
+
+    _shards: Tuple[_CacheShard, ...]
+    # Maps the target, the id of the given options, the credentials and the
+    # compression of a lookup to its key, so that lookups with the same
+    # options object hash neither the options nor a new key.
+    _keys: Dict[Tuple[str, int, grpc.ChannelCredentials,
+                      Optional[grpc.Compression]], _CacheKey]
+    _eviction_due: threading.Event
     _eviction_thread: threading.Thread
 
     def __init__(self):
-        self._mapping = collections.OrderedDict()
-        self._eviction_thread = threading.Thread(
-            target=ChannelCache._perform_evictions, daemon=True)
+        self._shards = tuple(_CacheShard() for _ in range(_CACHE_SHARDS))
+        self._keys = {}
+        self._eviction_due = threading.Event()
+        self._eviction_thread = threading.Thread(target=self._perform_evictions,
+                                                 daemon=True)
         self._eviction_thread.start()
 
     @staticmethod
     def get():
-        with ChannelCache._lock:
-            if ChannelCache._singleton is None:
-                ChannelCache._singleton = ChannelCache()
-        ChannelCache._eviction_ready.wait()
-        return ChannelCache._singleton
-
-    def _evict_locked(self, key: CacheKey):
-        channel, _ = self._mapping.pop(key)
-        _LOGGER.debug("Evicting channel %s with configuration %s.", channel,
-                      key)
-        channel.close()
-        del channel
-
-    @staticmethod
-    def _perform_evictions():
-        while True:
+        singleton = ChannelCache._singleton
+        if singleton is None:
             with ChannelCache._lock:
-                ChannelCache._eviction_ready.set()
-                if not ChannelCache._singleton._mapping:
-                    ChannelCache._condition.wait()
-                elif len(ChannelCache._singleton._mapping) > _MAXIMUM_CHANNELS:
-                    key = next(iter(ChannelCache._singleton._mapping.keys()))
-                    ChannelCache._singleton._evict_locked(key)
-                    # And immediately reevaluate.
-                else:
-                    key, (_, eviction_time) = next(
-                        iter(ChannelCache._singleton._mapping.items()))
-                    now = datetime.datetime.now()
-                    if eviction_time <= now:
-                        ChannelCache._singleton._evict_locked(key)
-                        continue
-                    else:
-                        time_to_eviction = (eviction_time - now).total_seconds()
-                        # NOTE: We aim to *eventually* coalesce to a state in
-                        # which no overdue channels are in the cache and the
-                        # length of the cache is longer than _MAXIMUM_CHANNELS.
-                        # We tolerate momentary states in which these two
-                        # criteria are not met.
-                        ChannelCache._condition.wait(timeout=time_to_eviction)
+                if ChannelCache._singleton is None:
+                    ChannelCache._singleton = ChannelCache()
+                singleton = ChannelCache._singleton
+        return singleton
+
+    def _key_and_shard(
+        self, target: str, options: Sequence[Tuple[str, str]],
+        channel_credentials: Optional[grpc.ChannelCredentials], insecure: bool,
+        compression: Optional[grpc.Compression]
+    ) -> Tuple[_CacheKey, grpc.ChannelCredentials, _CacheShard]:
+        channel_credentials = _channel_credentials(channel_credentials,
+                                                   insecure)
+        if isinstance(options, tuple):
+            reused_key = (target, id(options), channel_credentials, compression)
+            key = self._keys.get(reused_key)
+            if key is None or key.given_options is not options:
+                key = _CacheKey(
+                    (target, options, channel_credentials, compression),
+                    options)
+                # Dict operations are atomic, so no lock is needed; a race
+                # merely builds a key twice.
+                if len(self._keys) >= _MAXIMUM_REUSED_CACHE_KEYS:
+                    self._keys.clear()
+                self._keys[reused_key] = key
+        else:
+            options = tuple(options)
+            key = _CacheKey((target, options, channel_credentials, compression),
+                            options)
+        return key, channel_credentials, self._shards[key.hash % _CACHE_SHARDS]
+
+    def _channel_count(self) -> int:
+        return sum(len(shard.channels) for shard in self._shards)
+
+    def _oldest_eviction_times(self) -> List[Tuple[float, _CacheShard]]:
+        """Returns the eviction time of the oldest channel of each shard
+        holding channels, along with the shard.
+
+        Each shard is read under its lock, as lookups reorder its channels.
+        """
+        eviction_times = []
+        for shard in self._shards:
+            with shard.lock:
+                eviction_time = shard.oldest_eviction_time()
+            if eviction_time is not None:
+                eviction_times.append((eviction_time, shard))
+        return eviction_times
+
+    def _evict(self) -> Optional[float]:
+        """Evicts overdue channels, then the least recently used ones if the
+        cache holds more than the maximum number of channels.
+
+        Returns:
+          The number of seconds until the next eviction is due, or None if no
+          channel is subject to eviction.
+        """
+        now = time.monotonic()
+        evicted = []
+        for shard in self._shards:
+            with shard.lock:
+                while True:
+                    eviction_time = shard.oldest_eviction_time()
+                    if eviction_time is None or now < eviction_time:
+                        break
+                    evicted.append(shard.evict_oldest())
+        for _ in range(self._channel_count() - _MAXIMUM_CHANNELS):
+            # The least recently used channel of the cache heads the shard
+            # with the earliest eviction time.
+            eviction_times = self._oldest_eviction_times()
+            if not eviction_times:
+                break
+            _, oldest_shard = min(eviction_times,
+                                  key=lambda eviction_time: eviction_time[0])
+            with oldest_shard.lock:
+                if oldest_shard.channels:
+                    evicted.append(oldest_shard.evict_oldest())
+        # Channels are closed outside of the shard locks so as not to stall
+        # concurrent lookups.
+        for key, channel in evicted:
+            _LOGGER.debug("Evicting channel %s with configuration %s.", channel,
+                          key)
+            channel.close()
+        eviction_times = self._oldest_eviction_times()
+        if eviction_times:
+            next_eviction_time = min(
+                eviction_time for eviction_time, _ in eviction_times)
+            return max(0.0, next_eviction_time - time.monotonic())
+        else:
+            return None
+
+    def _perform_evictions(self):
+        timeout = None
+        while True:
+            self._eviction_due.wait(timeout=timeout)
+            self._eviction_due.clear()
+            timeout = self._evict()
 
     def get_channel(self, target: str, options: Sequence[Tuple[str, str]],
                     channel_credentials: Optional[grpc.ChannelCredentials],
                     insecure: bool,
                     compression: Optional[grpc.Compression]) -> grpc.Channel:
-        if insecure and channel_credentials:
-            raise ValueError("The insecure option is mutually exclusive with " +
-                             "the channel_credentials option. Please use one " +
-                             "or the other.")
-        if insecure:
-            channel_credentials = grpc.experimental.insecure_channel_credentials(
-            )
-        elif channel_credentials is None:
-            _LOGGER.debug("Defaulting to SSL channel credentials.")
-            channel_credentials = grpc.ssl_channel_credentials()
-        key = (target, options, channel_credentials, compression)
-        with self._lock:
-            channel_data = self._mapping.get(key, None)
-            if channel_data is not None:
-                channel = channel_data[0]
-                self._mapping.pop(key)
-                self._mapping[key] = (channel, datetime.datetime.now() +
-                                      _EVICTION_PERIOD)
-                return channel
-            else:
-                channel = _create_channel(target, options, channel_credentials,
-                                          compression)
-                self._mapping[key] = (channel, datetime.datetime.now() +
-                                      _EVICTION_PERIOD)
-                if len(self._mapping) == 1 or len(
-                        self._mapping) >= _MAXIMUM_CHANNELS:
-                    self._condition.notify()
+        key, channel_credentials, shard = self._key_and_shard(
+            target, options, channel_credentials, insecure, compression)
+        with shard.lock:
+            channel = self._cached_channel(shard, key)
+        if channel is not None:
+            return channel
+        # Channels are created outside of the shard lock so as not to stall
+        # concurrent lookups; a channel created meanwhile by another lookup
+        # is used instead.
+        new_channel = _create_channel(target, key.configuration[1],
+                                      channel_credentials, compression)
+        with shard.lock:
+            channel = self._cached_channel(shard, key)
+            if channel is None:
+                shard.misses += 1
+                shard.channels[key] = [
+                    new_channel,
+                    time.monotonic() + _EVICTION_PERIOD_SECONDS
+                ]
+        if channel is not None:
+            new_channel.close()
+            return channel
+        self._eviction_due.set()
+        return new_channel
+
+    @staticmethod
+    def _cached_channel(shard: _CacheShard,
+                        key: _CacheKey) -> Optional[grpc.Channel]:
+        """Returns the channel of the key if the shard holds one, renewing
+        its eviction time. Must be called with the shard lock held."""
+        if shard.pinned_channels:
+            channel = shard.pinned_channels.get(key)
+            if channel is not None:
+                shard.hits += 1
                 return channel
+        channel_data = shard.channels.get(key)
+        if channel_data is not None:
+            shard.hits += 1
+            shard.channels.move_to_end(key)
+            channel_data[1] = time.monotonic() + _EVICTION_PERIOD_SECONDS
+            return channel_data[0]
+        return None
+
+    def pin_channel(self, target: str, options: Sequence[Tuple[str, str]],
+                    channel_credentials: Optional[grpc.ChannelCredentials],
+                    insecure: bool,
+                    compression: Optional[grpc.Compression]) -> grpc.Channel:
+        """Gets a channel and exempts it from eviction until it is unpinned."""
+        key, channel_credentials, shard = self._key_and_shard(
+            target, options, channel_credentials, insecure, compression)
+        with shard.lock:
+            channel = self._pin_cached_channel(shard, key)
+        if channel is not None:
+            return channel
+        new_channel = _create_channel(target, key.configuration[1],
+                                      channel_credentials, compression)
+        with shard.lock:
+            channel = self._pin_cached_channel(shard, key)
+            if channel is None:
+                shard.misses += 1
+                shard.pinned_channels[key] = new_channel
+        if channel is not None:
+            new_channel.close()
+            return channel
+        return new_channel
+
+    @staticmethod
+    def _pin_cached_channel(shard: _CacheShard,
+                            key: _CacheKey) -> Optional[grpc.Channel]:
+        """Pins and returns the channel of the key if the shard holds one.
+        Must be called with the shard lock held."""
+        channel = shard.pinned_channels.get(key)
+        if channel is not None:
+            shard.hits += 1
+            return channel
+        channel_data = shard.channels.pop(key, None)
+        if channel_data is not None:
+            shard.hits += 1
+            shard.pinned_channels[key] = channel_data[0]
+            return channel_data[0]
+        return None
+
+    def unpin_channel(self, target: str, options: Sequence[Tuple[str, str]],
+                      channel_credentials: Optional[grpc.ChannelCredentials],
+                      insecure: bool,
+                      compression: Optional[grpc.Compression]) -> bool:
+        """Subjects a pinned channel to eviction again.
+
+        Returns:
+          Whether a pinned channel was found.
+        """
+        key, _, shard = self._key_and_shard(target, options,
+                                            channel_credentials, insecure,
+                                            compression)
+        with shard.lock:
+            channel = shard.pinned_channels.pop(key, None)
+            if channel is None:
+                return False
+            shard.channels[key] = [
+                channel, time.monotonic() + _EVICTION_PERIOD_SECONDS
+            ]
+        self._eviction_due.set()
+        return True
+
+    def stats(self) -> ChannelCacheStats:
+        hits = misses = evictions = channels = pinned_channels = 0
+        for shard in self._shards:
+            with shard.lock:
+                hits += shard.hits
+                misses += shard.misses
+                evictions += shard.evictions
+                channels += len(shard.channels)
+                pinned_channels += len(shard.pinned_channels)
+        return ChannelCacheStats(hits, misses, evictions, channels,
+                                 pinned_channels)
 
     def _test_only_channel_count(self) -> int:
-        with self._lock:
-            return len(self._mapping)
+        stats = self.stats()
+        return stats.channels + stats.pinned_channels
+
+
+@experimental_api
+def prewarm_channel(target: str,
+                    options: Sequence[Tuple[AnyStr, AnyStr]] = (),
+                    channel_credentials: Optional[
+                        grpc.ChannelCredentials] = None,
+                    insecure: bool = False,
+                    compression: Optional[grpc.Compression] = None,
+                    pin: bool = False,
+                    timeout: Optional[float] = _DEFAULT_TIMEOUT) -> None:
+    """Connects the cached channel that the simple stubs would use for the
+    given configuration ahead of the first RPC.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Args:
+      target: The server address.
+      options: An optional list of key-value pairs (:term:`channel_arguments` in gRPC Core
+        runtime) to configure the channel.
+      channel_credentials: A credential applied to the whole channel, e.g. the
+        return value of grpc.ssl_channel_credentials() or
+        grpc.insecure_channel_credentials().
+      insecure: If True, specifies channel_credentials as
+        :term:`grpc.insecure_channel_credentials()`. This option is mutually
+        exclusive with the `channel_credentials` option.
+      compression: An optional value indicating the compression method to be
+        used over the lifetime of the channel, e.g. grpc.Compression.Gzip.
+      pin: If True, the channel is exempt from eviction, and does not count
+        towards the maximum number of channels, until unpin_channel is called
+        with the same configuration.
+      timeout: An optional duration of time in seconds to wait for the channel
+        to connect. If timeout is unspecified, defaults to a timeout
+        controlled by the GRPC_PYTHON_DEFAULT_TIMEOUT_SECONDS environment
+        variable. If that is unset, defaults to 60 seconds. Supply a value of
+        None to wait indefinitely.
+
+    Raises:
+      grpc.FutureTimeoutError: If the channel did not connect in time.
+    """
+    cache = ChannelCache.get()
+    if pin:
+        channel = cache.pin_channel(target, options, channel_credentials,
+                                    insecure, compression)
+    else:
+        channel = cache.get_channel(target, options, channel_credentials,
+                                    insecure, compression)
+    grpc.channel_ready_future(channel).result(timeout=timeout)
+
+
+@experimental_api
+def unpin_channel(target: str,
+                  options: Sequence[Tuple[AnyStr, AnyStr]] = (),
+                  channel_credentials: Optional[grpc.ChannelCredentials] = None,
+                  insecure: bool = False,
+                  compression: Optional[grpc.Compression] = None) -> bool:
+    """Makes a channel pinned by prewarm_channel subject to eviction again.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    The arguments identify the channel as they do for prewarm_channel.
+
+    Returns:
+      Whether a pinned channel with the given configuration was found.
+    """
+    return ChannelCache.get().unpin_channel(target, options,
+                                            channel_credentials, insecure,
+                                            compression)
+
+
+@experimental_api
+def channel_cache_stats() -> ChannelCacheStats:
+    """Reports on the channel cache backing the simple stubs.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    Returns:
+      A ChannelCacheStats with the counters accumulated since the cache was
+      created.
+    """
+    return ChannelCache.get().stats()
 
 
 @experimental_api
@@ -59,6 +59,31 @@ class DictionaryGenericHandler(grpc.ServiceRpcHandler):
         return self._method_handlers.get(handler_call_details.method)
 
 
+def method_handler_routes(generic_handlers):
+    """Merges the given generic handlers into a single routing table.
+
+    Args:
+      generic_handlers: The grpc.GenericRpcHandlers of a server, in the order
+        in which they are consulted.
+
+    Returns:
+      A dict from fully-qualified method name, as bytes, to
+      grpc.RpcMethodHandler, or None if any of the generic handlers is not a
+      DictionaryGenericHandler and so cannot be tabulated.
+    """
+    routes = {}
+    for generic_handler in generic_handlers:
+        # Subclasses may override service(), so only the exact type is trusted.
+        if type(generic_handler) is not DictionaryGenericHandler:  # pylint: disable=unidiomatic-typecheck
+            return None
+        for method, method_handler in six.iteritems(
+                generic_handler._method_handlers):
+            # The first generic handler serving a method wins, as it would
+            # when the handlers are queried one at a time.
+            routes.setdefault(_common.encode(method), method_handler)
+    return routes
+
+
 class _ChannelReadyFuture(grpc.Future):
 
     def __init__(self, channel):
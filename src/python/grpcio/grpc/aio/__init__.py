@@ -40,7 +40,10 @@ from ._server import server
 from ._base_server import Server, ServicerContext
 from ._typing import ChannelArgumentType
 from ._channel import insecure_channel, secure_channel
+from ._channel_pool import ChannelPool
 from ._metadata import Metadata
+from ._simple_stubs import (unary_unary, unary_stream, stream_unary,
+                            stream_stream)
 
 ###################################  __all__  #################################
 
@@ -55,6 +58,7 @@ __all__ = (
     'StreamUnaryCall',
     'StreamStreamCall',
     'Channel',
+    'ChannelPool',
     'UnaryUnaryMultiCallable',
     'UnaryStreamMultiCallable',
     'StreamUnaryMultiCallable',
@@ -78,4 +82,8 @@ __all__ = (
     'UsageError',
     'InternalError',
     'Metadata',
+    'unary_unary',
+    'unary_stream',
+    'stream_unary',
+    'stream_stream',
 )
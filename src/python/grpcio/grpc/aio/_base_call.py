@@ -19,7 +19,7 @@ RPC, e.g. cancellation.
 """
 
 from abc import ABCMeta, abstractmethod
-from typing import AsyncIterable, Awaitable, Generic, Optional, Union
+from typing import AsyncIterable, Awaitable, Generic, List, Optional, Union
 
 import grpc
 
@@ -171,6 +171,45 @@ class UnaryStreamCall(Generic[RequestType, ResponseType],
           stream.
         """
 
+    @abstractmethod
+    async def read_many(self,
+                        max_messages: int,
+                        max_bytes: Optional[int] = None
+                       ) -> Union[EOFType, List[ResponseType]]:
+        """Reads the messages already received from the stream at once.
+
+        Waits for at least one message. Once called, the following messages
+        are received ahead of the application, up to max_messages messages
+        and max_bytes serialized bytes. Read operations must be serialized
+        when called from multiple coroutines.
+
+        This is an EXPERIMENTAL API.
+
+        Args:
+          max_messages: The maximum number of messages to read, as a positive
+            integer.
+          max_bytes: The maximum serialized size of the messages to read,
+            unless the first message alone exceeds it. None means no limit.
+
+        Returns:
+          A list of response messages, or an `grpc.aio.EOF` to indicate the
+          end of the stream.
+        """
+
+    @abstractmethod
+    def read_batches(
+            self,
+            max_messages: int,
+            max_bytes: Optional[int] = None
+    ) -> AsyncIterable[List[ResponseType]]:
+        """Returns an async iterable that yields lists of response messages.
+
+        Each list holds the messages read at once by read_many with the same
+        arguments.
+
+        This is an EXPERIMENTAL API.
+        """
+
 
 class StreamUnaryCall(Generic[RequestType, ResponseType],
                       Call,
@@ -192,6 +231,18 @@ class StreamUnaryCall(Generic[RequestType, ResponseType],
         function will fail. This function is idempotent.
         """
 
+    @abstractmethod
+    async def drain(self) -> None:
+        """Waits until the messages written so far have been sent.
+
+        Writes only return before their message is sent when the channel
+        queues them, as configured by the experimental CoalescedWriteBytes
+        channel option; otherwise this returns right away.
+
+        Raises:
+          An RpcError exception if the RPC terminated with an error.
+        """
+
     @abstractmethod
     def __await__(self) -> Awaitable[ResponseType]:
         """Await the response message to be ready.
@@ -227,6 +278,45 @@ class StreamStreamCall(Generic[RequestType, ResponseType],
           stream.
         """
 
+    @abstractmethod
+    async def read_many(self,
+                        max_messages: int,
+                        max_bytes: Optional[int] = None
+                       ) -> Union[EOFType, List[ResponseType]]:
+        """Reads the messages already received from the stream at once.
+
+        Waits for at least one message. Once called, the following messages
+        are received ahead of the application, up to max_messages messages
+        and max_bytes serialized bytes. Read operations must be serialized
+        when called from multiple coroutines.
+
+        This is an EXPERIMENTAL API.
+
+        Args:
+          max_messages: The maximum number of messages to read, as a positive
+            integer.
+          max_bytes: The maximum serialized size of the messages to read,
+            unless the first message alone exceeds it. None means no limit.
+
+        Returns:
+          A list of response messages, or an `grpc.aio.EOF` to indicate the
+          end of the stream.
+        """
+
+    @abstractmethod
+    def read_batches(
+            self,
+            max_messages: int,
+            max_bytes: Optional[int] = None
+    ) -> AsyncIterable[List[ResponseType]]:
+        """Returns an async iterable that yields lists of response messages.
+
+        Each list holds the messages read at once by read_many with the same
+        arguments.
+
+        This is an EXPERIMENTAL API.
+        """
+
     @abstractmethod
     async def write(self, request: RequestType) -> None:
         """Writes one message to the stream.
@@ -242,3 +332,15 @@ class StreamStreamCall(Generic[RequestType, ResponseType],
         After done_writing is called, any additional invocation to the write
         function will fail. This function is idempotent.
         """
+
+    @abstractmethod
+    async def drain(self) -> None:
+        """Waits until the messages written so far have been sent.
+
+        Writes only return before their message is sent when the channel
+        queues them, as configured by the experimental CoalescedWriteBytes
+        channel option; otherwise this returns right away.
+
+        Raises:
+          An RpcError exception if the RPC terminated with an error.
+        """
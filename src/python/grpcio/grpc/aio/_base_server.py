@@ -14,11 +14,11 @@
 """Abstract base classes for server-side classes."""
 
 import abc
-from typing import Generic, Mapping, Optional, Iterable, Sequence
+from typing import Generic, List, Mapping, Optional, Iterable, Sequence, Union
 
 import grpc
 
-from ._typing import RequestType, ResponseType
+from ._typing import EOFType, RequestType, ResponseType
 from ._metadata import Metadata
 
 
@@ -147,6 +147,33 @@ class ServicerContext(Generic[RequestType, ResponseType], abc.ABC):
           An RpcError exception if the read failed.
         """
 
+    @abc.abstractmethod
+    async def read_many(self,
+                        max_messages: int,
+                        max_bytes: Optional[int] = None
+                       ) -> Union[EOFType, List[RequestType]]:
+        """Reads the messages already received from the RPC at once.
+
+        Waits for at least one message. Once called, the following messages
+        are received ahead of the application, up to max_messages messages
+        and max_bytes serialized bytes.
+
+        This is an EXPERIMENTAL API.
+
+        Args:
+          max_messages: The maximum number of messages to read, as a positive
+            integer.
+          max_bytes: The maximum serialized size of the messages to read,
+            unless the first message alone exceeds it. None means no limit.
+
+        Returns:
+          A list of request messages of the RPC, or EOF once the client is
+          done writing.
+
+        Raises:
+          An RpcError exception if the read failed.
+        """
+
     @abc.abstractmethod
     async def write(self, message: ResponseType) -> None:
         """Writes one message to the RPC.
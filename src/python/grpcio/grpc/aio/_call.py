@@ -14,11 +14,12 @@
 """Invocation-side implementation of gRPC Asyncio Python."""
 
 import asyncio
+import collections
 import enum
 import inspect
 import logging
 from functools import partial
-from typing import AsyncIterable, Optional, Tuple
+from typing import AsyncIterable, Deque, List, Optional, Tuple, Union
 
 import grpc
 from grpc import _common
@@ -26,9 +27,9 @@ from grpc._cython import cygrpc
 
 from . import _base_call
 from ._metadata import Metadata
-from ._typing import (DeserializingFunction, DoneCallbackType, MetadatumType,
-                      RequestIterableType, RequestType, ResponseType,
-                      SerializingFunction)
+from ._typing import (DeserializingFunction, DoneCallbackType, EOFType,
+                      MetadatumType, RequestIterableType, RequestType,
+                      ResponseType, SerializingFunction)
 
 __all__ = 'AioRpcError', 'Call', 'UnaryUnaryCall', 'UnaryStreamCall'
 
@@ -248,14 +249,18 @@ class _APIStyle(enum.IntEnum):
 
 
 class _UnaryResponseMixin(Call):
-    _call_response: asyncio.Task
+    _call_response: Optional[asyncio.Future]
 
-    def _init_unary_response_mixin(self, response_task: asyncio.Task):
+    def _init_unary_response_mixin(self, response_task: Optional[asyncio.Task]):
         self._call_response = response_task
 
+    def _response_future(self) -> asyncio.Future:
+        return self._call_response
+
     def cancel(self) -> bool:
         if super().cancel():
-            self._call_response.cancel()
+            if self._call_response is not None:
+                self._call_response.cancel()
             return True
         else:
             return False
@@ -263,7 +268,7 @@ class _UnaryResponseMixin(Call):
     def __await__(self) -> ResponseType:
         """Wait till the ongoing RPC request finishes."""
         try:
-            response = yield from self._call_response
+            response = yield from self._response_future()
         except asyncio.CancelledError:
             # Even if we caught all other CancelledError, there is still
             # this corner case. If the application cancels immediately after
@@ -273,6 +278,9 @@ class _UnaryResponseMixin(Call):
                 self.cancel()
             raise
 
+        return self._response_or_raise(response)
+
+    def _response_or_raise(self, response: ResponseType) -> ResponseType:
         # NOTE(lidiz) If we raise RpcError in the task, and users doesn't
         # 'await' on it. AsyncIO will log 'Task exception was never retrieved'.
         # Instead, if we move the exception raising here, the spam stops.
@@ -345,7 +353,7 @@ class _StreamResponseMixin(Call):
                                        self._response_deserializer)
 
     async def read(self) -> ResponseType:
-        if self.done():
+        if self.done() and not self._cython_call.has_received_messages():
             await self._raise_for_status()
             return cygrpc.EOF
         self._update_response_style(_APIStyle.READER_WRITER)
@@ -357,17 +365,100 @@ class _StreamResponseMixin(Call):
             await self._raise_for_status()
         return response_message
 
+    async def _read_many(
+            self, max_messages: int,
+            max_bytes: Optional[int]) -> Union[EOFType, List[ResponseType]]:
+        # Wait for the request being sent
+        await self._preparation
+
+        # Reads the response messages already received from Core
+        try:
+            raw_responses = await self._cython_call.receive_serialized_messages(
+                max_messages, max_bytes)
+        except asyncio.CancelledError:
+            if not self.cancelled():
+                self.cancel()
+            await self._raise_for_status()
+
+        if raw_responses is cygrpc.EOF:
+            return cygrpc.EOF
+        else:
+            return [
+                _common.deserialize(raw_response, self._response_deserializer)
+                for raw_response in raw_responses
+            ]
+
+    async def read_many(self,
+                        max_messages: int,
+                        max_bytes: Optional[int] = None
+                       ) -> Union[EOFType, List[ResponseType]]:
+        if self.done() and not self._cython_call.has_received_messages():
+            await self._raise_for_status()
+            return cygrpc.EOF
+        self._update_response_style(_APIStyle.READER_WRITER)
+
+        response_messages = await self._read_many(max_messages, max_bytes)
+
+        if response_messages is cygrpc.EOF:
+            # If the read operation failed, Core should explain why.
+            await self._raise_for_status()
+        return response_messages
+
+    async def _fetch_stream_response_batches(
+            self, max_messages: int,
+            max_bytes: Optional[int]) -> AsyncIterable[List[ResponseType]]:
+        response_messages = await self._read_many(max_messages, max_bytes)
+        while response_messages is not cygrpc.EOF:
+            yield response_messages
+            response_messages = await self._read_many(max_messages, max_bytes)
+
+        # If the read operation failed, Core should explain why.
+        await self._raise_for_status()
+
+    def read_batches(
+            self,
+            max_messages: int,
+            max_bytes: Optional[int] = None
+    ) -> AsyncIterable[List[ResponseType]]:
+        self._update_response_style(_APIStyle.ASYNC_GENERATOR)
+        return self._fetch_stream_response_batches(max_messages, max_bytes)
+
 
 class _StreamRequestMixin(Call):
+    """Sends the requests of a stream-unary or stream-stream RPC.
+
+    With a positive coalesced_write_bytes on the channel, serialized requests
+    are queued up to that many bytes, and up to coalesced_write_messages
+    requests if that is positive, instead of being written one at a time
+    before the next write may start. A writer Task sends the queued requests
+    in order, each one followed by further queued requests with a buffer hint
+    so that Core coalesces them.
+    """
     _metadata_sent: asyncio.Event
     _done_writing_flag: bool
     _async_request_poller: Optional[asyncio.Task]
     _request_style: _APIStyle
+    _queued_writes: Optional[Deque[bytes]]
+    _queued_write_bytes: int
+    _maximum_queued_write_bytes: int
+    _maximum_queued_writes: int
+    _write_space: asyncio.Event
+    _writer: Optional[asyncio.Task]
 
     def _init_stream_request_mixin(
-            self, request_iterator: Optional[RequestIterableType]):
+            self, request_iterator: Optional[RequestIterableType],
+            channel: cygrpc.AioChannel):
         self._metadata_sent = asyncio.Event(loop=self._loop)
         self._done_writing_flag = False
+        self._writer = None
+        if channel.coalesced_write_bytes:
+            self._queued_writes = collections.deque()
+            self._queued_write_bytes = 0
+            self._maximum_queued_write_bytes = channel.coalesced_write_bytes
+            self._maximum_queued_writes = channel.coalesced_write_messages
+            self._write_space = asyncio.Event(loop=self._loop)
+        else:
+            self._queued_writes = None
 
         # If user passes in an async iterator, create a consumer Task.
         if request_iterator is not None:
@@ -386,6 +477,8 @@ class _StreamRequestMixin(Call):
         if super().cancel():
             if self._async_request_poller is not None:
                 self._async_request_poller.cancel()
+            if self._writer is not None:
+                self._writer.cancel()
             return True
         else:
             return False
@@ -424,6 +517,9 @@ class _StreamRequestMixin(Call):
 
         serialized_request = _common.serialize(request,
                                                self._request_serializer)
+        if self._queued_writes is not None:
+            await self._queue_write(serialized_request)
+            return
         try:
             await self._cython_call.send_serialized_message(serialized_request)
         except asyncio.CancelledError:
@@ -431,6 +527,56 @@ class _StreamRequestMixin(Call):
                 self.cancel()
             await self._raise_for_status()
 
+    def _write_window_full(self) -> bool:
+        if self._queued_write_bytes >= self._maximum_queued_write_bytes:
+            return True
+        return bool(self._maximum_queued_writes and
+                    len(self._queued_writes) >= self._maximum_queued_writes)
+
+    async def _queue_write(self, serialized_request: bytes) -> None:
+        while self._queued_writes and self._write_window_full():
+            self._write_space.clear()
+            await self._write_space.wait()
+            if self.done():
+                await self._raise_for_status()
+                raise asyncio.InvalidStateError(_RPC_ALREADY_FINISHED_DETAILS)
+
+        self._queued_writes.append(serialized_request)
+        self._queued_write_bytes += len(serialized_request)
+        if self._writer is None:
+            self._writer = self._loop.create_task(self._send_queued_writes())
+
+    async def _send_queued_writes(self) -> None:
+        try:
+            while self._queued_writes:
+                serialized_request = self._queued_writes[0]
+                await self._cython_call.send_serialized_message(
+                    serialized_request,
+                    buffer_hint=len(self._queued_writes) > 1)
+                self._queued_writes.popleft()
+                self._queued_write_bytes -= len(serialized_request)
+                self._write_space.set()
+        except asyncio.CancelledError:
+            if not self.cancelled():
+                self.cancel()
+        except cygrpc.ExecuteBatchError as batch_error:
+            # The RPC has terminated, which its status reports to the
+            # application, so the queued requests are dropped.
+            _LOGGER.debug('Exception while sending queued requests: %s',
+                          batch_error)
+        finally:
+            self._queued_writes.clear()
+            self._queued_write_bytes = 0
+            self._writer = None
+            self._write_space.set()
+
+    async def _drain(self) -> None:
+        writer = self._writer
+        if writer is not None:
+            await asyncio.wait((writer,))
+        if self.done():
+            await self._raise_for_status()
+
     async def _done_writing(self) -> None:
         if self.done():
             # If the RPC is finished, do nothing.
@@ -438,6 +584,7 @@ class _StreamRequestMixin(Call):
         if not self._done_writing_flag:
             # If the done writing is not sent before, try to send it.
             self._done_writing_flag = True
+            await self._drain()
             try:
                 await self._cython_call.send_receive_close()
             except asyncio.CancelledError:
@@ -457,6 +604,10 @@ class _StreamRequestMixin(Call):
         self._raise_for_different_style(_APIStyle.READER_WRITER)
         await self._done_writing()
 
+    async def drain(self) -> None:
+        self._raise_for_different_style(_APIStyle.READER_WRITER)
+        await self._drain()
+
     async def wait_for_connection(self) -> None:
         await self._metadata_sent.wait()
         if self.done():
@@ -467,9 +618,15 @@ class UnaryUnaryCall(_UnaryResponseMixin, Call, _base_call.UnaryUnaryCall):
     """Object for managing unary-unary RPC calls.
 
     Returned when an instance of `UnaryUnaryMultiCallable` object is called.
+
+    The RPC is invoked by the coroutine first awaiting the call, which spares
+    the Task otherwise running the invocation and handing its response over.
+    The call falls back to such a Task if it is not awaited before the event
+    loop runs again.
     """
     _request: RequestType
-    _invocation_task: asyncio.Task
+    _invoked: bool
+    _inline_outcome: Optional[Tuple[ResponseType, Optional[Exception]]]
 
     # pylint: disable=too-many-arguments
     def __init__(self, request: RequestType, deadline: Optional[float],
@@ -483,10 +640,16 @@ class UnaryUnaryCall(_UnaryResponseMixin, Call, _base_call.UnaryUnaryCall):
             channel.call(method, deadline, credentials, wait_for_ready),
             metadata, request_serializer, response_deserializer, loop)
         self._request = request
-        self._invocation_task = loop.create_task(self._invoke())
-        self._init_unary_response_mixin(self._invocation_task)
+        self._invoked = False
+        self._inline_outcome = None
+        self._init_unary_response_mixin(None)
+        loop.call_soon(self._invoke_unless_invoked)
 
     async def _invoke(self) -> ResponseType:
+        # A call cancelled before being invoked is never started.
+        if self._cython_call.done():
+            return cygrpc.EOF
+
         serialized_request = _common.serialize(self._request,
                                                self._request_serializer)
 
@@ -506,8 +669,61 @@ class UnaryUnaryCall(_UnaryResponseMixin, Call, _base_call.UnaryUnaryCall):
         else:
             return cygrpc.EOF
 
+    def _invoke_unless_invoked(self) -> None:
+        if not self._invoked:
+            self._response_future()
+
+    def _response_future(self) -> asyncio.Future:
+        """Returns a future of the response of the RPC.
+
+        The RPC is invoked by a Task unless an awaiting coroutine has already
+        invoked it, in which case the future is resolved by that coroutine.
+        """
+        if self._call_response is None:
+            if not self._invoked:
+                self._invoked = True
+                self._call_response = self._loop.create_task(self._invoke())
+            else:
+                self._call_response = self._loop.create_future()
+                if self._inline_outcome is not None:
+                    self._resolve_response_future()
+        return self._call_response
+
+    def _resolve_response_future(self) -> None:
+        # The future is cancelled along with the call.
+        if self._call_response.done():
+            return
+        response, exception = self._inline_outcome
+        if exception is None:
+            self._call_response.set_result(response)
+        else:
+            self._call_response.set_exception(exception)
+
+    def _set_inline_outcome(self, response: ResponseType,
+                            exception: Optional[Exception]) -> None:
+        self._inline_outcome = (response, exception)
+        if self._call_response is not None:
+            self._resolve_response_future()
+
+    def _invoke_inline(self) -> ResponseType:
+        self._invoked = True
+        try:
+            response = yield from self._invoke().__await__()
+        except Exception as exception:  # pylint: disable=broad-except
+            self._set_inline_outcome(None, exception)
+            raise
+        self._set_inline_outcome(response, None)
+        return response
+
+    def __await__(self) -> ResponseType:
+        """Wait till the ongoing RPC request finishes."""
+        if self._invoked:
+            return (yield from super().__await__())
+        response = yield from self._invoke_inline()
+        return self._response_or_raise(response)
+
     async def wait_for_connection(self) -> None:
-        await self._invocation_task
+        await self._response_future()
         if self.done():
             await self._raise_for_status()
 
@@ -572,7 +788,7 @@ class StreamUnaryCall(_StreamRequestMixin, _UnaryResponseMixin, Call,
             channel.call(method, deadline, credentials, wait_for_ready),
             metadata, request_serializer, response_deserializer, loop)
 
-        self._init_stream_request_mixin(request_iterator)
+        self._init_stream_request_mixin(request_iterator, channel)
         self._init_unary_response_mixin(loop.create_task(self._conduct_rpc()))
 
     async def _conduct_rpc(self) -> ResponseType:
@@ -610,7 +826,7 @@ class StreamStreamCall(_StreamRequestMixin, _StreamResponseMixin, Call,
             channel.call(method, deadline, credentials, wait_for_ready),
             metadata, request_serializer, response_deserializer, loop)
         self._initializer = self._loop.create_task(self._prepare_rpc())
-        self._init_stream_request_mixin(request_iterator)
+        self._init_stream_request_mixin(request_iterator, channel)
         self._init_stream_response_mixin(self._initializer)
 
     async def _prepare_rpc(self):
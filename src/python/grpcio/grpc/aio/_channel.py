@@ -18,6 +18,8 @@ import sys
 from typing import Any, Iterable, Optional, Sequence, List
 
 import grpc
+import grpc.experimental
+from grpc.experimental import _PYTHON_CHANNEL_OPTIONS
 from grpc import _common, _compression, _grpcio_metadata
 from grpc._cython import cygrpc
 
@@ -28,7 +30,8 @@ from ._interceptor import (
     InterceptedUnaryUnaryCall, InterceptedUnaryStreamCall,
     InterceptedStreamUnaryCall, InterceptedStreamStreamCall, ClientInterceptor,
     UnaryUnaryClientInterceptor, UnaryStreamClientInterceptor,
-    StreamUnaryClientInterceptor, StreamStreamClientInterceptor)
+    StreamUnaryClientInterceptor, StreamStreamClientInterceptor,
+    compile_stream_unary_interceptors, compile_unary_unary_interceptors)
 from ._metadata import Metadata
 from ._typing import (ChannelArgumentType, DeserializingFunction,
                       SerializingFunction, RequestIterableType)
@@ -105,6 +108,26 @@ class _BaseMultiCallable:
 class UnaryUnaryMultiCallable(_BaseMultiCallable,
                               _base_channel.UnaryUnaryMultiCallable):
 
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        channel: cygrpc.AioChannel,
+        method: bytes,
+        request_serializer: SerializingFunction,
+        response_deserializer: DeserializingFunction,
+        interceptors: Optional[Sequence[ClientInterceptor]],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        super().__init__(channel, method, request_serializer,
+                         response_deserializer, interceptors, loop)
+        # The interceptors are chained once, for all RPCs of the multicallable.
+        if interceptors:
+            self._pipeline = compile_unary_unary_interceptors(
+                interceptors, channel, request_serializer,
+                response_deserializer, loop)
+        else:
+            self._pipeline = None
+
     def __call__(
         self,
         request: Any,
@@ -128,7 +151,7 @@ class UnaryUnaryMultiCallable(_BaseMultiCallable,
                 self._interceptors, request, timeout, metadata, credentials,
                 wait_for_ready, self._channel, self._method,
                 self._request_serializer, self._response_deserializer,
-                self._loop)
+                self._loop, self._pipeline)
 
         return call
 
@@ -168,6 +191,26 @@ class UnaryStreamMultiCallable(_BaseMultiCallable,
 class StreamUnaryMultiCallable(_BaseMultiCallable,
                                _base_channel.StreamUnaryMultiCallable):
 
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        channel: cygrpc.AioChannel,
+        method: bytes,
+        request_serializer: SerializingFunction,
+        response_deserializer: DeserializingFunction,
+        interceptors: Optional[Sequence[ClientInterceptor]],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        super().__init__(channel, method, request_serializer,
+                         response_deserializer, interceptors, loop)
+        # The interceptors are chained once, for all RPCs of the multicallable.
+        if interceptors:
+            self._pipeline = compile_stream_unary_interceptors(
+                interceptors, channel, request_serializer,
+                response_deserializer, loop)
+        else:
+            self._pipeline = None
+
     def __call__(
         self,
         request_iterator: Optional[RequestIterableType] = None,
@@ -191,7 +234,7 @@ class StreamUnaryMultiCallable(_BaseMultiCallable,
                 self._interceptors, request_iterator, deadline, metadata,
                 credentials, wait_for_ready, self._channel, self._method,
                 self._request_serializer, self._response_deserializer,
-                self._loop)
+                self._loop, self._pipeline)
 
         return call
 
@@ -273,11 +316,24 @@ class Channel(_base_channel.Channel):
                         "{} or ".format(StreamUnaryClientInterceptor.__name__) +
                         "{}. ".format(StreamStreamClientInterceptor.__name__))
 
+        python_options, core_options = _common.separate_options(
+            options, _PYTHON_CHANNEL_OPTIONS)
+        zero_copy_receive = bool(
+            python_options.get(grpc.experimental.ChannelOptions.ZeroCopyReceive,
+                               False))
+        coalesced_write_bytes = _common.integer_option(
+            python_options,
+            grpc.experimental.ChannelOptions.CoalescedWriteBytes, 0, 0)
+        coalesced_write_messages = _common.integer_option(
+            python_options,
+            grpc.experimental.ChannelOptions.CoalescedWriteMessages, 0, 0)
+
         self._loop = cygrpc.get_working_loop()
         self._channel = cygrpc.AioChannel(
             _common.encode(target),
-            _augment_channel_arguments(options, compression), credentials,
-            self._loop)
+            _augment_channel_arguments(core_options,
+                                       compression), credentials, self._loop,
+            zero_copy_receive, coalesced_write_bytes, coalesced_write_messages)
 
     async def __aenter__(self):
         return self
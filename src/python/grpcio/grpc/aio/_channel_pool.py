@@ -0,0 +1,209 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A Channel spreading RPCs across several channels to one target."""
+
+import asyncio
+from typing import Any, Optional, Sequence, Tuple
+
+import grpc
+from grpc._channel_pool import _Load, _pool_options
+
+from . import _base_call, _base_channel
+from ._channel import insecure_channel, secure_channel
+from ._interceptor import ClientInterceptor
+from ._typing import (ChannelArgumentType, DeserializingFunction,
+                      SerializingFunction)
+
+# The connectivity states ordered from the most to the least connected.
+_CONNECTIVITY_PRECEDENCE = (
+    grpc.ChannelConnectivity.READY,
+    grpc.ChannelConnectivity.CONNECTING,
+    grpc.ChannelConnectivity.IDLE,
+    grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+    grpc.ChannelConnectivity.SHUTDOWN,
+)
+
+
+class _MultiCallable:
+    """Invokes each RPC through the least loaded channel of a pool."""
+
+    def __init__(self, load: _Load, multi_callables: Tuple[Any, ...]) -> None:
+        self._load = load
+        self._multi_callables = multi_callables
+
+    def __call__(self, *args, **kwargs) -> _base_call.Call:
+        index = self._load.acquire()
+        try:
+            call = self._multi_callables[index](*args, **kwargs)
+        except:
+            self._load.release(index)
+            raise
+        call.add_done_callback(lambda unused_call: self._load.release(index))
+        return call
+
+
+class _UnaryUnaryMultiCallable(_MultiCallable,
+                               _base_channel.UnaryUnaryMultiCallable):
+    pass
+
+
+class _UnaryStreamMultiCallable(_MultiCallable,
+                                _base_channel.UnaryStreamMultiCallable):
+    pass
+
+
+class _StreamUnaryMultiCallable(_MultiCallable,
+                                _base_channel.StreamUnaryMultiCallable):
+    pass
+
+
+class _StreamStreamMultiCallable(_MultiCallable,
+                                 _base_channel.StreamStreamMultiCallable):
+    pass
+
+
+class ChannelPool(_base_channel.Channel):
+    """A Channel spreading RPCs across several channels to one target.
+
+    This is an EXPERIMENTAL API.
+
+    Each of the channels keeps its own connections, so the pool sidesteps the
+    limit on concurrent streams per connection. Every RPC is made on the
+    channel with the fewest RPCs in flight. The connectivity state of the pool
+    is the most connected state among its channels.
+    """
+    _channels: Tuple[_base_channel.Channel, ...]
+    _load: _Load
+
+    def __init__(self,
+                 target: str,
+                 size: int,
+                 credentials: Optional[grpc.ChannelCredentials] = None,
+                 options: Optional[ChannelArgumentType] = None,
+                 compression: Optional[grpc.Compression] = None,
+                 interceptors: Optional[Sequence[ClientInterceptor]] = None):
+        """Constructor.
+
+        Args:
+          target: The server address.
+          size: The number of channels in the pool, as a positive integer.
+          credentials: An optional ChannelCredentials instance. The channels
+            are insecure if None.
+          options: An optional list of key-value pairs (:term:`channel_arguments`
+            in gRPC Core runtime) to configure each channel.
+          compression: An optional value indicating the compression method to
+            be used over the lifetime of each channel.
+          interceptors: An optional sequence of interceptors that will be
+            executed for any call executed with the pool.
+        """
+        options = _pool_options(size, options)
+        if credentials is None:
+            self._channels = tuple(
+                insecure_channel(target, options, compression, interceptors)
+                for _ in range(size))
+        else:
+            self._channels = tuple(
+                secure_channel(target, credentials, options, compression,
+                               interceptors) for _ in range(size))
+        self._load = _Load(size)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self, grace: Optional[float] = None):
+        await asyncio.gather(
+            *(channel.close(grace) for channel in self._channels))
+
+    def get_state(self,
+                  try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        return min((channel.get_state(try_to_connect=try_to_connect)
+                    for channel in self._channels),
+                   key=_CONNECTIVITY_PRECEDENCE.index)
+
+    async def wait_for_state_change(
+        self,
+        last_observed_state: grpc.ChannelConnectivity,
+    ) -> None:
+        while self.get_state() == last_observed_state:
+            state_changes = tuple(
+                asyncio.ensure_future(
+                    channel.wait_for_state_change(channel.get_state()))
+                for channel in self._channels)
+            try:
+                await asyncio.wait(state_changes,
+                                   return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for state_change in state_changes:
+                    state_change.cancel()
+
+    async def channel_ready(self) -> None:
+        state = self.get_state(try_to_connect=True)
+        while state != grpc.ChannelConnectivity.READY:
+            await self.wait_for_state_change(state)
+            state = self.get_state(try_to_connect=True)
+
+    def unary_unary(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None
+    ) -> _base_channel.UnaryUnaryMultiCallable:
+        return _UnaryUnaryMultiCallable(
+            self._load,
+            tuple(
+                channel.unary_unary(method, request_serializer,
+                                    response_deserializer)
+                for channel in self._channels))
+
+    def unary_stream(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None
+    ) -> _base_channel.UnaryStreamMultiCallable:
+        return _UnaryStreamMultiCallable(
+            self._load,
+            tuple(
+                channel.unary_stream(method, request_serializer,
+                                     response_deserializer)
+                for channel in self._channels))
+
+    def stream_unary(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None
+    ) -> _base_channel.StreamUnaryMultiCallable:
+        return _StreamUnaryMultiCallable(
+            self._load,
+            tuple(
+                channel.stream_unary(method, request_serializer,
+                                     response_deserializer)
+                for channel in self._channels))
+
+    def stream_stream(
+        self,
+        method: str,
+        request_serializer: Optional[SerializingFunction] = None,
+        response_deserializer: Optional[DeserializingFunction] = None
+    ) -> _base_channel.StreamStreamMultiCallable:
+        return _StreamStreamMultiCallable(
+            self._load,
+            tuple(
+                channel.stream_stream(method, request_serializer,
+                                      response_deserializer)
+                for channel in self._channels))
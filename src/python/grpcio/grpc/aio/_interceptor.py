@@ -16,7 +16,7 @@ import asyncio
 import collections
 import functools
 from abc import ABCMeta, abstractmethod
-from typing import Callable, Optional, Iterator, Sequence, Union, Awaitable, AsyncIterable
+from typing import Callable, List, Optional, Iterator, Sequence, Union, Awaitable, AsyncIterable
 
 import grpc
 from grpc._cython import cygrpc
@@ -28,7 +28,7 @@ from ._call import _API_STYLE_ERROR
 from ._utils import _timeout_to_deadline
 from ._typing import (RequestType, SerializingFunction, DeserializingFunction,
                       ResponseType, DoneCallbackType, RequestIterableType,
-                      ResponseIterableType)
+                      ResponseIterableType, EOFType)
 from ._metadata import Metadata
 
 _LOCAL_CANCELLATION_DETAILS = 'Locally cancelled by application!'
@@ -38,8 +38,21 @@ class ServerInterceptor(metaclass=ABCMeta):
     """Affords intercepting incoming RPCs on the service-side.
 
     This is an EXPERIMENTAL API.
+
+    Attributes:
+        method_scoped: Whether the RpcMethodHandler returned by
+            intercept_service depends only on the method of the RPC and on
+            the RpcMethodHandler returned by the continuation, and not on the
+            invocation metadata. When all of a server's interceptors are
+            method scoped and all of its generic handlers were created by
+            grpc.method_handlers_generic_handler, the server reuses the
+            RpcMethodHandler they return for a method rather than awaiting
+            them again for every RPC, until further generic handlers are
+            added. Defaults to False.
     """
 
+    method_scoped: bool = False
+
     @abstractmethod
     async def intercept_service(
             self, continuation: Callable[[grpc.HandlerCallDetails],
@@ -435,11 +448,13 @@ class _InterceptedUnaryResponseMixin:
 
 class _InterceptedStreamResponseMixin:
     _response_aiter: Optional[AsyncIterable[ResponseType]]
+    _responses_read_many: bool
 
     def _init_stream_response_mixin(self) -> None:
         # Is initalized later, otherwise if the iterator is not finnally
         # consumed a logging warning is emmited by Asyncio.
         self._response_aiter = None
+        self._responses_read_many = False
 
     async def _wait_for_interceptor_task_response_iterator(
             self) -> ResponseType:
@@ -447,6 +462,22 @@ class _InterceptedStreamResponseMixin:
         async for response in call:
             yield response
 
+    async def _wait_for_interceptor_task_batch_reader(
+        self
+    ) -> Optional[Union[_base_call.UnaryStreamCall,
+                        _base_call.StreamStreamCall]]:
+        """Returns the call whose responses can be read in batches, if any.
+
+        That is the call returned by the interceptors, unless an interceptor
+        replaced its response iterator or responses were already read through
+        that iterator.
+        """
+        call = await self._interceptors_task
+        if (self._response_aiter is not None or
+                isinstance(call, _StreamCallResponseIterator)):
+            return None
+        return call
+
     def __aiter__(self) -> AsyncIterable[ResponseType]:
         if self._response_aiter is None:
             self._response_aiter = self._wait_for_interceptor_task_response_iterator(
@@ -454,11 +485,61 @@ class _InterceptedStreamResponseMixin:
         return self._response_aiter
 
     async def read(self) -> ResponseType:
+        if self._responses_read_many:
+            call = await self._interceptors_task
+            return await call.read()
         if self._response_aiter is None:
             self._response_aiter = self._wait_for_interceptor_task_response_iterator(
             )
         return await self._response_aiter.asend(None)
 
+    @staticmethod
+    def _validate_batch_limits(max_messages: int,
+                               max_bytes: Optional[int]) -> None:
+        if max_messages < 1:
+            raise ValueError(
+                'max_messages must be positive, got {}'.format(max_messages))
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(
+                'max_bytes must be positive, got {}'.format(max_bytes))
+
+    async def read_many(self,
+                        max_messages: int,
+                        max_bytes: Optional[int] = None
+                       ) -> Union[EOFType, List[ResponseType]]:
+        self._validate_batch_limits(max_messages, max_bytes)
+        call = await self._wait_for_interceptor_task_batch_reader()
+        if call is not None:
+            # Later reads go through the call as well, since it does not
+            # allow its iterator to be mixed with read_many.
+            self._responses_read_many = True
+            return await call.read_many(max_messages, max_bytes)
+        # The responses are handed over one at a time by the iterator.
+        try:
+            return [await self.read()]
+        except StopAsyncIteration:
+            return cygrpc.EOF
+
+    async def _wait_for_interceptor_task_response_batches(
+            self, max_messages: int,
+            max_bytes: Optional[int]) -> AsyncIterable[List[ResponseType]]:
+        call = await self._wait_for_interceptor_task_batch_reader()
+        if call is not None:
+            async for responses in call.read_batches(max_messages, max_bytes):
+                yield responses
+        else:
+            async for response in self:
+                yield [response]
+
+    def read_batches(
+            self,
+            max_messages: int,
+            max_bytes: Optional[int] = None
+    ) -> AsyncIterable[List[ResponseType]]:
+        self._validate_batch_limits(max_messages, max_bytes)
+        return self._wait_for_interceptor_task_response_batches(
+            max_messages, max_bytes)
+
 
 class _InterceptedStreamRequestMixin:
 
@@ -489,8 +570,11 @@ class _InterceptedStreamRequestMixin:
         while True:
             value = await self._write_to_iterator_queue.get()
             if value is _InterceptedStreamRequestMixin._FINISH_ITERATOR_SENTINEL:
+                self._write_to_iterator_queue.task_done()
                 break
             yield value
+            # The call asks for the next request once it wrote this one.
+            self._write_to_iterator_queue.task_done()
 
     async def write(self, request: RequestType) -> None:
         # If no queue was created it means that requests
@@ -541,6 +625,166 @@ class _InterceptedStreamRequestMixin:
                                    call.code()),
                                   return_when=asyncio.FIRST_COMPLETED)
 
+    async def drain(self) -> None:
+        # If no queue was created it means that requests
+        # should be expected through an iterators provided
+        # by the caller.
+        if self._write_to_iterator_queue is None:
+            raise cygrpc.UsageError(_API_STYLE_ERROR)
+
+        try:
+            call = await self._interceptors_task
+        except (asyncio.CancelledError, AioRpcError):
+            raise asyncio.InvalidStateError(_RPC_ALREADY_FINISHED_DETAILS)
+
+        # The requests are handed over to the call, which may finish before
+        # asking for all of them.
+        _, _ = await asyncio.wait(
+            (self._write_to_iterator_queue.join(), call.code()),
+            return_when=asyncio.FIRST_COMPLETED)
+        await call._drain()
+
+
+class _UnaryUnaryInvocation:
+    """Invokes a unary-unary RPC at the end of a compiled interceptor chain."""
+
+    _channel: cygrpc.AioChannel
+    _request_serializer: SerializingFunction
+    _response_deserializer: DeserializingFunction
+    _loop: asyncio.AbstractEventLoop
+
+    def __init__(self, channel: cygrpc.AioChannel,
+                 request_serializer: SerializingFunction,
+                 response_deserializer: DeserializingFunction,
+                 loop: asyncio.AbstractEventLoop) -> None:
+        self._channel = channel
+        self._request_serializer = request_serializer
+        self._response_deserializer = response_deserializer
+        self._loop = loop
+
+    async def __call__(self, client_call_details: ClientCallDetails,
+                       request: RequestType) -> _base_call.UnaryUnaryCall:
+        return UnaryUnaryCall(request,
+                              _timeout_to_deadline(client_call_details.timeout),
+                              client_call_details.metadata,
+                              client_call_details.credentials,
+                              client_call_details.wait_for_ready, self._channel,
+                              client_call_details.method,
+                              self._request_serializer,
+                              self._response_deserializer, self._loop)
+
+
+class _UnaryUnaryContinuation:
+    """Runs one interceptor of a compiled unary-unary interceptor chain.
+
+    Serves as the continuation handed to the interceptor before it, so that
+    a chain is built once per multicallable rather than once per RPC.
+    """
+
+    _interceptor: UnaryUnaryClientInterceptor
+    _continuation: Callable[[ClientCallDetails, RequestType],
+                            Awaitable[_base_call.UnaryUnaryCall]]
+
+    def __init__(
+        self, interceptor: UnaryUnaryClientInterceptor,
+        continuation: Callable[[ClientCallDetails, RequestType],
+                               Awaitable[_base_call.UnaryUnaryCall]]
+    ) -> None:
+        self._interceptor = interceptor
+        self._continuation = continuation
+
+    async def __call__(self, client_call_details: ClientCallDetails,
+                       request: RequestType) -> _base_call.UnaryUnaryCall:
+        call_or_response = await self._interceptor.intercept_unary_unary(
+            self._continuation, client_call_details, request)
+
+        if isinstance(call_or_response, _base_call.UnaryUnaryCall):
+            return call_or_response
+        else:
+            return UnaryUnaryCallResponse(call_or_response)
+
+
+def compile_unary_unary_interceptors(
+    interceptors: Sequence[UnaryUnaryClientInterceptor],
+    channel: cygrpc.AioChannel, request_serializer: SerializingFunction,
+    response_deserializer: DeserializingFunction,
+    loop: asyncio.AbstractEventLoop
+) -> Callable[[ClientCallDetails, RequestType],
+              Awaitable[_base_call.UnaryUnaryCall]]:
+    """Chains unary-unary interceptors into a pipeline reusable across RPCs."""
+    pipeline = _UnaryUnaryInvocation(channel, request_serializer,
+                                     response_deserializer, loop)
+    for interceptor in reversed(interceptors):
+        pipeline = _UnaryUnaryContinuation(interceptor, pipeline)
+    return pipeline
+
+
+class _StreamUnaryInvocation:
+    """Invokes a stream-unary RPC at the end of a compiled interceptor chain."""
+
+    _channel: cygrpc.AioChannel
+    _request_serializer: SerializingFunction
+    _response_deserializer: DeserializingFunction
+    _loop: asyncio.AbstractEventLoop
+
+    def __init__(self, channel: cygrpc.AioChannel,
+                 request_serializer: SerializingFunction,
+                 response_deserializer: DeserializingFunction,
+                 loop: asyncio.AbstractEventLoop) -> None:
+        self._channel = channel
+        self._request_serializer = request_serializer
+        self._response_deserializer = response_deserializer
+        self._loop = loop
+
+    async def __call__(
+            self, client_call_details: ClientCallDetails,
+            request_iterator: RequestIterableType
+    ) -> _base_call.StreamUnaryCall:
+        return StreamUnaryCall(
+            request_iterator, _timeout_to_deadline(client_call_details.timeout),
+            client_call_details.metadata, client_call_details.credentials,
+            client_call_details.wait_for_ready, self._channel,
+            client_call_details.method, self._request_serializer,
+            self._response_deserializer, self._loop)
+
+
+class _StreamUnaryContinuation:
+    """Runs one interceptor of a compiled stream-unary interceptor chain."""
+
+    _interceptor: StreamUnaryClientInterceptor
+    _continuation: Callable[[ClientCallDetails, RequestIterableType],
+                            Awaitable[_base_call.StreamUnaryCall]]
+
+    def __init__(
+        self, interceptor: StreamUnaryClientInterceptor,
+        continuation: Callable[[ClientCallDetails, RequestIterableType],
+                               Awaitable[_base_call.StreamUnaryCall]]
+    ) -> None:
+        self._interceptor = interceptor
+        self._continuation = continuation
+
+    async def __call__(
+            self, client_call_details: ClientCallDetails,
+            request_iterator: RequestIterableType
+    ) -> _base_call.StreamUnaryCall:
+        return await self._interceptor.intercept_stream_unary(
+            self._continuation, client_call_details, request_iterator)
+
+
+def compile_stream_unary_interceptors(
+    interceptors: Sequence[StreamUnaryClientInterceptor],
+    channel: cygrpc.AioChannel, request_serializer: SerializingFunction,
+    response_deserializer: DeserializingFunction,
+    loop: asyncio.AbstractEventLoop
+) -> Callable[[ClientCallDetails, RequestIterableType],
+              Awaitable[_base_call.StreamUnaryCall]]:
+    """Chains stream-unary interceptors into a pipeline reusable across RPCs."""
+    pipeline = _StreamUnaryInvocation(channel, request_serializer,
+                                      response_deserializer, loop)
+    for interceptor in reversed(interceptors):
+        pipeline = _StreamUnaryContinuation(interceptor, pipeline)
+    return pipeline
+
 
 class InterceptedUnaryUnaryCall(_InterceptedUnaryResponseMixin, InterceptedCall,
                                 _base_call.UnaryUnaryCall):
@@ -554,64 +798,48 @@ class InterceptedUnaryUnaryCall(_InterceptedUnaryResponseMixin, InterceptedCall,
     _channel: cygrpc.AioChannel
 
     # pylint: disable=too-many-arguments
-    def __init__(self, interceptors: Sequence[UnaryUnaryClientInterceptor],
-                 request: RequestType, timeout: Optional[float],
-                 metadata: Metadata,
-                 credentials: Optional[grpc.CallCredentials],
-                 wait_for_ready: Optional[bool], channel: cygrpc.AioChannel,
-                 method: bytes, request_serializer: SerializingFunction,
-                 response_deserializer: DeserializingFunction,
-                 loop: asyncio.AbstractEventLoop) -> None:
+    def __init__(
+        self,
+        interceptors: Sequence[UnaryUnaryClientInterceptor],
+        request: RequestType,
+        timeout: Optional[float],
+        metadata: Metadata,
+        credentials: Optional[grpc.CallCredentials],
+        wait_for_ready: Optional[bool],
+        channel: cygrpc.AioChannel,
+        method: bytes,
+        request_serializer: SerializingFunction,
+        response_deserializer: DeserializingFunction,
+        loop: asyncio.AbstractEventLoop,
+        pipeline: Optional[
+            Callable[[ClientCallDetails, RequestType],
+                     Awaitable[_base_call.UnaryUnaryCall]]] = None
+    ) -> None:
         self._loop = loop
         self._channel = channel
+        if pipeline is None:
+            pipeline = compile_unary_unary_interceptors(interceptors, channel,
+                                                        request_serializer,
+                                                        response_deserializer,
+                                                        loop)
         interceptors_task = loop.create_task(
-            self._invoke(interceptors, method, timeout, metadata, credentials,
-                         wait_for_ready, request, request_serializer,
-                         response_deserializer))
+            self._invoke(pipeline, method, timeout, metadata, credentials,
+                         wait_for_ready, request))
         super().__init__(interceptors_task)
 
     # pylint: disable=too-many-arguments
-    async def _invoke(
-            self, interceptors: Sequence[UnaryUnaryClientInterceptor],
-            method: bytes, timeout: Optional[float],
-            metadata: Optional[Metadata],
-            credentials: Optional[grpc.CallCredentials],
-            wait_for_ready: Optional[bool], request: RequestType,
-            request_serializer: SerializingFunction,
-            response_deserializer: DeserializingFunction) -> UnaryUnaryCall:
+    async def _invoke(self,
+                      pipeline: Callable[[ClientCallDetails, RequestType],
+                                         Awaitable[_base_call.UnaryUnaryCall]],
+                      method: bytes, timeout: Optional[float],
+                      metadata: Optional[Metadata],
+                      credentials: Optional[grpc.CallCredentials],
+                      wait_for_ready: Optional[bool],
+                      request: RequestType) -> _base_call.UnaryUnaryCall:
         """Run the RPC call wrapped in interceptors"""
-
-        async def _run_interceptor(
-                interceptors: Iterator[UnaryUnaryClientInterceptor],
-                client_call_details: ClientCallDetails,
-                request: RequestType) -> _base_call.UnaryUnaryCall:
-
-            interceptor = next(interceptors, None)
-
-            if interceptor:
-                continuation = functools.partial(_run_interceptor, interceptors)
-
-                call_or_response = await interceptor.intercept_unary_unary(
-                    continuation, client_call_details, request)
-
-                if isinstance(call_or_response, _base_call.UnaryUnaryCall):
-                    return call_or_response
-                else:
-                    return UnaryUnaryCallResponse(call_or_response)
-
-            else:
-                return UnaryUnaryCall(
-                    request, _timeout_to_deadline(client_call_details.timeout),
-                    client_call_details.metadata,
-                    client_call_details.credentials,
-                    client_call_details.wait_for_ready, self._channel,
-                    client_call_details.method, request_serializer,
-                    response_deserializer, self._loop)
-
         client_call_details = ClientCallDetails(method, timeout, metadata,
                                                 credentials, wait_for_ready)
-        return await _run_interceptor(iter(interceptors), client_call_details,
-                                      request)
+        return await pipeline(client_call_details, request)
 
     def time_remaining(self) -> Optional[float]:
         raise NotImplementedError()
@@ -710,62 +938,49 @@ class InterceptedStreamUnaryCall(_InterceptedUnaryResponseMixin,
     _channel: cygrpc.AioChannel
 
     # pylint: disable=too-many-arguments
-    def __init__(self, interceptors: Sequence[StreamUnaryClientInterceptor],
-                 request_iterator: Optional[RequestIterableType],
-                 timeout: Optional[float], metadata: Metadata,
-                 credentials: Optional[grpc.CallCredentials],
-                 wait_for_ready: Optional[bool], channel: cygrpc.AioChannel,
-                 method: bytes, request_serializer: SerializingFunction,
-                 response_deserializer: DeserializingFunction,
-                 loop: asyncio.AbstractEventLoop) -> None:
+    def __init__(
+        self,
+        interceptors: Sequence[StreamUnaryClientInterceptor],
+        request_iterator: Optional[RequestIterableType],
+        timeout: Optional[float],
+        metadata: Metadata,
+        credentials: Optional[grpc.CallCredentials],
+        wait_for_ready: Optional[bool],
+        channel: cygrpc.AioChannel,
+        method: bytes,
+        request_serializer: SerializingFunction,
+        response_deserializer: DeserializingFunction,
+        loop: asyncio.AbstractEventLoop,
+        pipeline: Optional[
+            Callable[[ClientCallDetails, RequestIterableType],
+                     Awaitable[_base_call.StreamUnaryCall]]] = None
+    ) -> None:
         self._loop = loop
         self._channel = channel
         request_iterator = self._init_stream_request_mixin(request_iterator)
+        if pipeline is None:
+            pipeline = compile_stream_unary_interceptors(
+                interceptors, channel, request_serializer,
+                response_deserializer, loop)
         interceptors_task = loop.create_task(
-            self._invoke(interceptors, method, timeout, metadata, credentials,
-                         wait_for_ready, request_iterator, request_serializer,
-                         response_deserializer))
+            self._invoke(pipeline, method, timeout, metadata, credentials,
+                         wait_for_ready, request_iterator))
         super().__init__(interceptors_task)
 
     # pylint: disable=too-many-arguments
     async def _invoke(
-            self, interceptors: Sequence[StreamUnaryClientInterceptor],
+            self, pipeline: Callable[[ClientCallDetails, RequestIterableType],
+                                     Awaitable[_base_call.StreamUnaryCall]],
             method: bytes, timeout: Optional[float],
             metadata: Optional[Metadata],
             credentials: Optional[grpc.CallCredentials],
             wait_for_ready: Optional[bool],
-            request_iterator: RequestIterableType,
-            request_serializer: SerializingFunction,
-            response_deserializer: DeserializingFunction) -> StreamUnaryCall:
-        """Run the RPC call wrapped in interceptors"""
-
-        async def _run_interceptor(
-            interceptors: Iterator[UnaryUnaryClientInterceptor],
-            client_call_details: ClientCallDetails,
             request_iterator: RequestIterableType
-        ) -> _base_call.StreamUnaryCall:
-
-            interceptor = next(interceptors, None)
-
-            if interceptor:
-                continuation = functools.partial(_run_interceptor, interceptors)
-
-                return await interceptor.intercept_stream_unary(
-                    continuation, client_call_details, request_iterator)
-            else:
-                return StreamUnaryCall(
-                    request_iterator,
-                    _timeout_to_deadline(client_call_details.timeout),
-                    client_call_details.metadata,
-                    client_call_details.credentials,
-                    client_call_details.wait_for_ready, self._channel,
-                    client_call_details.method, request_serializer,
-                    response_deserializer, self._loop)
-
+    ) -> _base_call.StreamUnaryCall:
+        """Run the RPC call wrapped in interceptors"""
         client_call_details = ClientCallDetails(method, timeout, metadata,
                                                 credentials, wait_for_ready)
-        return await _run_interceptor(iter(interceptors), client_call_details,
-                                      request_iterator)
+        return await pipeline(client_call_details, request_iterator)
 
     def time_remaining(self) -> Optional[float]:
         raise NotImplementedError()
@@ -959,6 +1174,23 @@ class UnaryStreamCallResponseIterator(_StreamCallResponseIterator,
         # async iterator. So this path should not be reached.
         raise NotImplementedError()
 
+    async def read_many(self,
+                        max_messages: int,
+                        max_bytes: Optional[int] = None
+                       ) -> Union[EOFType, List[ResponseType]]:
+        # Behind the scenes everyting goes through the
+        # async iterator. So this path should not be reached.
+        raise NotImplementedError()
+
+    def read_batches(
+            self,
+            max_messages: int,
+            max_bytes: Optional[int] = None
+    ) -> AsyncIterable[List[ResponseType]]:
+        # Behind the scenes everyting goes through the
+        # async iterator. So this path should not be reached.
+        raise NotImplementedError()
+
 
 class StreamStreamCallResponseIterator(_StreamCallResponseIterator,
                                        _base_call.StreamStreamCall):
@@ -969,6 +1201,23 @@ class StreamStreamCallResponseIterator(_StreamCallResponseIterator,
         # async iterator. So this path should not be reached.
         raise NotImplementedError()
 
+    async def read_many(self,
+                        max_messages: int,
+                        max_bytes: Optional[int] = None
+                       ) -> Union[EOFType, List[ResponseType]]:
+        # Behind the scenes everyting goes through the
+        # async iterator. So this path should not be reached.
+        raise NotImplementedError()
+
+    def read_batches(
+            self,
+            max_messages: int,
+            max_bytes: Optional[int] = None
+    ) -> AsyncIterable[List[ResponseType]]:
+        # Behind the scenes everyting goes through the
+        # async iterator. So this path should not be reached.
+        raise NotImplementedError()
+
     async def write(self, request: RequestType) -> None:
         # Behind the scenes everyting goes through the
         # async iterator provided by the InterceptedStreamStreamCall.
@@ -981,6 +1230,15 @@ class StreamStreamCallResponseIterator(_StreamCallResponseIterator,
         # So this path should not be reached.
         raise NotImplementedError()
 
+    async def drain(self) -> None:
+        # Behind the scenes everyting goes through the
+        # async iterator provided by the InterceptedStreamStreamCall.
+        # So this path should not be reached.
+        raise NotImplementedError()
+
     @property
     def _done_writing_flag(self) -> bool:
         return self._call._done_writing_flag
+
+    async def _drain(self) -> None:
+        await self._call._drain()
@@ -14,9 +14,11 @@
 """Server-side implementation of gRPC Asyncio Python."""
 
 from concurrent.futures import Executor
-from typing import Any, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import grpc
+import grpc.experimental
+from grpc.experimental import _PYTHON_SERVER_OPTIONS
 from grpc import _common, _compression
 from grpc._cython import cygrpc
 
@@ -24,6 +26,8 @@ from . import _base_server
 from ._typing import ChannelArgumentType
 from ._interceptor import ServerInterceptor
 
+_DEFAULT_PENDING_REQUEST_CALLS = 1
+
 
 def _augment_channel_arguments(base_options: ChannelArgumentType,
                                compression: Optional[grpc.Compression]):
@@ -50,10 +54,23 @@ class Server(_base_server.Server):
                 raise ValueError(
                     'Interceptor must be ServerInterceptor, the '
                     f'following are invalid: {invalid_interceptors}')
+        python_options, core_options = _common.separate_options(
+            options, _PYTHON_SERVER_OPTIONS)
+        zero_copy_receive = bool(
+            python_options.get(grpc.experimental.ChannelOptions.ZeroCopyReceive,
+                               False))
+        pending_request_calls = _common.integer_option(
+            python_options, grpc.experimental.ServerOptions.PendingRequestCalls,
+            _DEFAULT_PENDING_REQUEST_CALLS, 1)
+        method_concurrency_limits = python_options.get(
+            grpc.experimental.ServerOptions.MaximumConcurrentRpcsPerMethod)
+        if method_concurrency_limits is not None:
+            method_concurrency_limits = dict(method_concurrency_limits)
         self._server = cygrpc.AioServer(
             self._loop, thread_pool, generic_handlers, interceptors,
-            _augment_channel_arguments(options, compression),
-            maximum_concurrent_rpcs)
+            _augment_channel_arguments(core_options,
+                                       compression), maximum_concurrent_rpcs,
+            zero_copy_receive, pending_request_calls, method_concurrency_limits)
 
     def add_generic_rpc_handlers(
             self,
@@ -158,6 +175,19 @@ class Server(_base_server.Server):
         """
         return await self._server.wait_for_termination(timeout)
 
+    def concurrency_metrics(self) -> Dict[Optional[str], Tuple[int, int]]:
+        """Reports the load on the concurrency limits of this server.
+
+        This is an EXPERIMENTAL API.
+
+        Returns:
+          A dict mapping each fully-qualified method name given in
+          grpc.experimental.ServerOptions.MaximumConcurrentRpcsPerMethod, and
+          None for the maximum_concurrent_rpcs limit if set, to a pair of the
+          number of RPCs currently admitted and currently queued by that limit.
+        """
+        return self._server.concurrency_metrics()
+
     def __del__(self):
         """Schedules a graceful shutdown in current event loop.
 
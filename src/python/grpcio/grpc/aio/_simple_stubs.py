@@ -0,0 +1,471 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Functions that obviate explicit aio channels, backed by per-loop caches."""
+
+import asyncio
+import collections
+import logging
+from typing import (Any, AnyStr, AsyncIterable, Callable, Dict, Iterable, List,
+                    Optional, Sequence, Set, Tuple, Union)
+
+import grpc
+from grpc._cython import cygrpc
+# grpc.experimental must finish importing before grpc._simple_stubs, which it
+# imports in turn.
+from grpc.experimental import experimental_api
+from grpc._simple_stubs import (_CacheKey, _channel_credentials,
+                                _DEFAULT_TIMEOUT, _EVICTION_PERIOD_SECONDS,
+                                _MAXIMUM_CHANNELS, RequestType, ResponseType)
+
+from . import _base_call
+from ._base_channel import Channel
+from ._channel import secure_channel
+from ._metadata import Metadata
+
+_LOGGER = logging.getLogger(__name__)
+
+RequestIterableType = Union[Iterable[Any], AsyncIterable[Any]]
+MetadataType = Union[Metadata, Sequence[Tuple[str, Union[str, bytes]]]]
+
+
+class _ChannelCache:
+    """The channels cached for the simple stubs on a single event loop.
+
+    As with the aio objects it holds, the cache may only be used from the
+    thread running its loop, so it needs no locking. Each channel is evicted
+    after a fixed period without use, or as soon as it is the least recently
+    used one of more than the maximum number of channels. All of the channels
+    are closed and the cache dropped once the loop cancels its remaining
+    tasks, as asyncio.run does before closing the loop.
+    """
+    _loop: asyncio.AbstractEventLoop
+    # The channels, from the least to the most recently used, each with its
+    # eviction time on the loop's clock and its multicallables.
+    _channels: Dict[_CacheKey, List[Any]]
+    _eviction_timer: Optional[asyncio.TimerHandle]
+    _closing: Set[asyncio.Task]
+    _closer: asyncio.Task
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._channels = collections.OrderedDict()
+        self._eviction_timer = None
+        self._closing = set()
+        self._closer = loop.create_task(self._close_on_cancellation())
+        # A loop closed without cancelling its tasks leaves the closer
+        # pending, which is expected rather than worth a warning.
+        self._closer._log_destroy_pending = False  # pylint: disable=protected-access
+
+    async def _close_on_cancellation(self) -> None:
+        try:
+            await self._loop.create_future()
+        except asyncio.CancelledError:
+            if _channel_caches.get(self._loop) is self:
+                del _channel_caches[self._loop]
+            if self._eviction_timer is not None:
+                self._eviction_timer.cancel()
+                self._eviction_timer = None
+            channels = [channel for channel, _, _ in self._channels.values()]
+            self._channels.clear()
+            await asyncio.gather(*(channel.close() for channel in channels),
+                                 *self._closing)
+            raise
+
+    def _evict_oldest(self) -> None:
+        key, (channel, _, _) = self._channels.popitem(last=False)
+        _LOGGER.debug("Evicting channel %s with configuration %s.", channel,
+                      key)
+        closing = self._loop.create_task(channel.close())
+        self._closing.add(closing)
+        closing.add_done_callback(self._closing.discard)
+
+    def _schedule_eviction(self) -> None:
+        if self._channels:
+            eviction_time = next(iter(self._channels.values()))[1]
+            self._eviction_timer = self._loop.call_at(eviction_time,
+                                                      self._perform_evictions)
+        else:
+            self._eviction_timer = None
+
+    def _perform_evictions(self) -> None:
+        now = self._loop.time()
+        while self._channels and next(iter(self._channels.values()))[1] <= now:
+            self._evict_oldest()
+        self._schedule_eviction()
+
+    def _get_channel_data(self, target: str, options: Sequence[Tuple[
+        str, str]], channel_credentials: Optional[grpc.ChannelCredentials],
+                          insecure: bool,
+                          compression: Optional[grpc.Compression]) -> List[Any]:
+        channel_credentials = _channel_credentials(channel_credentials,
+                                                   insecure)
+        if not isinstance(options, tuple):
+            options = tuple(options)
+        key = _CacheKey((target, options, channel_credentials, compression),
+                        options)
+        channel_data = self._channels.get(key)
+        if channel_data is not None:
+            self._channels.move_to_end(key)
+            channel_data[1] = self._loop.time() + _EVICTION_PERIOD_SECONDS
+            return channel_data
+        _LOGGER.debug(
+            "Creating aio channel with credentials '%s', options '%s' and " +
+            "compression '%s'", channel_credentials, options, compression)
+        channel = secure_channel(target, channel_credentials, options,
+                                 compression)
+        channel_data = [
+            channel, self._loop.time() + _EVICTION_PERIOD_SECONDS, {}
+        ]
+        self._channels[key] = channel_data
+        if len(self._channels) > _MAXIMUM_CHANNELS:
+            self._evict_oldest()
+        if self._eviction_timer is None:
+            self._schedule_eviction()
+        return channel_data
+
+    def get_channel(self, target: str, options: Sequence[Tuple[str, str]],
+                    channel_credentials: Optional[grpc.ChannelCredentials],
+                    insecure: bool,
+                    compression: Optional[grpc.Compression]) -> Channel:
+        return self._get_channel_data(target, options, channel_credentials,
+                                      insecure, compression)[0]
+
+    def get_multicallable(
+            self, target: str, options: Sequence[Tuple[str, str]],
+            channel_credentials: Optional[grpc.ChannelCredentials],
+            insecure: bool, compression: Optional[grpc.Compression], arity: str,
+            method: str, request_serializer: Optional[Callable[[Any], bytes]],
+            response_deserializer: Optional[Callable[[bytes], Any]]) -> Any:
+        """Gets a multicallable of a cached channel, creating both as needed.
+
+        Args:
+          arity: The name of the Channel method creating the multicallable,
+            e.g. 'unary_unary'.
+        """
+        channel, _, multicallables = self._get_channel_data(
+            target, options, channel_credentials, insecure, compression)
+        multicallable_key = (arity, method, request_serializer,
+                             response_deserializer)
+        multicallable = multicallables.get(multicallable_key)
+        if multicallable is None:
+            multicallable = getattr(channel, arity)(method, request_serializer,
+                                                    response_deserializer)
+            multicallables[multicallable_key] = multicallable
+        return multicallable
+
+    def _test_only_channel_count(self) -> int:
+        return len(self._channels)
+
+
+# The channel cache of each event loop.
+_channel_caches: Dict[asyncio.AbstractEventLoop, _ChannelCache] = {}
+
+
+def _channel_cache() -> _ChannelCache:
+    loop = cygrpc.get_working_loop()
+    cache = _channel_caches.get(loop)
+    if cache is None:
+        # Drop the caches of loops that have since been closed without
+        # cancelling their tasks, whose channels can no longer be used.
+        for closed_loop in tuple(cached_loop for cached_loop in _channel_caches
+                                 if cached_loop.is_closed()):
+            del _channel_caches[closed_loop]
+        cache = _ChannelCache(loop)
+        _channel_caches[loop] = cache
+    return cache
+
+
+@experimental_api
+async def unary_unary(request: RequestType,
+                      target: str,
+                      method: str,
+                      request_serializer: Optional[Callable[[Any],
+                                                            bytes]] = None,
+                      response_deserializer: Optional[Callable[[bytes],
+                                                               Any]] = None,
+                      options: Sequence[Tuple[AnyStr, AnyStr]] = (),
+                      channel_credentials: Optional[
+                          grpc.ChannelCredentials] = None,
+                      insecure: bool = False,
+                      call_credentials: Optional[grpc.CallCredentials] = None,
+                      compression: Optional[grpc.Compression] = None,
+                      wait_for_ready: Optional[bool] = None,
+                      timeout: Optional[float] = _DEFAULT_TIMEOUT,
+                      metadata: Optional[MetadataType] = None) -> ResponseType:
+    """Invokes a unary-unary RPC without an explicitly specified channel.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    This is the asyncio counterpart of grpc.experimental.unary_unary. It is
+    backed by a cache of aio channels per event loop, with the same eviction
+    period and maximum number of channels as the cache of the synchronous
+    functions, as configured by the
+    "GRPC_PYTHON_MANAGED_CHANNEL_EVICTION_SECONDS" and
+    "GRPC_PYTHON_MANAGED_CHANNEL_MAXIMUM" environment variables.
+
+    Args:
+      request: The request value for the RPC.
+      target: The server address.
+      method: The name of the RPC method.
+      request_serializer: Optional :term:`serializer` for serializing the request
+        message. Request goes unserialized in case None is passed.
+      response_deserializer: Optional :term:`deserializer` for deserializing the response
+        message. Response goes undeserialized in case None is passed.
+      options: An optional list of key-value pairs (:term:`channel_arguments` in gRPC Core
+        runtime) to configure the channel.
+      channel_credentials: A credential applied to the whole channel, e.g. the
+        return value of grpc.ssl_channel_credentials() or
+        grpc.insecure_channel_credentials().
+      insecure: If True, specifies channel_credentials as
+        :term:`grpc.insecure_channel_credentials()`. This option is mutually
+        exclusive with the `channel_credentials` option.
+      call_credentials: A call credential applied to each call individually,
+        e.g. the output of grpc.metadata_call_credentials() or
+        grpc.access_token_call_credentials().
+      compression: An optional value indicating the compression method to be
+        used over the lifetime of the channel, e.g. grpc.Compression.Gzip.
+      wait_for_ready: An optional flag indicating whether the RPC should fail
+        immediately if the connection is not ready at the time the RPC is
+        invoked, or if it should wait until the connection to the server
+        becomes ready. Defaults to True.
+      timeout: An optional duration of time in seconds to allow for the RPC,
+        after which an exception will be raised. If timeout is unspecified,
+        defaults to a timeout controlled by the
+        GRPC_PYTHON_DEFAULT_TIMEOUT_SECONDS environment variable. If that is
+        unset, defaults to 60 seconds. Supply a value of None to indicate that
+        no timeout should be enforced.
+      metadata: Optional metadata to send to the server.
+
+    Returns:
+      The response to the RPC.
+    """
+    multicallable = _channel_cache().get_multicallable(
+        target, options, channel_credentials, insecure, compression,
+        'unary_unary', method, request_serializer, response_deserializer)
+    wait_for_ready = wait_for_ready if wait_for_ready is not None else True
+    return await multicallable(request,
+                               metadata=metadata,
+                               wait_for_ready=wait_for_ready,
+                               credentials=call_credentials,
+                               timeout=timeout)
+
+
+@experimental_api
+def unary_stream(
+        request: RequestType,
+        target: str,
+        method: str,
+        request_serializer: Optional[Callable[[Any], bytes]] = None,
+        response_deserializer: Optional[Callable[[bytes], Any]] = None,
+        options: Sequence[Tuple[AnyStr, AnyStr]] = (),
+        channel_credentials: Optional[grpc.ChannelCredentials] = None,
+        insecure: bool = False,
+        call_credentials: Optional[grpc.CallCredentials] = None,
+        compression: Optional[grpc.Compression] = None,
+        wait_for_ready: Optional[bool] = None,
+        timeout: Optional[float] = _DEFAULT_TIMEOUT,
+        metadata: Optional[MetadataType] = None) -> _base_call.UnaryStreamCall:
+    """Invokes a unary-stream RPC without an explicitly specified channel.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    This is the asyncio counterpart of grpc.experimental.unary_stream and
+    must be called from a coroutine. The channel is cached as described in
+    unary_unary.
+
+    Args:
+      request: The request value for the RPC.
+      target: The server address.
+      method: The name of the RPC method.
+      request_serializer: Optional :term:`serializer` for serializing the request
+        message. Request goes unserialized in case None is passed.
+      response_deserializer: Optional :term:`deserializer` for deserializing the response
+        message. Response goes undeserialized in case None is passed.
+      options: An optional list of key-value pairs (:term:`channel_arguments` in gRPC Core
+        runtime) to configure the channel.
+      channel_credentials: A credential applied to the whole channel, e.g. the
+        return value of grpc.ssl_channel_credentials().
+      insecure: If True, specifies channel_credentials as
+        :term:`grpc.insecure_channel_credentials()`. This option is mutually
+        exclusive with the `channel_credentials` option.
+      call_credentials: A call credential applied to each call individually,
+        e.g. the output of grpc.metadata_call_credentials() or
+        grpc.access_token_call_credentials().
+      compression: An optional value indicating the compression method to be
+        used over the lifetime of the channel, e.g. grpc.Compression.Gzip.
+      wait_for_ready: An optional flag indicating whether the RPC should fail
+        immediately if the connection is not ready at the time the RPC is
+        invoked, or if it should wait until the connection to the server
+        becomes ready. Defaults to True.
+      timeout: An optional duration of time in seconds to allow for the RPC,
+        after which an exception will be raised. If timeout is unspecified,
+        defaults to a timeout controlled by the
+        GRPC_PYTHON_DEFAULT_TIMEOUT_SECONDS environment variable. If that is
+        unset, defaults to 60 seconds. Supply a value of None to indicate that
+        no timeout should be enforced.
+      metadata: Optional metadata to send to the server.
+
+    Returns:
+      A UnaryStreamCall whose responses may be iterated asynchronously.
+    """
+    multicallable = _channel_cache().get_multicallable(
+        target, options, channel_credentials, insecure, compression,
+        'unary_stream', method, request_serializer, response_deserializer)
+    wait_for_ready = wait_for_ready if wait_for_ready is not None else True
+    return multicallable(request,
+                         metadata=metadata,
+                         wait_for_ready=wait_for_ready,
+                         credentials=call_credentials,
+                         timeout=timeout)
+
+
+@experimental_api
+async def stream_unary(request_iterator: RequestIterableType,
+                       target: str,
+                       method: str,
+                       request_serializer: Optional[Callable[[Any],
+                                                             bytes]] = None,
+                       response_deserializer: Optional[Callable[[bytes],
+                                                                Any]] = None,
+                       options: Sequence[Tuple[AnyStr, AnyStr]] = (),
+                       channel_credentials: Optional[
+                           grpc.ChannelCredentials] = None,
+                       insecure: bool = False,
+                       call_credentials: Optional[grpc.CallCredentials] = None,
+                       compression: Optional[grpc.Compression] = None,
+                       wait_for_ready: Optional[bool] = None,
+                       timeout: Optional[float] = _DEFAULT_TIMEOUT,
+                       metadata: Optional[MetadataType] = None) -> ResponseType:
+    """Invokes a stream-unary RPC without an explicitly specified channel.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    This is the asyncio counterpart of grpc.experimental.stream_unary. The
+    channel is cached as described in unary_unary.
+
+    Args:
+      request_iterator: An iterable or async iterable that yields request
+        values for the RPC.
+      target: The server address.
+      method: The name of the RPC method.
+      request_serializer: Optional :term:`serializer` for serializing the request
+        message. Request goes unserialized in case None is passed.
+      response_deserializer: Optional :term:`deserializer` for deserializing the response
+        message. Response goes undeserialized in case None is passed.
+      options: An optional list of key-value pairs (:term:`channel_arguments` in gRPC Core
+        runtime) to configure the channel.
+      channel_credentials: A credential applied to the whole channel, e.g. the
+        return value of grpc.ssl_channel_credentials().
+      insecure: If True, specifies channel_credentials as
+        :term:`grpc.insecure_channel_credentials()`. This option is mutually
+        exclusive with the `channel_credentials` option.
+      call_credentials: A call credential applied to each call individually,
+        e.g. the output of grpc.metadata_call_credentials() or
+        grpc.access_token_call_credentials().
+      compression: An optional value indicating the compression method to be
+        used over the lifetime of the channel, e.g. grpc.Compression.Gzip.
+      wait_for_ready: An optional flag indicating whether the RPC should fail
+        immediately if the connection is not ready at the time the RPC is
+        invoked, or if it should wait until the connection to the server
+        becomes ready. Defaults to True.
+      timeout: An optional duration of time in seconds to allow for the RPC,
+        after which an exception will be raised. If timeout is unspecified,
+        defaults to a timeout controlled by the
+        GRPC_PYTHON_DEFAULT_TIMEOUT_SECONDS environment variable. If that is
+        unset, defaults to 60 seconds. Supply a value of None to indicate that
+        no timeout should be enforced.
+      metadata: Optional metadata to send to the server.
+
+    Returns:
+      The response to the RPC.
+    """
+    multicallable = _channel_cache().get_multicallable(
+        target, options, channel_credentials, insecure, compression,
+        'stream_unary', method, request_serializer, response_deserializer)
+    wait_for_ready = wait_for_ready if wait_for_ready is not None else True
+    return await multicallable(request_iterator,
+                               metadata=metadata,
+                               wait_for_ready=wait_for_ready,
+                               credentials=call_credentials,
+                               timeout=timeout)
+
+
+@experimental_api
+def stream_stream(
+        request_iterator: RequestIterableType,
+        target: str,
+        method: str,
+        request_serializer: Optional[Callable[[Any], bytes]] = None,
+        response_deserializer: Optional[Callable[[bytes], Any]] = None,
+        options: Sequence[Tuple[AnyStr, AnyStr]] = (),
+        channel_credentials: Optional[grpc.ChannelCredentials] = None,
+        insecure: bool = False,
+        call_credentials: Optional[grpc.CallCredentials] = None,
+        compression: Optional[grpc.Compression] = None,
+        wait_for_ready: Optional[bool] = None,
+        timeout: Optional[float] = _DEFAULT_TIMEOUT,
+        metadata: Optional[MetadataType] = None) -> _base_call.StreamStreamCall:
+    """Invokes a stream-stream RPC without an explicitly specified channel.
+
+    THIS IS AN EXPERIMENTAL API.
+
+    This is the asyncio counterpart of grpc.experimental.stream_stream and
+    must be called from a coroutine. The channel is cached as described in
+    unary_unary.
+
+    Args:
+      request_iterator: An iterable or async iterable that yields request
+        values for the RPC.
+      target: The server address.
+      method: The name of the RPC method.
+      request_serializer: Optional :term:`serializer` for serializing the request
+        message. Request goes unserialized in case None is passed.
+      response_deserializer: Optional :term:`deserializer` for deserializing the response
+        message. Response goes undeserialized in case None is passed.
+      options: An optional list of key-value pairs (:term:`channel_arguments` in gRPC Core
+        runtime) to configure the channel.
+      channel_credentials: A credential applied to the whole channel, e.g. the
+        return value of grpc.ssl_channel_credentials().
+      insecure: If True, specifies channel_credentials as
+        :term:`grpc.insecure_channel_credentials()`. This option is mutually
+        exclusive with the `channel_credentials` option.
+      call_credentials: A call credential applied to each call individually,
+        e.g. the output of grpc.metadata_call_credentials() or
+        grpc.access_token_call_credentials().
+      compression: An optional value indicating the compression method to be
+        used over the lifetime of the channel, e.g. grpc.Compression.Gzip.
+      wait_for_ready: An optional flag indicating whether the RPC should fail
+        immediately if the connection is not ready at the time the RPC is
+        invoked, or if it should wait until the connection to the server
+        becomes ready. Defaults to True.
+      timeout: An optional duration of time in seconds to allow for the RPC,
+        after which an exception will be raised. If timeout is unspecified,
+        defaults to a timeout controlled by the
+        GRPC_PYTHON_DEFAULT_TIMEOUT_SECONDS environment variable. If that is
+        unset, defaults to 60 seconds. Supply a value of None to indicate that
+        no timeout should be enforced.
+      metadata: Optional metadata to send to the server.
+
+    Returns:
+      A StreamStreamCall whose responses may be iterated asynchronously.
+    """
+    multicallable = _channel_cache().get_multicallable(
+        target, options, channel_credentials, insecure, compression,
+        'stream_stream', method, request_serializer, response_deserializer)
+    wait_for_ready = wait_for_ready if wait_for_ready is not None else True
+    return multicallable(request_iterator,
+                         metadata=metadata,
+                         wait_for_ready=wait_for_ready,
+                         credentials=call_credentials,
+                         timeout=timeout)
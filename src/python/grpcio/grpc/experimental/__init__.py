@@ -22,6 +22,8 @@ import sys
 import warnings
 
 import grpc
+from grpc._channel_pool import ChannelPool
+from grpc._deadline_propagation import propagate_deadline
 from grpc._cython import cygrpc as _cygrpc
 
 _EXPERIMENTAL_APIS_USED = set()
@@ -34,8 +36,90 @@ class ChannelOptions(object):
 
      Attributes:
        SingleThreadedUnaryStream: Perform unary-stream RPCs on a single thread.
+       ZeroCopyReceive: Hand received messages to the deserializer as
+         read-only memoryview objects backed by gRPC Core's buffers instead of
+         copying them into bytes. Also honored by servers. Deserializers must
+         accept bytes-like objects; without one, the application receives the
+         memoryview itself.
+       CompletionQueuePollers: The number of threads, each polling its own
+         completion queue, that the channel uses to run the event handling of
+         RPCs not invoked synchronously, as a positive integer. Each RPC is
+         placed on the least loaded poller. Defaults to 1.
+       ReadAheadMessages: The number of responses of unary-stream and
+         stream-stream RPCs that are received and deserialized ahead of the
+         application iterating over them, as a non-negative integer. Defaults
+         to 0, which receives each message only once the application asks for
+         it.
+       ReadAheadBytes: The serialized size of the responses received ahead of
+         the application at which the channel stops receiving further
+         messages of an RPC until the application catches up, as a positive
+         integer. Only relevant with ReadAheadMessages. Defaults to 4 MiB.
+       CoalescedWriteBytes: The serialized size of the requests of
+         stream-unary and stream-stream RPCs that may be queued while earlier
+         requests are being written, as a non-negative integer. Requests are
+         then taken from the request iterator without waiting for each write
+         to complete, and those followed by further queued requests are
+         written with a buffer hint so that gRPC Core coalesces them.
+         On AsyncIO channels, the write method of a call returns once the
+         request is queued, and its drain method waits for the queued
+         requests to be written. Defaults to 0, which takes each request only
+         once the previous one has been written.
+       CoalescedWriteMessages: The number of requests of stream-unary and
+         stream-stream RPCs that may be queued while earlier requests are
+         being written, as a non-negative integer. Only relevant with
+         CoalescedWriteBytes, and only honored by AsyncIO channels. Defaults
+         to 0, which places no limit on the number of queued requests.
     """
     SingleThreadedUnaryStream = "SingleThreadedUnaryStream"
+    ZeroCopyReceive = "ZeroCopyReceive"
+    CompletionQueuePollers = "CompletionQueuePollers"
+    ReadAheadMessages = "ReadAheadMessages"
+    ReadAheadBytes = "ReadAheadBytes"
+    CoalescedWriteBytes = "CoalescedWriteBytes"
+    CoalescedWriteMessages = "CoalescedWriteMessages"
+
+
+class ServerOptions(object):
+    """Indicates a server option unique to gRPC Python.
+
+     This enumeration is part of an EXPERIMENTAL API.
+
+     Attributes:
+       PendingRequestCalls: The number of calls the server keeps requested from
+         gRPC Core ahead of their arrival, as a positive integer. Defaults to 1.
+         With several CompletionQueuePollers, this many are kept per poller.
+       CompletionQueuePollers: The number of threads, each polling its own
+         completion queue, that the server uses to receive calls and run their
+         completion callbacks. Calls are spread across the pollers. Defaults
+         to 1.
+       MaximumConcurrentRpcsPerMethod: A mapping from fully-qualified method
+         name to the maximum number of RPCs of that method the server handles
+         at once. Further RPCs of the method wait, in arrival order, until one
+         finishes. Only supported by AsyncIO servers; other servers raise
+         ValueError.
+    """
+    PendingRequestCalls = "PendingRequestCalls"
+    CompletionQueuePollers = "CompletionQueuePollers"
+    MaximumConcurrentRpcsPerMethod = "MaximumConcurrentRpcsPerMethod"
+
+
+# The options handled by gRPC Python itself rather than passed to gRPC Core as
+# channel arguments.
+_PYTHON_CHANNEL_OPTIONS = frozenset((
+    ChannelOptions.SingleThreadedUnaryStream,
+    ChannelOptions.ZeroCopyReceive,
+    ChannelOptions.CompletionQueuePollers,
+    ChannelOptions.ReadAheadMessages,
+    ChannelOptions.ReadAheadBytes,
+    ChannelOptions.CoalescedWriteBytes,
+    ChannelOptions.CoalescedWriteMessages,
+))
+_PYTHON_SERVER_OPTIONS = frozenset((
+    ChannelOptions.ZeroCopyReceive,
+    ServerOptions.PendingRequestCalls,
+    ServerOptions.CompletionQueuePollers,
+    ServerOptions.MaximumConcurrentRpcsPerMethod,
+))
 
 
 class UsageError(Exception):
@@ -114,12 +198,18 @@ def wrap_server_method_handler(wrapper, handler):
 
 __all__ = (
     'ChannelOptions',
+    'ChannelPool',
     'ExperimentalApiWarning',
+    'ServerOptions',
     'UsageError',
     'insecure_channel_credentials',
+    'propagate_deadline',
     'wrap_server_method_handler',
 )
 
 if sys.version_info > (3, 6):
     from grpc._simple_stubs import unary_unary, unary_stream, stream_unary, stream_stream
+    from grpc._simple_stubs import ChannelCacheStats, prewarm_channel, unpin_channel, channel_cache_stats
     __all__ = __all__ + (unary_unary, unary_stream, stream_unary, stream_stream)
+    __all__ = __all__ + ('ChannelCacheStats', 'prewarm_channel',
+                         'unpin_channel', 'channel_cache_stats')
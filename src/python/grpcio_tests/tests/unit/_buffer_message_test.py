@@ -0,0 +1,108 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests sending serialized messages that are bytes-like but not bytes."""
+
+import logging
+import mmap
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+
+_SMALL_MESSAGE = b'\x01\x02\x03'
+_LARGE_MESSAGE = b'\x07' * (4 * 1024 * 1024)
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+def _handle_unary_unary(request, servicer_context):
+    return request
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+def _mmap_serializer(message):
+    region = mmap.mmap(-1, len(message))
+    region.write(message)
+    return region
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                _handle_unary_unary, response_serializer=bytearray)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(
+                _handle_stream_stream, response_serializer=memoryview)
+        else:
+            return None
+
+
+class BufferMessageTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def _unary_unary(self, request_serializer, request):
+        multi_callable = self._channel.unary_unary(
+            _UNARY_UNARY, request_serializer=request_serializer)
+        return multi_callable(request)
+
+    def testBytearray(self):
+        for message in (_SMALL_MESSAGE, _LARGE_MESSAGE):
+            self.assertEqual(message, self._unary_unary(bytearray, message))
+
+    def testMemoryview(self):
+        for message in (_SMALL_MESSAGE, _LARGE_MESSAGE):
+            self.assertEqual(message, self._unary_unary(memoryview, message))
+
+    def testMemoryviewSlice(self):
+        backing = b'\x00' + _LARGE_MESSAGE + b'\x00'
+        response = self._unary_unary(lambda message: memoryview(message)[1:-1],
+                                     backing)
+        self.assertEqual(_LARGE_MESSAGE, response)
+
+    def testMmap(self):
+        self.assertEqual(_LARGE_MESSAGE,
+                         self._unary_unary(_mmap_serializer, _LARGE_MESSAGE))
+
+    def testStreamStream(self):
+        requests = [_SMALL_MESSAGE, _LARGE_MESSAGE] * 4
+        multi_callable = self._channel.stream_stream(
+            _STREAM_STREAM, request_serializer=bytearray)
+        self.assertSequenceEqual(requests, list(multi_callable(iter(requests))))
+
+    def testNonBufferMessageRejected(self):
+        with self.assertRaises(TypeError):
+            self._unary_unary(lambda message: object(), _SMALL_MESSAGE)
+
+
+if __name__ == '__main__':
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,151 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of grpc.experimental.ChannelPool."""
+
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_POOL_SIZE = 3
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_BLOCKING_UNARY_UNARY = '/test/BlockingUnaryUnary'
+_UNARY_STREAM = '/test/UnaryStream'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+class _Handler(object):
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def handle_unary_unary(self, request, servicer_context):
+        return request
+
+    def handle_blocking_unary_unary(self, request, servicer_context):
+        self.release.wait()
+        return request
+
+    def handle_unary_stream(self, request, servicer_context):
+        for _ in range(test_constants.STREAM_LENGTH):
+            yield request
+
+    def handle_stream_stream(self, request_iterator, servicer_context):
+        self.release.wait()
+        for request in request_iterator:
+            yield request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def __init__(self, handler):
+        self._handler = handler
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                self._handler.handle_unary_unary)
+        elif handler_call_details.method == _BLOCKING_UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                self._handler.handle_blocking_unary_unary)
+        elif handler_call_details.method == _UNARY_STREAM:
+            return grpc.unary_stream_rpc_method_handler(
+                self._handler.handle_unary_stream)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(
+                self._handler.handle_stream_stream)
+        else:
+            return None
+
+
+class ChannelPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self._handler = _Handler()
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(self._handler),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._pool = grpc.experimental.ChannelPool('localhost:%d' % port,
+                                                   _POOL_SIZE)
+
+    def tearDown(self):
+        self._handler.release.set()
+        self._pool.close()
+        self._server.stop(None)
+
+    def testUnaryUnary(self):
+        multi_callable = self._pool.unary_unary(_UNARY_UNARY)
+        request = b'\x07\x08'
+        self.assertEqual(request, multi_callable(request))
+        response, call = multi_callable.with_call(request)
+        self.assertEqual(request, response)
+        self.assertIs(grpc.StatusCode.OK, call.code())
+        self.assertEqual((0,) * _POOL_SIZE, self._pool._load.in_flight())
+        self.assertEqual(request, multi_callable.future(request).result())
+
+    def testUnaryStream(self):
+        multi_callable = self._pool.unary_stream(_UNARY_STREAM)
+        request = b'\x07\x08'
+        responses = tuple(multi_callable(request))
+        self.assertEqual((request,) * test_constants.STREAM_LENGTH, responses)
+
+    def testRpcsSpreadAcrossChannels(self):
+        multi_callable = self._pool.stream_stream(_STREAM_STREAM)
+        requests = (b'\x07\x08',)
+        response_iterators = tuple(
+            multi_callable(iter(requests)) for _ in range(2 * _POOL_SIZE))
+        self.assertEqual((2,) * _POOL_SIZE, self._pool._load.in_flight())
+
+        self._handler.release.set()
+        for response_iterator in response_iterators:
+            self.assertEqual(requests, tuple(response_iterator))
+            self.assertIs(grpc.StatusCode.OK, response_iterator.code())
+
+    def testBatchSpreadAcrossChannels(self):
+        multi_callable = self._pool.unary_unary(_BLOCKING_UNARY_UNARY)
+        requests = tuple(
+            bytes(bytearray((index,))) for index in range(2 * _POOL_SIZE))
+        results = []
+        batch_thread = threading.Thread(
+            target=lambda: results.extend(multi_callable.batch(requests)))
+        batch_thread.start()
+        # Each request of the batch counts as an RPC of its own.
+        while self._pool._load.in_flight() != (2,) * _POOL_SIZE:
+            self.assertTrue(batch_thread.is_alive())
+            time.sleep(0.01)
+
+        self._handler.release.set()
+        batch_thread.join()
+        self.assertEqual(requests, tuple(response for response, _ in results))
+        self.assertEqual((0,) * _POOL_SIZE, self._pool._load.in_flight())
+
+    def testChannelReadyFuture(self):
+        grpc.channel_ready_future(
+            self._pool).result(timeout=test_constants.LONG_TIMEOUT)
+
+    def testInvalidSize(self):
+        with self.assertRaises(ValueError):
+            grpc.experimental.ChannelPool('localhost:1234', 0)
+
+
+if __name__ == '__main__':
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,127 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the coalesced writes of requests of streaming RPCs."""
+
+import logging
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_COALESCED_WRITE_BYTES = 1024
+
+_STREAM_UNARY = '/test/StreamUnary'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+def _coalesced_write_options(coalesced_write_bytes):
+    return ((grpc.experimental.ChannelOptions.CoalescedWriteBytes,
+             coalesced_write_bytes),)
+
+
+def _requests():
+    return tuple(
+        bytes(bytearray([index % 256])) * (index % 7 + 1)
+        for index in range(test_constants.STREAM_LENGTH))
+
+
+def _failing_requests():
+    for request in _requests()[:test_constants.STREAM_LENGTH // 2]:
+        yield request
+    raise ValueError('Failed to produce a request!')
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    return b''.join(request_iterator)
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _STREAM_UNARY:
+            return grpc.stream_unary_rpc_method_handler(_handle_stream_unary)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(_handle_stream_stream)
+        else:
+            return None
+
+
+class CoalescedWriteTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        self._port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            'localhost:%d' % self._port,
+            options=_coalesced_write_options(_COALESCED_WRITE_BYTES))
+
+    def tearDown(self):
+        self._channel.close()
+        self._server.stop(None)
+
+    def testStreamUnary(self):
+        multi_callable = self._channel.stream_unary(_STREAM_UNARY)
+        requests = _requests()
+        self.assertEqual(b''.join(requests), multi_callable(iter(requests)))
+
+    def testStreamUnaryFuture(self):
+        multi_callable = self._channel.stream_unary(_STREAM_UNARY)
+        requests = _requests()
+        response_future = multi_callable.future(iter(requests))
+        self.assertEqual(b''.join(requests), response_future.result())
+
+    def testStreamStream(self):
+        multi_callable = self._channel.stream_stream(_STREAM_STREAM)
+        requests = _requests()
+        response_iterator = multi_callable(iter(requests))
+        self.assertSequenceEqual(requests, tuple(response_iterator))
+        self.assertIs(grpc.StatusCode.OK, response_iterator.code())
+
+    def testEmptyStream(self):
+        multi_callable = self._channel.stream_stream(_STREAM_STREAM)
+        response_iterator = multi_callable(iter(()))
+        self.assertSequenceEqual((), tuple(response_iterator))
+        self.assertIs(grpc.StatusCode.OK, response_iterator.code())
+
+    def testRequestsLargerThanBudget(self):
+        requests = tuple(b'\x07' * (2 * _COALESCED_WRITE_BYTES)
+                         for _ in range(test_constants.STREAM_LENGTH // 10))
+        multi_callable = self._channel.stream_unary(_STREAM_UNARY)
+        self.assertEqual(b''.join(requests), multi_callable(iter(requests)))
+
+    def testFailingRequestIterator(self):
+        multi_callable = self._channel.stream_unary(_STREAM_UNARY)
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            multi_callable(_failing_requests())
+        self.assertIs(grpc.StatusCode.UNKNOWN,
+                      exception_context.exception.code())
+
+    def testInvalidOptions(self):
+        with self.assertRaises(ValueError):
+            grpc.insecure_channel('localhost:1234',
+                                  options=_coalesced_write_options(-1))
+
+
+if __name__ == '__main__':
+    logging.basicConfig()
+    unittest.main(verbosity=2)
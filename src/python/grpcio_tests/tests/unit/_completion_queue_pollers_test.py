@@ -0,0 +1,96 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests channels that poll several call completion queues."""
+
+import logging
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_COMPLETION_QUEUE_POLLERS = 4
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+def _handle_unary_unary(request, servicer_context):
+    return request
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(_handle_unary_unary)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(_handle_stream_stream)
+        else:
+            return None
+
+
+class CompletionQueuePollersTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            'localhost:%d' % port,
+            options=((grpc.experimental.ChannelOptions.CompletionQueuePollers,
+                      _COMPLETION_QUEUE_POLLERS),))
+
+    def tearDown(self):
+        self._channel.close()
+        self._server.stop(None)
+
+    def testConcurrentFutures(self):
+        multi_callable = self._channel.unary_unary(_UNARY_UNARY)
+        requests = tuple(b'\x07' * index
+                         for index in range(1, test_constants.RPC_CONCURRENCY))
+        response_futures = tuple(
+            multi_callable.future(request) for request in requests)
+        for request, response_future in zip(requests, response_futures):
+            self.assertEqual(request, response_future.result())
+
+    def testConcurrentStreams(self):
+        multi_callable = self._channel.stream_stream(_STREAM_STREAM)
+        requests = tuple(
+            b'\x07\x08' for _ in range(test_constants.STREAM_LENGTH))
+        response_iterators = tuple(
+            multi_callable(iter(requests))
+            for _ in range(2 * _COMPLETION_QUEUE_POLLERS))
+        for response_iterator in response_iterators:
+            self.assertSequenceEqual(requests, tuple(response_iterator))
+
+    def testInvalidCompletionQueuePollers(self):
+        with self.assertRaises(ValueError):
+            grpc.insecure_channel(
+                'localhost:1234',
+                options=(
+                    (grpc.experimental.ChannelOptions.CompletionQueuePollers,
+                     0),))
+
+
+if __name__ == '__main__':
+    logging.basicConfig()
+    unittest.main(verbosity=2)
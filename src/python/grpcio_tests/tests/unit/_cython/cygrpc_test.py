@@ -159,6 +159,7 @@ class ServerClientMixin(object):
 
     def test_echo(self):
         DEADLINE = time.time() + 5
+        MONOTONIC_DEADLINE = cygrpc.monotonic_time() + 5
         DEADLINE_TOLERANCE = 0.25
         CLIENT_METADATA_ASCII_KEY = 'key'
         CLIENT_METADATA_ASCII_VALUE = 'val'
@@ -193,8 +194,8 @@ class ServerClientMixin(object):
             ),
         )
         client_call = self.client_channel.integrated_call(
-            0, METHOD, self.host_argument, DEADLINE, client_initial_metadata,
-            None, [
+            0, METHOD, self.host_argument, MONOTONIC_DEADLINE,
+            client_initial_metadata, None, [
                 (
                     [
                         cygrpc.SendInitialMetadataOperation(
@@ -223,6 +224,10 @@ class ServerClientMixin(object):
         self.assertEqual(self.expected_host, request_event.call_details.host)
         self.assertLess(abs(DEADLINE - request_event.call_details.deadline),
                         DEADLINE_TOLERANCE)
+        self.assertLess(
+            abs(MONOTONIC_DEADLINE -
+                request_event.call_details.monotonic_deadline),
+            DEADLINE_TOLERANCE)
 
         server_call_tag = object()
         server_call = request_event.call
@@ -305,6 +310,7 @@ class ServerClientMixin(object):
 
     def test_6522(self):
         DEADLINE = time.time() + 5
+        MONOTONIC_DEADLINE = cygrpc.monotonic_time() + 5
         DEADLINE_TOLERANCE = 0.25
         METHOD = b'twinkies'
 
@@ -316,7 +322,7 @@ class ServerClientMixin(object):
                                  self.server_completion_queue,
                                  server_request_tag)
         client_call = self.client_channel.segregated_call(
-            0, METHOD, self.host_argument, DEADLINE, None, None,
+            0, METHOD, self.host_argument, MONOTONIC_DEADLINE, None, None,
             ([(
                 [
                     cygrpc.SendInitialMetadataOperation(empty_metadata,
@@ -0,0 +1,159 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the propagation of deadlines to RPCs made by servicers."""
+
+import logging
+import struct
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_TIME_REMAINING = '/test/TimeRemaining'
+_PROPAGATING = '/test/Propagating'
+_PROPAGATING_STREAM = '/test/PropagatingStream'
+
+_NESTED_TIMEOUT = test_constants.LONG_TIMEOUT * 10
+
+
+def _serialize_time_remaining(time_remaining):
+    return struct.pack('!d', time_remaining)
+
+
+def _deserialize_time_remaining(serialized_time_remaining):
+    return struct.unpack('!d', serialized_time_remaining)[0]
+
+
+class _Handler(object):
+
+    def __init__(self):
+        self.channel = None
+
+    def handle_time_remaining(self, request, servicer_context):
+        return _serialize_time_remaining(servicer_context.time_remaining())
+
+    def handle_propagating(self, request, servicer_context):
+        multi_callable = self.channel.unary_unary(_TIME_REMAINING)
+        with grpc.experimental.propagate_deadline(servicer_context):
+            # The nested RPC asks for more time than its parent has left.
+            return multi_callable(request, timeout=_NESTED_TIMEOUT)
+
+    def handle_propagating_stream(self, request, servicer_context):
+        multi_callable = self.channel.unary_unary(_TIME_REMAINING)
+        with grpc.experimental.propagate_deadline(servicer_context):
+            for _ in range(test_constants.STREAM_LENGTH // 100):
+                yield multi_callable.future(request).result()
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def __init__(self, handler):
+        self._handler = handler
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _TIME_REMAINING:
+            return grpc.unary_unary_rpc_method_handler(
+                self._handler.handle_time_remaining)
+        elif handler_call_details.method == _PROPAGATING:
+            return grpc.unary_unary_rpc_method_handler(
+                self._handler.handle_propagating)
+        elif handler_call_details.method == _PROPAGATING_STREAM:
+            return grpc.unary_stream_rpc_method_handler(
+                self._handler.handle_propagating_stream)
+        else:
+            return None
+
+
+class _FixedServicerContext(object):
+
+    def __init__(self, time_remaining):
+        self._time_remaining = time_remaining
+
+    def time_remaining(self):
+        return self._time_remaining
+
+
+class DeadlinePropagationTest(unittest.TestCase):
+
+    def setUp(self):
+        self._handler = _Handler()
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(self._handler),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+        self._handler.channel = self._channel
+
+    def tearDown(self):
+        self._channel.close()
+        self._server.stop(None)
+
+    def testTimeRemaining(self):
+        response, call = self._channel.unary_unary(_TIME_REMAINING).with_call(
+            b'', timeout=test_constants.LONG_TIMEOUT)
+        self.assertLessEqual(_deserialize_time_remaining(response),
+                             test_constants.LONG_TIMEOUT)
+        self.assertLessEqual(call.time_remaining(), test_constants.LONG_TIMEOUT)
+
+    def testDeadlinePropagated(self):
+        response = self._channel.unary_unary(_PROPAGATING)(
+            b'', timeout=test_constants.LONG_TIMEOUT)
+        self.assertLessEqual(_deserialize_time_remaining(response),
+                             test_constants.LONG_TIMEOUT)
+
+    def testDeadlinePropagatedToFutures(self):
+        responses = tuple(
+            self._channel.unary_stream(_PROPAGATING_STREAM)(
+                b'', timeout=test_constants.LONG_TIMEOUT))
+        self.assertEqual(test_constants.STREAM_LENGTH // 100, len(responses))
+        for response in responses:
+            self.assertLessEqual(_deserialize_time_remaining(response),
+                                 test_constants.LONG_TIMEOUT)
+
+    def testNestedTimeoutKeptWithoutParentDeadline(self):
+        response = self._channel.unary_unary(_PROPAGATING)(b'')
+        self.assertGreater(_deserialize_time_remaining(response),
+                           test_constants.LONG_TIMEOUT)
+        self.assertLessEqual(_deserialize_time_remaining(response),
+                             _NESTED_TIMEOUT)
+
+    def testPropagationEndsWithBlock(self):
+        propagation = grpc.experimental.propagate_deadline(
+            _FixedServicerContext(test_constants.SHORT_TIMEOUT))
+        multi_callable = self._channel.unary_unary(_TIME_REMAINING)
+        with propagation:
+            self.assertLessEqual(
+                _deserialize_time_remaining(multi_callable(b'')),
+                test_constants.SHORT_TIMEOUT)
+        self.assertGreater(
+            _deserialize_time_remaining(
+                multi_callable(b'', timeout=_NESTED_TIMEOUT)),
+            test_constants.SHORT_TIMEOUT)
+
+    def testNestedPropagationKeepsEarlierDeadline(self):
+        multi_callable = self._channel.unary_unary(_TIME_REMAINING)
+        with grpc.experimental.propagate_deadline(
+                _FixedServicerContext(test_constants.SHORT_TIMEOUT)):
+            with grpc.experimental.propagate_deadline(
+                    _FixedServicerContext(test_constants.LONG_TIMEOUT)):
+                self.assertLessEqual(
+                    _deserialize_time_remaining(multi_callable(b'')),
+                    test_constants.SHORT_TIMEOUT)
+
+
+if __name__ == '__main__':
+    logging.basicConfig()
+    unittest.main(verbosity=2)
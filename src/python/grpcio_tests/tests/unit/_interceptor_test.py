@@ -281,6 +281,11 @@ class _LoggingInterceptor(grpc.ServerInterceptor,
         return continuation(client_call_details, request_iterator)
 
 
+class _MethodScopedLoggingInterceptor(_LoggingInterceptor):
+
+    method_scoped = True
+
+
 class _DefectiveClientInterceptor(grpc.UnaryUnaryClientInterceptor):
 
     def intercept_unary_unary(self, ignored_continuation,
@@ -528,6 +533,26 @@ class InterceptorTest(unittest.TestCase):
             's1:intercept_service', 's2:intercept_service'
         ])
 
+    def testInterceptedUnaryRequestBatchUnaryResponse(self):
+        requests = (b'\x07\x08', b'\x09\x0a')
+
+        self._record[:] = []
+        channel = grpc.intercept_channel(
+            self._channel, _LoggingInterceptor('c1', self._record),
+            _LoggingInterceptor('c2', self._record))
+
+        multi_callable = _unary_unary_multi_callable(channel)
+        results = multi_callable.batch(
+            requests,
+            metadata=(('test', 'InterceptedUnaryRequestBatchUnaryResponse'),))
+
+        self.assertEqual(len(requests), len(results))
+        for response, call in results:
+            self.assertIsNotNone(response)
+            self.assertIs(grpc.StatusCode.OK, call.code())
+        self.assertEqual(len(requests),
+                         self._record.count('c1:intercept_unary_unary'))
+
     def testInterceptedUnaryRequestStreamResponse(self):
         request = b'\x37\x58'
 
@@ -702,6 +727,77 @@ class InterceptorTest(unittest.TestCase):
             exception.result()
         self.assertIsInstance(exception.exception(), grpc.RpcError)
 
+    def _test_server_interceptors_per_rpc(self,
+                                          interceptors,
+                                          generic_handler=None,
+                                          added_generic_handler=None):
+        server = grpc.server(self._server_pool,
+                             options=(('grpc.so_reuseport', 0),),
+                             interceptors=interceptors)
+        port = server.add_insecure_port('[::]:0')
+        if generic_handler is None:
+            generic_handler = grpc.method_handlers_generic_handler(
+                'test', {
+                    'UnaryUnary':
+                        grpc.unary_unary_rpc_method_handler(
+                            self._handler.handle_unary_unary)
+                })
+        server.add_generic_rpc_handlers((generic_handler,))
+        server.start()
+        channel = grpc.insecure_channel('localhost:%d' % port)
+        try:
+            multi_callable = _unary_unary_multi_callable(channel)
+            for index in range(3):
+                if index == 1 and added_generic_handler is not None:
+                    server.add_generic_rpc_handlers((added_generic_handler,))
+                request = b'\x07\x08'
+                self.assertEqual(request, multi_callable(request))
+        finally:
+            channel.close()
+            server.stop(None)
+
+    def testMethodScopedServerInterceptorsExecutedOnce(self):
+        self._record[:] = []
+        self._test_server_interceptors_per_rpc((
+            _MethodScopedLoggingInterceptor('s1', self._record),
+            _MethodScopedLoggingInterceptor('s2', self._record),
+        ))
+        self.assertSequenceEqual([
+            's1:intercept_service',
+            's2:intercept_service',
+        ], self._record)
+
+    def testServerInterceptorsExecutedPerRpcUnlessAllMethodScoped(self):
+        self._record[:] = []
+        self._test_server_interceptors_per_rpc((
+            _MethodScopedLoggingInterceptor('s1', self._record),
+            _LoggingInterceptor('s2', self._record),
+        ))
+        self.assertSequenceEqual([
+            's1:intercept_service',
+            's2:intercept_service',
+        ] * 3, self._record)
+
+    def testMethodScopedServerInterceptorsExecutedAgainWhenHandlersAdded(self):
+        self._record[:] = []
+        self._test_server_interceptors_per_rpc(
+            (_MethodScopedLoggingInterceptor('s1', self._record),),
+            added_generic_handler=grpc.method_handlers_generic_handler(
+                'other', {
+                    'UnaryUnary':
+                        grpc.unary_unary_rpc_method_handler(
+                            self._handler.handle_unary_unary)
+                }))
+        self.assertSequenceEqual(['s1:intercept_service'] * 2, self._record)
+
+    def testMethodScopedServerInterceptorsExecutedPerRpcWithGenericHandler(
+            self):
+        self._record[:] = []
+        self._test_server_interceptors_per_rpc(
+            (_MethodScopedLoggingInterceptor('s1', self._record),),
+            generic_handler=_GenericHandler(self._handler))
+        self.assertSequenceEqual(['s1:intercept_service'] * 3, self._record)
+
 
 if __name__ == '__main__':
     logging.basicConfig()
@@ -16,6 +16,7 @@
 import unittest
 import weakref
 import logging
+import pickle
 
 import grpc
 from grpc import _channel
@@ -33,6 +34,7 @@ _UNARY_UNARY = '/test/UnaryUnary'
 _UNARY_STREAM = '/test/UnaryStream'
 _STREAM_UNARY = '/test/StreamUnary'
 _STREAM_STREAM = '/test/StreamStream'
+_INSPECT_INVOCATION_METADATA = '/test/InspectInvocationMetadata'
 
 _INVOCATION_METADATA = (
     (
@@ -106,6 +108,31 @@ def handle_unary_unary(test, request, servicer_context):
     return _RESPONSE
 
 
+def handle_inspect_invocation_metadata(test, request, servicer_context):
+    invocation_metadata = servicer_context.invocation_metadata()
+    test.assertEqual('invocation-md-value',
+                     invocation_metadata.get('invocation-md-key'))
+    test.assertEqual((b'\x00\x01',),
+                     invocation_metadata.get_all('invocation-md-key-bin'))
+    test.assertIsNone(invocation_metadata.get('missing-md-key'))
+    test.assertEqual((), invocation_metadata.get_all('missing-md-key'))
+
+    test.assertIs(invocation_metadata, servicer_context.invocation_metadata())
+    materialized = tuple(invocation_metadata)
+    test.assertEqual(materialized[::-1], tuple(reversed(invocation_metadata)))
+    test.assertEqual(materialized,
+                     pickle.loads(pickle.dumps(invocation_metadata)))
+    test.assertEqual(materialized, invocation_metadata)
+    test.assertEqual(len(materialized), len(invocation_metadata))
+    test.assertEqual(materialized[-1], invocation_metadata[-1])
+    test.assertEqual(materialized[1:], invocation_metadata[1:])
+    test.assertIn(materialized[0], invocation_metadata)
+    test.assertEqual(
+        materialized + (('extra-md-key', 'extra-md-value'),),
+        invocation_metadata + (('extra-md-key', 'extra-md-value'),))
+    return _RESPONSE
+
+
 def handle_unary_stream(test, request, servicer_context):
     validate_client_metadata(test, servicer_context)
     servicer_context.send_initial_metadata(_INITIAL_METADATA)
@@ -169,6 +196,10 @@ class _GenericHandler(grpc.GenericRpcHandler):
             return _MethodHandler(self._test, True, False)
         elif handler_call_details.method == _STREAM_STREAM:
             return _MethodHandler(self._test, True, True)
+        elif handler_call_details.method == _INSPECT_INVOCATION_METADATA:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda x, y: handle_inspect_invocation_metadata(
+                    self._test, x, y))
         else:
             return None
 
@@ -236,6 +267,28 @@ class MetadataTest(unittest.TestCase):
             test_common.metadata_transmitted(_EXPECTED_TRAILING_METADATA,
                                              call.trailing_metadata()))
 
+    def testInvocationMetadataView(self):
+        multi_callable = self._channel.unary_unary(_INSPECT_INVOCATION_METADATA)
+        self.assertEqual(
+            _RESPONSE, multi_callable(_REQUEST, metadata=_INVOCATION_METADATA))
+
+    def testRepeatedMetadataIsShared(self):
+        multi_callable = self._channel.unary_unary(_UNARY_UNARY)
+        trailing_metadatas = []
+        # Items are only shared once their values were received twice.
+        for _ in range(3):
+            unused_response, call = multi_callable.with_call(
+                _REQUEST, metadata=_INVOCATION_METADATA)
+            trailing_metadatas.append(call.trailing_metadata())
+        (unused_trailing_metadata, first_trailing_metadata,
+         second_trailing_metadata) = trailing_metadatas
+        self.assertEqual(first_trailing_metadata, second_trailing_metadata)
+        for first_metadatum, second_metadatum in zip(first_trailing_metadata,
+                                                     second_trailing_metadata):
+            self.assertIs(first_metadatum, second_metadatum)
+            self.assertEqual((first_metadatum.key, first_metadatum.value),
+                             tuple(first_metadatum))
+
 
 if __name__ == '__main__':
     logging.basicConfig()
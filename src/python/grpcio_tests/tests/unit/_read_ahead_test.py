@@ -0,0 +1,207 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the read-ahead of responses of streaming RPCs."""
+
+import logging
+import threading
+import time
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_READ_AHEAD_MESSAGES = 4
+
+_UNARY_STREAM = '/test/UnaryStream'
+_UNARY_STREAM_BLOCKING = '/test/UnaryStreamBlocking'
+_UNARY_STREAM_FAILING = '/test/UnaryStreamFailing'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+def _read_ahead_options(messages, maximum_bytes=None):
+    options = ((grpc.experimental.ChannelOptions.ReadAheadMessages, messages),)
+    if maximum_bytes is not None:
+        options += ((grpc.experimental.ChannelOptions.ReadAheadBytes,
+                     maximum_bytes),)
+    return options
+
+
+def _buffered_responses(response_iterator):
+    with response_iterator._state.condition:
+        return len(response_iterator._state.read_ahead.responses)
+
+
+class _Handler(object):
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def handle_unary_stream(self, request, servicer_context):
+        for index in range(test_constants.STREAM_LENGTH):
+            yield request + bytes(bytearray([index % 256]))
+
+    def handle_unary_stream_blocking(self, request, servicer_context):
+        for _ in range(2 * _READ_AHEAD_MESSAGES):
+            yield request
+        self.release.wait()
+
+    def handle_unary_stream_failing(self, request, servicer_context):
+        for _ in range(_READ_AHEAD_MESSAGES):
+            yield request
+        servicer_context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, 'Failed!')
+
+    def handle_stream_stream(self, request_iterator, servicer_context):
+        for request in request_iterator:
+            yield request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def __init__(self, handler):
+        self._handler = handler
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_STREAM:
+            return grpc.unary_stream_rpc_method_handler(
+                self._handler.handle_unary_stream)
+        elif handler_call_details.method == _UNARY_STREAM_BLOCKING:
+            return grpc.unary_stream_rpc_method_handler(
+                self._handler.handle_unary_stream_blocking)
+        elif handler_call_details.method == _UNARY_STREAM_FAILING:
+            return grpc.unary_stream_rpc_method_handler(
+                self._handler.handle_unary_stream_failing)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(
+                self._handler.handle_stream_stream)
+        else:
+            return None
+
+
+class ReadAheadTest(unittest.TestCase):
+
+    def setUp(self):
+        self._handler = _Handler()
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(self._handler),))
+        self._port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            'localhost:%d' % self._port,
+            options=_read_ahead_options(_READ_AHEAD_MESSAGES))
+
+    def tearDown(self):
+        self._handler.release.set()
+        self._channel.close()
+        self._server.stop(None)
+
+    def _assert_eventually_buffered(self, count, response_iterator):
+        deadline = time.time() + test_constants.SHORT_TIMEOUT
+        while _buffered_responses(response_iterator) != count:
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.01)
+
+    def testUnaryStream(self):
+        request = b'\x07\x08'
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM)(request)
+        self.assertSequenceEqual(
+            tuple(request + bytes(bytearray([index % 256]))
+                  for index in range(test_constants.STREAM_LENGTH)),
+            tuple(response_iterator))
+        self.assertIs(grpc.StatusCode.OK, response_iterator.code())
+
+    def testSingleThreadedUnaryStream(self):
+        request = b'\x07\x08'
+        options = _read_ahead_options(_READ_AHEAD_MESSAGES) + (
+            (grpc.experimental.ChannelOptions.SingleThreadedUnaryStream, 1),)
+        with grpc.insecure_channel('localhost:%d' % self._port,
+                                   options=options) as channel:
+            response_iterator = channel.unary_stream(_UNARY_STREAM)(request)
+            self.assertEqual(test_constants.STREAM_LENGTH,
+                             len(tuple(response_iterator)))
+            self.assertIs(grpc.StatusCode.OK, response_iterator.code())
+
+    def testStreamStream(self):
+        requests = tuple(
+            bytes(bytearray([index % 256]))
+            for index in range(test_constants.STREAM_LENGTH))
+        response_iterator = self._channel.stream_stream(_STREAM_STREAM)(
+            iter(requests))
+        self.assertSequenceEqual(requests, tuple(response_iterator))
+
+    def testResponsesReceivedAhead(self):
+        request = b'\x07\x08'
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM_BLOCKING)(
+            request)
+        self.assertEqual(request, next(response_iterator))
+        self._assert_eventually_buffered(_READ_AHEAD_MESSAGES,
+                                         response_iterator)
+        self._handler.release.set()
+        self.assertEqual(2 * _READ_AHEAD_MESSAGES - 1,
+                         len(tuple(response_iterator)))
+
+    def testReadAheadBoundedByBytes(self):
+        request = b'\x07\x08'
+        with grpc.insecure_channel('localhost:%d' % self._port,
+                                   options=_read_ahead_options(
+                                       _READ_AHEAD_MESSAGES,
+                                       len(request))) as channel:
+            response_iterator = channel.unary_stream(_UNARY_STREAM_BLOCKING)(
+                request)
+            self.assertEqual(request, next(response_iterator))
+            self._assert_eventually_buffered(1, response_iterator)
+            self.assertEqual(request, next(response_iterator))
+            self._assert_eventually_buffered(1, response_iterator)
+            self._handler.release.set()
+            self.assertEqual(2 * _READ_AHEAD_MESSAGES - 2,
+                             len(tuple(response_iterator)))
+
+    def testBufferedResponsesPrecedeError(self):
+        request = b'\x07\x08'
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM_FAILING)(
+            request)
+        for _ in range(_READ_AHEAD_MESSAGES):
+            self.assertEqual(request, next(response_iterator))
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            next(response_iterator)
+        self.assertIs(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                      exception_context.exception.code())
+
+    def testCancelDiscardsBufferedResponses(self):
+        request = b'\x07\x08'
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM_BLOCKING)(
+            request)
+        self.assertEqual(request, next(response_iterator))
+        self._assert_eventually_buffered(_READ_AHEAD_MESSAGES,
+                                         response_iterator)
+        response_iterator.cancel()
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            next(response_iterator)
+        self.assertIs(grpc.StatusCode.CANCELLED,
+                      exception_context.exception.code())
+
+    def testInvalidOptions(self):
+        with self.assertRaises(ValueError):
+            grpc.insecure_channel('localhost:1234',
+                                  options=_read_ahead_options(-1))
+        with self.assertRaises(ValueError):
+            grpc.insecure_channel('localhost:1234',
+                                  options=_read_ahead_options(
+                                      _READ_AHEAD_MESSAGES, 0))
+
+
+if __name__ == '__main__':
+    logging.basicConfig()
+    unittest.main(verbosity=2)
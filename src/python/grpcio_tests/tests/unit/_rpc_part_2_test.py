@@ -30,6 +30,22 @@ from tests.unit._rpc_test_helpers import (
 from tests.unit.framework.common import test_constants
 
 
+class _FutureOnlyMultiCallable(grpc.UnaryUnaryMultiCallable):
+    """Implements the abstract methods only, leaving batch to the default."""
+
+    def __init__(self, multi_callable):
+        self._multi_callable = multi_callable
+
+    def __call__(self, request, **kwargs):
+        return self._multi_callable(request, **kwargs)
+
+    def with_call(self, request, **kwargs):
+        return self._multi_callable.with_call(request, **kwargs)
+
+    def future(self, request, **kwargs):
+        return self._multi_callable.future(request, **kwargs)
+
+
 class RPCPart2Test(BaseRPCTest, unittest.TestCase):
 
     def testDefaultThreadPoolIsUsed(self):
@@ -76,6 +92,124 @@ class RPCPart2Test(BaseRPCTest, unittest.TestCase):
         self.assertIs(grpc.StatusCode.OK, call.code())
         self.assertEqual('', call.debug_error_string())
 
+    def testSequentialBlockingUnaryResponsesAcrossThreads(self):
+        request = b'\x07\x08'
+        expected_response = self._handler.handle_unary_unary(request, None)
+        multi_callable = unary_unary_multi_callable(self._channel)
+        unrecognized_multi_callable = self._channel.unary_unary('NoSuchMethod')
+
+        def call_sequentially():
+            # Failed RPCs are interleaved with successful ones to exercise
+            # each thread's completion queue after it was used by an RPC that
+            # terminated with an error.
+            for index in range(test_constants.THREAD_CONCURRENCY):
+                if index % 3 == 0:
+                    with self.assertRaises(grpc.RpcError) as exception_context:
+                        unrecognized_multi_callable(request)
+                    self.assertIs(grpc.StatusCode.UNIMPLEMENTED,
+                                  exception_context.exception.code())
+                else:
+                    self.assertEqual(expected_response, multi_callable(request))
+
+        pool = logging_pool.pool(test_constants.THREAD_CONCURRENCY)
+        call_futures = tuple(
+            pool.submit(call_sequentially)
+            for _ in range(test_constants.THREAD_CONCURRENCY))
+        for call_future in call_futures:
+            call_future.result()
+        pool.shutdown(wait=True)
+
+    def testSequentialBlockingUnaryResponsesWithVaryingOptions(self):
+        multi_callable = unary_unary_multi_callable(self._channel)
+        unrecognized_multi_callable = self._channel.unary_unary('NoSuchMethod')
+        wait_for_readies = itertools.cycle((None, True, False))
+
+        # Each RPC must observe its own results even though the operations
+        # receiving them are reused from earlier RPCs of the multicallable.
+        for index in range(test_constants.THREAD_CONCURRENCY):
+            request = bytes(bytearray((index,))) * (index + 1)
+            if index % 4 == 3:
+                with self.assertRaises(grpc.RpcError) as exception_context:
+                    unrecognized_multi_callable(request)
+                self.assertIs(grpc.StatusCode.UNIMPLEMENTED,
+                              exception_context.exception.code())
+            response, call = multi_callable.with_call(
+                request,
+                metadata=(('test', str(index)),),
+                wait_for_ready=next(wait_for_readies))
+            self.assertEqual(self._handler.handle_unary_unary(request, None),
+                             response)
+            self.assertIs(grpc.StatusCode.OK, call.code())
+            self.assertIn(('testkey', 'testvalue'), call.trailing_metadata())
+
+    def testSuccessfulUnaryResponseAfterFailedOneOnSameMultiCallable(self):
+        request = b'\x37\x17'
+        multi_callable = unary_unary_multi_callable(self._channel)
+
+        # The successful RPC reuses the operations that received the error
+        # string of the failed one.
+        for _ in range(3):
+            with self._control.fail():
+                with self.assertRaises(grpc.RpcError) as exception_context:
+                    multi_callable(request)
+            self.assertIs(grpc.StatusCode.UNKNOWN,
+                          exception_context.exception.code())
+            self.assertIn('description',
+                          exception_context.exception.debug_error_string())
+
+            response, call = multi_callable.with_call(request)
+            self.assertEqual(self._handler.handle_unary_unary(request, None),
+                             response)
+            self.assertIs(grpc.StatusCode.OK, call.code())
+            self.assertEqual('', call.debug_error_string())
+
+    def testBatchUnaryRequestUnaryResponse(self):
+        requests = tuple(
+            bytes(bytearray((index,)))
+            for index in range(test_constants.THREAD_CONCURRENCY))
+
+        multi_callable = unary_unary_multi_callable(self._channel)
+        results = multi_callable.batch(
+            requests, metadata=(('test', 'BatchUnaryRequestUnaryResponse'),))
+
+        self.assertEqual(len(requests), len(results))
+        for request, (response, call) in zip(requests, results):
+            self.assertEqual(self._handler.handle_unary_unary(request, None),
+                             response)
+            self.assertIs(grpc.StatusCode.OK, call.code())
+            self.assertIn(('testkey', 'testvalue'), call.trailing_metadata())
+
+    def testBatchUnaryRequestUnaryResponseWithErrors(self):
+        requests = (b'\x07\x08', object(), b'\x09\x0a')
+
+        multi_callable = self._channel.unary_unary('/test/UnaryUnary',
+                                                   request_serializer=bytes)
+        results = multi_callable.batch(requests)
+
+        self.assertEqual(requests[0], results[0][0])
+        self.assertIs(grpc.StatusCode.OK, results[0][1].code())
+        self.assertIsNone(results[1][0])
+        self.assertIsInstance(results[1][1], grpc.RpcError)
+        self.assertIs(grpc.StatusCode.INTERNAL, results[1][1].code())
+        self.assertEqual(requests[2], results[2][0])
+
+    def testEmptyBatchUnaryRequestUnaryResponse(self):
+        multi_callable = unary_unary_multi_callable(self._channel)
+        self.assertEqual((), multi_callable.batch(()))
+
+    def testDefaultBatchUnaryRequestUnaryResponse(self):
+        requests = (b'\x07\x08', object(), b'\x09\x0a')
+        multi_callable = _FutureOnlyMultiCallable(
+            self._channel.unary_unary('/test/UnaryUnary',
+                                      request_serializer=bytes))
+        results = multi_callable.batch(requests)
+
+        self.assertEqual(requests[0], results[0][0])
+        self.assertIs(grpc.StatusCode.OK, results[0][1].code())
+        self.assertIsNone(results[1][0])
+        self.assertIs(grpc.StatusCode.INTERNAL, results[1][1].code())
+        self.assertEqual(requests[2], results[2][0])
+
     def testSuccessfulUnaryRequestFutureUnaryResponse(self):
         request = b'\x07\x08'
         expected_response = self._handler.handle_unary_unary(request, None)
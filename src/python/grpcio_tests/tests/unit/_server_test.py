@@ -20,6 +20,8 @@ import grpc
 
 from tests.unit import resources
 
+_UNARY_UNARY = '/test/UnaryUnary'
+
 
 class _ActualGenericRpcHandler(grpc.GenericRpcHandler):
 
@@ -27,6 +29,15 @@ class _ActualGenericRpcHandler(grpc.GenericRpcHandler):
         return None
 
 
+class _EchoGenericRpcHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, unused_context: request)
+        return None
+
+
 class ServerTest(unittest.TestCase):
 
     def test_not_a_generic_rpc_handler_at_construction(self):
@@ -63,6 +74,112 @@ class ServerTest(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             server.add_secure_port(bind_address, server_credentials)
 
+    def test_pending_request_calls(self):
+        server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=8),
+            handlers=(_EchoGenericRpcHandler(),),
+            options=((grpc.experimental.ServerOptions.PendingRequestCalls,
+                      16),))
+        port = server.add_insecure_port('[::]:0')
+        server.start()
+        with grpc.insecure_channel('localhost:%d' % port) as channel:
+            multi_callable = channel.unary_unary(_UNARY_UNARY)
+            response_futures = [
+                multi_callable.future(b'\x07' * index) for index in range(64)
+            ]
+            for index, response_future in enumerate(response_futures):
+                self.assertEqual(b'\x07' * index, response_future.result())
+        server.stop(None).wait()
+
+    def test_invalid_pending_request_calls(self):
+        with self.assertRaises(ValueError):
+            grpc.server(
+                futures.ThreadPoolExecutor(max_workers=5),
+                options=((grpc.experimental.ServerOptions.PendingRequestCalls,
+                          0),))
+
+    def test_completion_queue_pollers(self):
+        server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=8),
+            handlers=(_EchoGenericRpcHandler(),),
+            options=(
+                (grpc.experimental.ServerOptions.CompletionQueuePollers, 4),
+                (grpc.experimental.ServerOptions.PendingRequestCalls, 4),
+            ))
+        port = server.add_insecure_port('[::]:0')
+        server.start()
+        with grpc.insecure_channel('localhost:%d' % port) as channel:
+            multi_callable = channel.unary_unary(_UNARY_UNARY)
+            response_futures = [
+                multi_callable.future(b'\x07' * index) for index in range(64)
+            ]
+            for index, response_future in enumerate(response_futures):
+                self.assertEqual(b'\x07' * index, response_future.result())
+        server.stop(None).wait()
+
+    def test_completion_queue_pollers_graceful_stop(self):
+        server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=8),
+            handlers=(_EchoGenericRpcHandler(),),
+            options=((grpc.experimental.ServerOptions.CompletionQueuePollers,
+                      3),))
+        port = server.add_insecure_port('[::]:0')
+        server.start()
+        with grpc.insecure_channel('localhost:%d' % port) as channel:
+            self.assertEqual(b'abc', channel.unary_unary(_UNARY_UNARY)(b'abc'))
+        self.assertTrue(server.stop(1).wait(5))
+
+    def test_invalid_completion_queue_pollers(self):
+        with self.assertRaises(ValueError):
+            grpc.server(
+                futures.ThreadPoolExecutor(max_workers=5),
+                options=(
+                    (grpc.experimental.ServerOptions.CompletionQueuePollers,
+                     0),))
+
+    def test_maximum_concurrent_rpcs_per_method_unsupported(self):
+        with self.assertRaises(ValueError):
+            grpc.server(futures.ThreadPoolExecutor(max_workers=5),
+                        options=((grpc.experimental.ServerOptions.
+                                  MaximumConcurrentRpcsPerMethod, {
+                                      _UNARY_UNARY: 1
+                                  }),))
+
+    def test_method_handler_routes(self):
+        first_service = grpc.method_handlers_generic_handler(
+            'test', {
+                'UnaryUnary':
+                    grpc.unary_unary_rpc_method_handler(
+                        lambda request, unused_context: b'first'),
+            })
+        second_service = grpc.method_handlers_generic_handler(
+            'test', {
+                'UnaryUnary':
+                    grpc.unary_unary_rpc_method_handler(
+                        lambda request, unused_context: b'second'),
+                'Other':
+                    grpc.unary_unary_rpc_method_handler(
+                        lambda request, unused_context: b'other'),
+            })
+        for handlers, expected in (
+            ((first_service, second_service), b'first'),
+            ((_ActualGenericRpcHandler(), second_service), b'second'),
+        ):
+            server = grpc.server(futures.ThreadPoolExecutor(max_workers=5),
+                                 handlers=handlers)
+            port = server.add_insecure_port('[::]:0')
+            server.start()
+            with grpc.insecure_channel('localhost:%d' % port) as channel:
+                self.assertEqual(expected,
+                                 channel.unary_unary(_UNARY_UNARY)(b''))
+                self.assertEqual(b'other',
+                                 channel.unary_unary('/test/Other')(b''))
+                with self.assertRaises(grpc.RpcError) as exception_context:
+                    channel.unary_unary('/test/Missing')(b'')
+                self.assertIs(grpc.StatusCode.UNIMPLEMENTED,
+                              exception_context.exception.code())
+            server.stop(None).wait()
+
 
 if __name__ == '__main__':
     logging.basicConfig()
@@ -0,0 +1,127 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the zero-copy receive option on channels and servers."""
+
+from concurrent import futures
+import logging
+import unittest
+
+import grpc
+
+from tests.unit.framework.common import test_constants
+
+_ZERO_COPY_OPTIONS = ((grpc.experimental.ChannelOptions.ZeroCopyReceive, 1),)
+
+_LARGE_MESSAGE = b'\x07' * (4 * 1024 * 1024)
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+class _RecordingDeserializer(object):
+
+    def __init__(self):
+        self.received_types = []
+
+    def __call__(self, serialized):
+        self.received_types.append(type(serialized))
+        self.readonly = memoryview(serialized).readonly
+        return bytes(serialized)
+
+
+def _handle_unary_unary(request, servicer_context):
+    return request
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def __init__(self, request_deserializer):
+        self._request_deserializer = request_deserializer
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                _handle_unary_unary,
+                request_deserializer=self._request_deserializer)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(
+                _handle_stream_stream,
+                request_deserializer=self._request_deserializer)
+        else:
+            return None
+
+
+class ZeroCopyReceiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self._request_deserializer = _RecordingDeserializer()
+        self._server = grpc.server(futures.ThreadPoolExecutor(
+            max_workers=test_constants.THREAD_CONCURRENCY),
+                                   options=_ZERO_COPY_OPTIONS)
+        self._server.add_generic_rpc_handlers(
+            (_GenericHandler(self._request_deserializer),))
+        self._port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel('localhost:%d' % self._port,
+                                              options=_ZERO_COPY_OPTIONS)
+
+    def tearDown(self):
+        self._server.stop(None)
+        self._channel.close()
+
+    def testUnaryUnaryLargeMessage(self):
+        response_deserializer = _RecordingDeserializer()
+        multi_callable = self._channel.unary_unary(
+            _UNARY_UNARY, response_deserializer=response_deserializer)
+        response = multi_callable(_LARGE_MESSAGE)
+        self.assertEqual(_LARGE_MESSAGE, response)
+        self.assertEqual([memoryview], response_deserializer.received_types)
+        self.assertTrue(response_deserializer.readonly)
+        self.assertEqual([memoryview],
+                         self._request_deserializer.received_types)
+        self.assertTrue(self._request_deserializer.readonly)
+
+    def testUnaryUnaryEmptyMessage(self):
+        response = self._channel.unary_unary(_UNARY_UNARY)(b'')
+        self.assertIsInstance(response, memoryview)
+        self.assertEqual(b'', response.tobytes())
+
+    def testStreamStream(self):
+        requests = [
+            bytes(bytearray([index % 256])) * (index + 1)
+            for index in range(test_constants.STREAM_LENGTH)
+        ]
+        response_deserializer = _RecordingDeserializer()
+        multi_callable = self._channel.stream_stream(
+            _STREAM_STREAM, response_deserializer=response_deserializer)
+        responses = list(multi_callable(iter(requests)))
+        self.assertSequenceEqual(requests, responses)
+        self.assertEqual({memoryview},
+                         set(response_deserializer.received_types))
+
+    def testDisabledByDefault(self):
+        with grpc.insecure_channel('localhost:%d' % self._port) as channel:
+            response = channel.unary_unary(_UNARY_UNARY)(b'abc')
+        self.assertIsInstance(response, bytes)
+        self.assertEqual(b'abc', response)
+
+
+if __name__ == '__main__':
+    logging.basicConfig()
+    unittest.main(verbosity=2)
@@ -0,0 +1,110 @@
+# Copyright 2021 The gRPC Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the per-RPC cost of client interceptors of unary-unary calls."""
+
+import argparse
+import asyncio
+import logging
+import time
+import tracemalloc
+
+import grpc
+from grpc.experimental import aio
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_INTERCEPTOR_COUNTS = (0, 1, 5)
+_REQUEST = b'\x00' * 16
+
+
+async def _handle_unary_unary(request, unused_context):
+    return request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(_handle_unary_unary)
+        return None
+
+
+class _NoOpInterceptor(aio.UnaryUnaryClientInterceptor):
+
+    async def intercept_unary_unary(self, continuation, client_call_details,
+                                    request):
+        return await continuation(client_call_details, request)
+
+
+async def _run(multicallable, count):
+    for _ in range(count):
+        await multicallable(_REQUEST)
+
+
+async def _measure(address, interceptor_count, warmup_count, count):
+    interceptors = [_NoOpInterceptor() for _ in range(interceptor_count)]
+    async with aio.insecure_channel(address,
+                                    interceptors=interceptors) as channel:
+        multicallable = channel.unary_unary(_UNARY_UNARY)
+        await _run(multicallable, warmup_count)
+
+        start_time = time.perf_counter()
+        await _run(multicallable, count)
+        latency = (time.perf_counter() - start_time) / count
+
+        tracemalloc.start()
+        try:
+            start_blocks = sum(
+                stat.count
+                for stat in tracemalloc.take_snapshot().statistics('filename'))
+            await _run(multicallable, count)
+            end_blocks = sum(
+                stat.count
+                for stat in tracemalloc.take_snapshot().statistics('filename'))
+        finally:
+            tracemalloc.stop()
+        return latency, (end_blocks - start_blocks) / count
+
+
+async def _benchmark(args):
+    server = aio.server()
+    server.add_generic_rpc_handlers((_GenericHandler(),))
+    port = server.add_insecure_port('[::]:0')
+    await server.start()
+    try:
+        for interceptor_count in _INTERCEPTOR_COUNTS:
+            latency, blocks = await _measure('localhost:%d' % port,
+                                             interceptor_count,
+                                             args.warmup_count, args.count)
+            print('%d interceptor(s): %.1f us/RPC, %+.1f live blocks/RPC' %
+                  (interceptor_count, latency * 1e6, blocks))
+    finally:
+        await server.stop(None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count',
+                        type=int,
+                        default=10000,
+                        help='number of measured RPCs per interceptor count')
+    parser.add_argument('--warmup_count',
+                        type=int,
+                        default=1000,
+                        help='number of RPCs made before measuring')
+    asyncio.get_event_loop().run_until_complete(_benchmark(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
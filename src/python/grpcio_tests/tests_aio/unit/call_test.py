@@ -203,6 +203,52 @@ class TestUnaryUnaryCall(_MulticallableTestMixin, AioTestBase):
         with self.assertRaises(asyncio.CancelledError):
             await task
 
+    async def test_call_invoked_by_awaiting_coroutine(self):
+        call = self._stub.UnaryCall(messages_pb2.SimpleRequest())
+
+        response = await call
+
+        self.assertIsInstance(response, messages_pb2.SimpleResponse)
+        # No task was needed to invoke the RPC.
+        self.assertIsNone(call._call_response)
+        self.assertIs(response, await call)
+
+    async def test_call_awaited_while_invoked_by_another_coroutine(self):
+        call = self._stub.UnaryCall(messages_pb2.SimpleRequest())
+
+        async def another_coro():
+            return await call
+
+        task = self.loop.create_task(another_coro())
+        response = await call
+
+        self.assertIs(response, await task)
+
+    async def test_call_invoked_without_being_awaited(self):
+        call = self._stub.UnaryCall(messages_pb2.SimpleRequest())
+
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+        self.assertIsInstance(await call, messages_pb2.SimpleResponse)
+
+    async def test_cancel_coroutine_invoking_unary_unary(self):
+        calls = []
+        invoking = asyncio.Event()
+
+        async def another_coro():
+            call = self._stub.UnaryCallWithSleep(messages_pb2.SimpleRequest())
+            calls.append(call)
+            invoking.set()
+            await call
+
+        task = self.loop.create_task(another_coro())
+        await invoking.wait()
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertTrue(calls[0].cancelled())
+        self.assertEqual(grpc.StatusCode.CANCELLED, await calls[0].code())
+
     async def test_passing_credentials_fails_over_insecure_channel(self):
         call_credentials = grpc.composite_call_credentials(
             grpc.access_token_call_credentials("abc"),
@@ -490,6 +536,75 @@ class TestUnaryStreamCall(_MulticallableTestMixin, AioTestBase):
 
         self.assertEqual(grpc.StatusCode.OK, await call.code())
 
+    async def test_read_many(self):
+        # Prepares the request
+        request = messages_pb2.StreamingOutputCallRequest()
+        for _ in range(_NUM_STREAM_RESPONSES):
+            request.response_parameters.append(
+                messages_pb2.ResponseParameters(size=_RESPONSE_PAYLOAD_SIZE,))
+
+        # Invokes the actual RPC
+        call = self._stub.StreamingOutputCall(request)
+
+        responses = []
+        while len(responses) < _NUM_STREAM_RESPONSES:
+            batch = await call.read_many(2)
+            self.assertGreaterEqual(len(batch), 1)
+            self.assertLessEqual(len(batch), 2)
+            responses.extend(batch)
+        for response in responses:
+            self.assertIs(type(response),
+                          messages_pb2.StreamingOutputCallResponse)
+            self.assertEqual(_RESPONSE_PAYLOAD_SIZE, len(response.payload.body))
+
+        self.assertIs(await call.read_many(2), aio.EOF)
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+        self.assertIs(await call.read_many(2), aio.EOF)
+
+    async def test_read_many_within_max_bytes(self):
+        # Prepares the request
+        request = messages_pb2.StreamingOutputCallRequest()
+        for _ in range(_NUM_STREAM_RESPONSES):
+            request.response_parameters.append(
+                messages_pb2.ResponseParameters(size=_RESPONSE_PAYLOAD_SIZE,))
+
+        # Invokes the actual RPC
+        call = self._stub.StreamingOutputCall(request)
+
+        # The first message of a batch is read even if it exceeds the limit.
+        for _ in range(_NUM_STREAM_RESPONSES):
+            batch = await call.read_many(_NUM_STREAM_RESPONSES, 1)
+            self.assertEqual(1, len(batch))
+        self.assertIs(await call.read(), aio.EOF)
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_read_batches(self):
+        # Prepares the request
+        request = messages_pb2.StreamingOutputCallRequest()
+        for _ in range(_NUM_STREAM_RESPONSES):
+            request.response_parameters.append(
+                messages_pb2.ResponseParameters(size=_RESPONSE_PAYLOAD_SIZE,))
+
+        # Invokes the actual RPC
+        call = self._stub.StreamingOutputCall(request)
+
+        responses = []
+        async for batch in call.read_batches(_NUM_STREAM_RESPONSES):
+            self.assertGreaterEqual(len(batch), 1)
+            responses.extend(batch)
+        self.assertEqual(_NUM_STREAM_RESPONSES, len(responses))
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_read_many_invalid_arguments(self):
+        call = self._stub.StreamingOutputCall(
+            messages_pb2.StreamingOutputCallRequest())
+
+        with self.assertRaises(ValueError):
+            await call.read_many(0)
+        with self.assertRaises(ValueError):
+            await call.read_many(1, 0)
+        self.assertIs(await call.read_many(1), aio.EOF)
+
 
 class TestStreamUnaryCall(_MulticallableTestMixin, AioTestBase):
 
@@ -0,0 +1,85 @@
+# Copyright 2021 The gRPC Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests behavior of the grpc.aio.ChannelPool class."""
+
+import asyncio
+import logging
+import unittest
+
+import grpc
+from grpc.experimental import aio
+
+from src.proto.grpc.testing import messages_pb2, test_pb2_grpc
+from tests_aio.unit._test_base import AioTestBase
+from tests_aio.unit._test_server import start_test_server
+
+_POOL_SIZE = 3
+_NUM_STREAM_RESPONSES = 5
+
+
+class TestChannelPool(AioTestBase):
+
+    async def setUp(self):
+        self._server_target, self._server = await start_test_server()
+
+    async def tearDown(self):
+        await self._server.stop(None)
+
+    async def test_unary_unary(self):
+        async with aio.ChannelPool(self._server_target, _POOL_SIZE) as pool:
+            stub = test_pb2_grpc.TestServiceStub(pool)
+            responses = await asyncio.gather(
+                *(stub.UnaryCall(messages_pb2.SimpleRequest())
+                  for _ in range(2 * _POOL_SIZE)))
+            for response in responses:
+                self.assertIsInstance(response, messages_pb2.SimpleResponse)
+
+    async def test_rpcs_spread_across_channels(self):
+        async with aio.ChannelPool(self._server_target, _POOL_SIZE) as pool:
+            stub = test_pb2_grpc.TestServiceStub(pool)
+            calls = [stub.FullDuplexCall() for _ in range(_POOL_SIZE)]
+            self.assertEqual((1,) * _POOL_SIZE, pool._load.in_flight())
+
+            for call in calls:
+                await call.done_writing()
+                self.assertEqual(grpc.StatusCode.OK, await call.code())
+            self.assertEqual((0,) * _POOL_SIZE, pool._load.in_flight())
+
+    async def test_unary_stream(self):
+        async with aio.ChannelPool(self._server_target, _POOL_SIZE) as pool:
+            stub = test_pb2_grpc.TestServiceStub(pool)
+            request = messages_pb2.StreamingOutputCallRequest()
+            for _ in range(_NUM_STREAM_RESPONSES):
+                request.response_parameters.append(
+                    messages_pb2.ResponseParameters())
+
+            call = stub.StreamingOutputCall(request)
+            responses = [response async for response in call]
+
+            self.assertEqual(_NUM_STREAM_RESPONSES, len(responses))
+            self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_channel_ready(self):
+        async with aio.ChannelPool(self._server_target, _POOL_SIZE) as pool:
+            await pool.channel_ready()
+            self.assertEqual(grpc.ChannelConnectivity.READY, pool.get_state())
+
+    async def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            aio.ChannelPool(self._server_target, 0)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -194,6 +194,88 @@ class TestUnaryStreamClientInterceptor(AioTestBase):
 
         await channel.close()
 
+    async def test_read_many(self):
+        for interceptor_class in (_UnaryStreamInterceptorEmpty,
+                                  _UnaryStreamInterceptorWithResponseIterator):
+
+            with self.subTest(name=interceptor_class):
+                interceptor = interceptor_class()
+
+                request = messages_pb2.StreamingOutputCallRequest()
+                request.response_parameters.extend([
+                    messages_pb2.ResponseParameters(size=_RESPONSE_PAYLOAD_SIZE)
+                ] * _NUM_STREAM_RESPONSES)
+
+                channel = aio.insecure_channel(self._server_target,
+                                               interceptors=[interceptor])
+                stub = test_pb2_grpc.TestServiceStub(channel)
+                call = stub.StreamingOutputCall(request)
+
+                responses = []
+                while len(responses) < _NUM_STREAM_RESPONSES:
+                    batch = await call.read_many(2)
+                    self.assertGreaterEqual(len(batch), 1)
+                    self.assertLessEqual(len(batch), 2)
+                    responses.extend(batch)
+                for response in responses:
+                    self.assertIs(type(response),
+                                  messages_pb2.StreamingOutputCallResponse)
+                    self.assertEqual(_RESPONSE_PAYLOAD_SIZE,
+                                     len(response.payload.body))
+
+                self.assertIs(await call.read_many(2), aio.EOF)
+                self.assertEqual(await call.code(), grpc.StatusCode.OK)
+                interceptor.assert_in_final_state(self)
+
+                await channel.close()
+
+    async def test_read_batches(self):
+        for interceptor_class in (_UnaryStreamInterceptorEmpty,
+                                  _UnaryStreamInterceptorWithResponseIterator):
+
+            with self.subTest(name=interceptor_class):
+                interceptor = interceptor_class()
+
+                request = messages_pb2.StreamingOutputCallRequest()
+                request.response_parameters.extend([
+                    messages_pb2.ResponseParameters(size=_RESPONSE_PAYLOAD_SIZE)
+                ] * _NUM_STREAM_RESPONSES)
+
+                channel = aio.insecure_channel(self._server_target,
+                                               interceptors=[interceptor])
+                stub = test_pb2_grpc.TestServiceStub(channel)
+                call = stub.StreamingOutputCall(request)
+
+                response_cnt = 0
+                async for batch in call.read_batches(_NUM_STREAM_RESPONSES, 1):
+                    # Each batch holds a single response, since the first
+                    # one alone exceeds max_bytes.
+                    self.assertEqual(1, len(batch))
+                    response_cnt += len(batch)
+
+                self.assertEqual(_NUM_STREAM_RESPONSES, response_cnt)
+                self.assertEqual(await call.code(), grpc.StatusCode.OK)
+                interceptor.assert_in_final_state(self)
+
+                await channel.close()
+
+    async def test_read_many_invalid_arguments(self):
+        channel = aio.insecure_channel(
+            self._server_target, interceptors=[_UnaryStreamInterceptorEmpty()])
+        stub = test_pb2_grpc.TestServiceStub(channel)
+        call = stub.StreamingOutputCall(
+            messages_pb2.StreamingOutputCallRequest())
+
+        with self.assertRaises(ValueError):
+            await call.read_many(0)
+        with self.assertRaises(ValueError):
+            await call.read_many(1, 0)
+        with self.assertRaises(ValueError):
+            call.read_batches(1, 0)
+        self.assertIs(await call.read_many(1), aio.EOF)
+
+        await channel.close()
+
     async def test_multiple_interceptors_response_iterator(self):
         for interceptor_class in (_UnaryStreamInterceptorEmpty,
                                   _UnaryStreamInterceptorWithResponseIterator):
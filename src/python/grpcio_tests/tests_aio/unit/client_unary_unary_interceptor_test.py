@@ -78,6 +78,65 @@ class TestUnaryUnaryClientInterceptor(AioTestBase):
 
             self.assertIsInstance(response, messages_pb2.SimpleResponse)
 
+    async def test_executed_right_order_across_rpcs(self):
+
+        interceptors_executed = []
+
+        class Interceptor(aio.UnaryUnaryClientInterceptor):
+
+            async def intercept_unary_unary(self, continuation,
+                                            client_call_details, request):
+                interceptors_executed.append(self)
+                return await continuation(client_call_details, request)
+
+        interceptors = [Interceptor() for i in range(5)]
+
+        async with aio.insecure_channel(self._server_target,
+                                        interceptors=interceptors) as channel:
+            multicallable = channel.unary_unary(
+                '/grpc.testing.TestService/UnaryCall',
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString)
+            for _ in range(3):
+                response = await multicallable(messages_pb2.SimpleRequest())
+                self.assertIsInstance(response, messages_pb2.SimpleResponse)
+
+            self.assertSequenceEqual(interceptors_executed, interceptors * 3)
+
+    async def test_continuation_called_twice_runs_following_interceptors(self):
+
+        class RetryInterceptor(aio.UnaryUnaryClientInterceptor):
+
+            async def intercept_unary_unary(self, continuation,
+                                            client_call_details, request):
+                await continuation(client_call_details, request)
+                return await continuation(client_call_details, request)
+
+        class CountingInterceptor(aio.UnaryUnaryClientInterceptor):
+
+            def __init__(self):
+                self.count = 0
+
+            async def intercept_unary_unary(self, continuation,
+                                            client_call_details, request):
+                self.count += 1
+                return await continuation(client_call_details, request)
+
+        counting_interceptor = CountingInterceptor()
+
+        async with aio.insecure_channel(
+                self._server_target,
+                interceptors=[RetryInterceptor(),
+                              counting_interceptor]) as channel:
+            multicallable = channel.unary_unary(
+                '/grpc.testing.TestService/UnaryCall',
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString)
+            call = multicallable(messages_pb2.SimpleRequest())
+
+            self.assertIsInstance(await call, messages_pb2.SimpleResponse)
+            self.assertEqual(2, counting_interceptor.count)
+
     @unittest.expectedFailure
     # TODO(https://github.com/grpc/grpc/issues/20144) Once metadata support is
     # implemented in the client-side, this test must be implemented.
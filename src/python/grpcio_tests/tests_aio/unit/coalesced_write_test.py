@@ -0,0 +1,149 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the coalesced writes of requests of AsyncIO streaming RPCs."""
+
+import logging
+import unittest
+
+import grpc
+from grpc._cython import cygrpc
+from grpc.experimental import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_COALESCED_WRITE_BYTES = 1024
+_COALESCED_WRITE_MESSAGES = 4
+_COALESCED_WRITE_OPTIONS = (
+    (grpc.experimental.ChannelOptions.CoalescedWriteBytes,
+     _COALESCED_WRITE_BYTES),
+    (grpc.experimental.ChannelOptions.CoalescedWriteMessages,
+     _COALESCED_WRITE_MESSAGES),
+)
+_STREAM_LENGTH = 64
+
+_STREAM_UNARY = '/test/StreamUnary'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+def _requests():
+    return tuple(
+        bytes(bytearray([index % 256])) * (index % 7 + 1)
+        for index in range(_STREAM_LENGTH))
+
+
+class _NoOpStreamUnaryInterceptor(aio.StreamUnaryClientInterceptor):
+
+    async def intercept_stream_unary(self, continuation, client_call_details,
+                                     request_iterator):
+        return await continuation(client_call_details, request_iterator)
+
+
+class TestCoalescedWrite(AioTestBase):
+
+    async def setUp(self):
+
+        async def stream_unary(request_iterator, unused_context):
+            return b''.join([request async for request in request_iterator])
+
+        async def stream_stream(request_iterator, unused_context):
+            async for request in request_iterator:
+                yield request
+
+        handlers = grpc.method_handlers_generic_handler(
+            'test', {
+                'StreamUnary':
+                    grpc.stream_unary_rpc_method_handler(stream_unary),
+                'StreamStream':
+                    grpc.stream_stream_rpc_method_handler(stream_stream),
+            })
+        self._server = aio.server()
+        self._server.add_generic_rpc_handlers((handlers,))
+        self._port = self._server.add_insecure_port('[::]:0')
+        await self._server.start()
+        self._channel = aio.insecure_channel('localhost:%d' % self._port,
+                                             options=_COALESCED_WRITE_OPTIONS)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_stream_unary_request_iterator(self):
+        requests = _requests()
+        call = self._channel.stream_unary(_STREAM_UNARY)(iter(requests))
+        self.assertEqual(b''.join(requests), await call)
+
+    async def test_stream_unary_write_and_drain(self):
+        requests = _requests()
+        call = self._channel.stream_unary(_STREAM_UNARY)()
+        for request in requests:
+            await call.write(request)
+        await call.drain()
+        await call.done_writing()
+        self.assertEqual(b''.join(requests), await call)
+
+    async def test_stream_stream_write_and_drain(self):
+        requests = _requests()
+        call = self._channel.stream_stream(_STREAM_STREAM)()
+        for request in requests:
+            await call.write(request)
+        await call.drain()
+        for request in requests:
+            self.assertEqual(request, await call.read())
+        await call.done_writing()
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_requests_larger_than_window(self):
+        requests = tuple(
+            b'\x07' * (2 * _COALESCED_WRITE_BYTES) for _ in range(8))
+        call = self._channel.stream_unary(_STREAM_UNARY)()
+        for request in requests:
+            await call.write(request)
+        await call.done_writing()
+        self.assertEqual(b''.join(requests), await call)
+
+    async def test_drain_without_writes(self):
+        call = self._channel.stream_unary(_STREAM_UNARY)()
+        await call.drain()
+        await call.done_writing()
+        self.assertEqual(b'', await call)
+
+    async def test_drain_with_request_iterator(self):
+        call = self._channel.stream_unary(_STREAM_UNARY)(iter(_requests()))
+        with self.assertRaises(cygrpc.UsageError):
+            await call.drain()
+        await call
+
+    async def test_intercepted_write_and_drain(self):
+        requests = _requests()
+        async with aio.insecure_channel(
+                'localhost:%d' % self._port,
+                options=_COALESCED_WRITE_OPTIONS,
+                interceptors=[_NoOpStreamUnaryInterceptor()]) as channel:
+            call = channel.stream_unary(_STREAM_UNARY)()
+            for request in requests:
+                await call.write(request)
+            await call.drain()
+            await call.done_writing()
+            self.assertEqual(b''.join(requests), await call)
+
+    async def test_invalid_options(self):
+        for option in (grpc.experimental.ChannelOptions.CoalescedWriteBytes,
+                       grpc.experimental.ChannelOptions.CoalescedWriteMessages):
+            with self.assertRaises(ValueError):
+                aio.insecure_channel('localhost:1234', options=((option, -1),))
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
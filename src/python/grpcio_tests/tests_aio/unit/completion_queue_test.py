@@ -0,0 +1,114 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the event batching of the poller completion queue."""
+
+import asyncio
+import logging
+import os
+import threading
+import unittest
+
+import grpc
+from grpc._cython import cygrpc
+from grpc.experimental import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_REQUEST = b'\x07\x08'
+_NUM_CONCURRENT_RPCS = 100
+
+
+class _EchoHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, unused_context: request)
+        return None
+
+
+@unittest.skipIf(
+    os.environ.get('GRPC_ASYNCIO_ENGINE', '').lower() == 'custom_io_manager',
+    'Batching is a feature of the POLLER completion queue.')
+class TestPollerCompletionQueue(AioTestBase):
+
+    async def setUp(self):
+        self._server = aio.server()
+        self._server.add_generic_rpc_handlers((_EchoHandler(),))
+        port = self._server.add_insecure_port('[::]:0')
+        await self._server.start()
+        self._address = 'localhost:%d' % port
+        self._channel = aio.insecure_channel(self._address)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_concurrent_rpcs(self):
+        before = cygrpc.completion_queue_stats()
+        responses = await asyncio.gather(
+            *(self._channel.unary_unary(_UNARY_UNARY)(_REQUEST)
+              for _ in range(_NUM_CONCURRENT_RPCS)))
+        self.assertEqual([_REQUEST] * _NUM_CONCURRENT_RPCS, responses)
+
+        after = cygrpc.completion_queue_stats()
+        queued_events = after['queued_events'] - before['queued_events']
+        wakeups = after['wakeups'] - before['wakeups']
+        drains = after['drains'] - before['drains']
+        self.assertGreaterEqual(queued_events, _NUM_CONCURRENT_RPCS)
+        # The events of concurrent RPCs arrive in bursts, each of which wakes
+        # the loop up once and is dispatched at once.
+        self.assertLess(wakeups, queued_events)
+        self.assertLess(drains, queued_events)
+
+    async def test_cross_loop_events(self):
+        before = cygrpc.completion_queue_stats()
+
+        def sync_work():
+            loop = asyncio.new_event_loop()
+            try:
+
+                async def async_work():
+                    async with aio.insecure_channel(self._address) as channel:
+                        return await asyncio.gather(
+                            *(channel.unary_unary(_UNARY_UNARY)(_REQUEST)
+                              for _ in range(_NUM_CONCURRENT_RPCS)))
+
+                self.assertEqual([_REQUEST] * _NUM_CONCURRENT_RPCS,
+                                 loop.run_until_complete(async_work()))
+            finally:
+                loop.close()
+
+        thread = threading.Thread(target=sync_work)
+        thread.start()
+        while thread.is_alive():
+            await asyncio.sleep(0.01)
+        thread.join()
+
+        after = cygrpc.completion_queue_stats()
+        cross_loop_events = (after['cross_loop_events'] -
+                             before['cross_loop_events'])
+        cross_loop_calls = (after['cross_loop_calls'] -
+                            before['cross_loop_calls'])
+        # The server handles its RPCs on this loop, so the events of either
+        # loop are drained by the other one as well, and handed over in
+        # batches.
+        self.assertGreater(cross_loop_events, 0)
+        self.assertLess(cross_loop_calls, cross_loop_events)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -46,6 +46,11 @@ class _LoggingInterceptor(aio.ServerInterceptor):
         return await continuation(handler_call_details)
 
 
+class _MethodScopedLoggingInterceptor(_LoggingInterceptor):
+
+    method_scoped = True
+
+
 class _GenericInterceptor(aio.ServerInterceptor):
 
     def __init__(
@@ -183,6 +188,48 @@ class TestServerInterceptor(AioTestBase):
             self.assertIsInstance(response, messages_pb2.SimpleResponse)
             self.assertEqual(code, grpc.StatusCode.OK)
 
+    async def test_method_scoped_interceptors_executed_once(self):
+        record = []
+        server_target, _ = await start_test_server(interceptors=(
+            _MethodScopedLoggingInterceptor('log1', record),
+            _MethodScopedLoggingInterceptor('log2', record),
+        ))
+
+        async with aio.insecure_channel(server_target) as channel:
+            multicallable = channel.unary_unary(
+                '/grpc.testing.TestService/UnaryCall',
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString)
+            for _ in range(3):
+                response = await multicallable(messages_pb2.SimpleRequest())
+                self.assertIsInstance(response, messages_pb2.SimpleResponse)
+
+            self.assertSequenceEqual([
+                'log1:intercept_service',
+                'log2:intercept_service',
+            ], record)
+
+    async def test_interceptors_executed_per_rpc_unless_all_method_scoped(self):
+        record = []
+        server_target, _ = await start_test_server(interceptors=(
+            _MethodScopedLoggingInterceptor('log1', record),
+            _LoggingInterceptor('log2', record),
+        ))
+
+        async with aio.insecure_channel(server_target) as channel:
+            multicallable = channel.unary_unary(
+                '/grpc.testing.TestService/UnaryCall',
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString)
+            for _ in range(3):
+                response = await multicallable(messages_pb2.SimpleRequest())
+                self.assertIsInstance(response, messages_pb2.SimpleResponse)
+
+            self.assertSequenceEqual([
+                'log1:intercept_service',
+                'log2:intercept_service',
+            ] * 3, record)
+
     async def test_apply_different_interceptors_by_metadata(self):
         record = []
         conditional_interceptor = _filter_server_interceptor(
@@ -35,6 +35,7 @@ _UNARY_STREAM_EVILLY_MIXED = '/test/UnaryStreamEvillyMixed'
 _STREAM_UNARY_ASYNC_GEN = '/test/StreamUnaryAsyncGen'
 _STREAM_UNARY_READER_WRITER = '/test/StreamUnaryReaderWriter'
 _STREAM_UNARY_EVILLY_MIXED = '/test/StreamUnaryEvillyMixed'
+_STREAM_UNARY_READ_MANY = '/test/StreamUnaryReadMany'
 _STREAM_STREAM_ASYNC_GEN = '/test/StreamStreamAsyncGen'
 _STREAM_STREAM_READER_WRITER = '/test/StreamStreamReaderWriter'
 _STREAM_STREAM_EVILLY_MIXED = '/test/StreamStreamEvillyMixed'
@@ -79,6 +80,9 @@ class _GenericHandler(grpc.GenericRpcHandler):
             _STREAM_UNARY_EVILLY_MIXED:
                 grpc.stream_unary_rpc_method_handler(
                     self._stream_unary_evilly_mixed),
+            _STREAM_UNARY_READ_MANY:
+                grpc.stream_unary_rpc_method_handler(
+                    self._stream_unary_read_many),
             _STREAM_STREAM_ASYNC_GEN:
                 grpc.stream_stream_rpc_method_handler(
                     self._stream_stream_async_gen),
@@ -145,6 +149,17 @@ class _GenericHandler(grpc.GenericRpcHandler):
         assert _NUM_STREAM_REQUESTS - 1 == request_count
         return _RESPONSE
 
+    async def _stream_unary_read_many(self, unused_request, context):
+        request_count = 0
+        requests = await context.read_many(_NUM_STREAM_REQUESTS)
+        while requests is not aio.EOF:
+            assert 1 <= len(requests) <= _NUM_STREAM_REQUESTS
+            assert all(_REQUEST == request for request in requests)
+            request_count += len(requests)
+            requests = await context.read_many(_NUM_STREAM_REQUESTS)
+        assert _NUM_STREAM_REQUESTS == request_count
+        return _RESPONSE
+
     async def _stream_stream_async_gen(self, request_iterator, unused_context):
         request_count = 0
         async for request in request_iterator:
@@ -296,6 +311,18 @@ class TestServer(AioTestBase):
         self.assertEqual(_RESPONSE, response)
         self.assertEqual(await call.code(), grpc.StatusCode.OK)
 
+    async def test_stream_unary_read_many(self):
+        stream_unary_call = self._channel.stream_unary(_STREAM_UNARY_READ_MANY)
+        call = stream_unary_call()
+
+        for _ in range(_NUM_STREAM_REQUESTS):
+            await call.write(_REQUEST)
+        await call.done_writing()
+
+        response = await call
+        self.assertEqual(_RESPONSE, response)
+        self.assertEqual(await call.code(), grpc.StatusCode.OK)
+
     async def test_stream_stream_async_generator(self):
         stream_stream_call = self._channel.stream_stream(
             _STREAM_STREAM_ASYNC_GEN)
@@ -506,6 +533,86 @@ class TestServer(AioTestBase):
         await channel.close()
         await server.stop(0)
 
+    async def test_pending_request_calls(self):
+        server = aio.server(
+            options=((grpc.experimental.ServerOptions.PendingRequestCalls,
+                      16),))
+        port = server.add_insecure_port('localhost:0')
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        await server.start()
+        channel = aio.insecure_channel('localhost:%d' % port)
+        responses = await asyncio.gather(
+            *(channel.unary_unary(_SIMPLE_UNARY_UNARY)(_REQUEST)
+              for _ in range(64)))
+        self.assertEqual([_RESPONSE] * 64, responses)
+        await channel.close()
+        await server.stop(None)
+
+    async def test_pending_request_calls_with_maximum_concurrent_rpcs(self):
+        server = aio.server(
+            maximum_concurrent_rpcs=_MAXIMUM_CONCURRENT_RPCS,
+            options=((grpc.experimental.ServerOptions.PendingRequestCalls,
+                      4 * _MAXIMUM_CONCURRENT_RPCS),))
+        port = server.add_insecure_port('localhost:0')
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        await server.start()
+        channel = aio.insecure_channel('localhost:%d' % port)
+        rpcs = [
+            channel.unary_unary(_BLOCK_BRIEFLY)(_REQUEST)
+            for _ in range(3 * _MAXIMUM_CONCURRENT_RPCS)
+        ]
+        start_time = time.time()
+        await asyncio.gather(*rpcs)
+        elapsed_time = time.time() - start_time
+        self.assertGreater(elapsed_time, test_constants.SHORT_TIMEOUT * 3 / 2)
+        await channel.close()
+        await server.stop(0)
+
+    async def test_pending_request_calls_release_slots_on_shutdown(self):
+        server = aio.server(
+            maximum_concurrent_rpcs=_MAXIMUM_CONCURRENT_RPCS,
+            options=((grpc.experimental.ServerOptions.PendingRequestCalls,
+                      _MAXIMUM_CONCURRENT_RPCS),))
+        port = server.add_insecure_port('localhost:0')
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        await server.start()
+        channel = aio.insecure_channel('localhost:%d' % port)
+        self.assertEqual(
+            _RESPONSE, await channel.unary_unary(_SIMPLE_UNARY_UNARY)(_REQUEST))
+        await channel.close()
+        # The requests still pending are failed by the shutdown.
+        await server.stop(None)
+        self.assertEqual({None: (0, 0)}, server.concurrency_metrics())
+
+    async def test_maximum_concurrent_rpcs_per_method(self):
+        server = aio.server(options=((
+            grpc.experimental.ServerOptions.MaximumConcurrentRpcsPerMethod, {
+                _BLOCK_BRIEFLY: 1
+            }),))
+        port = server.add_insecure_port('localhost:0')
+        server.add_generic_rpc_handlers((_GenericHandler(),))
+        await server.start()
+        channel = aio.insecure_channel('localhost:%d' % port)
+        start_time = time.time()
+        rpcs = [channel.unary_unary(_BLOCK_BRIEFLY)(_REQUEST) for _ in range(3)]
+        while server.concurrency_metrics()[_BLOCK_BRIEFLY] != (1, 2):
+            await asyncio.sleep(0.01)
+        # Other methods are not limited.
+        self.assertEqual(
+            _RESPONSE, await channel.unary_unary(_SIMPLE_UNARY_UNARY)(_REQUEST))
+        self.assertEqual([_RESPONSE] * 3, await asyncio.gather(*rpcs))
+        elapsed_time = time.time() - start_time
+        self.assertGreater(elapsed_time, test_constants.SHORT_TIMEOUT * 3 / 2)
+        self.assertEqual({_BLOCK_BRIEFLY: (0, 0)}, server.concurrency_metrics())
+        await channel.close()
+        await server.stop(None)
+
+    async def test_invalid_pending_request_calls(self):
+        with self.assertRaises(ValueError):
+            aio.server(
+                options=((grpc.experimental.ServerOptions.PendingRequestCalls,
+                          0),))
+
 
 if __name__ == '__main__':
     logging.basicConfig(level=logging.DEBUG)
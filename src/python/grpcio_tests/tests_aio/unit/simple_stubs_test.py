@@ -0,0 +1,213 @@
+# Copyright 2021 The gRPC Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the asyncio simple stubs of grpc.aio."""
+
+import asyncio
+import logging
+import unittest
+
+import grpc
+from grpc.aio import _simple_stubs
+from grpc.experimental import aio
+
+from src.proto.grpc.testing import messages_pb2
+from tests_aio.unit._test_base import AioTestBase
+from tests_aio.unit._test_server import start_test_server
+
+_UNARY_CALL_METHOD = '/grpc.testing.TestService/UnaryCall'
+_STREAMING_OUTPUT_CALL_METHOD = '/grpc.testing.TestService/StreamingOutputCall'
+_STREAMING_INPUT_CALL_METHOD = '/grpc.testing.TestService/StreamingInputCall'
+_FULL_DUPLEX_CALL_METHOD = '/grpc.testing.TestService/FullDuplexCall'
+
+_NUM_STREAM_RESPONSES = 5
+_RESPONSE_PAYLOAD_SIZE = 7
+_REQUEST_PAYLOAD_SIZE = 9
+_TEST_EVICTION_PERIOD_SECONDS = 0.1
+_TEST_MAXIMUM_CHANNELS = 2
+_EVICTION_TIMEOUT_SECONDS = 5
+
+
+class TestSimpleStubs(AioTestBase):
+
+    async def setUp(self):
+        self._server_target, self._server = await start_test_server()
+
+    async def tearDown(self):
+        await self._server.stop(None)
+
+    @staticmethod
+    async def _close(cache):
+        """Closes the cache as the loop cancelling its tasks would."""
+        cache._closer.cancel()
+        try:
+            await cache._closer
+        except asyncio.CancelledError:
+            pass
+
+    async def test_unary_unary(self):
+        response = await aio.unary_unary(
+            messages_pb2.SimpleRequest(),
+            self._server_target,
+            _UNARY_CALL_METHOD,
+            request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+            response_deserializer=messages_pb2.SimpleResponse.FromString,
+            insecure=True)
+        self.assertIsInstance(response, messages_pb2.SimpleResponse)
+
+    async def test_unary_stream(self):
+        request = messages_pb2.StreamingOutputCallRequest()
+        for _ in range(_NUM_STREAM_RESPONSES):
+            request.response_parameters.append(
+                messages_pb2.ResponseParameters(size=_RESPONSE_PAYLOAD_SIZE))
+
+        call = aio.unary_stream(request,
+                                self._server_target,
+                                _STREAMING_OUTPUT_CALL_METHOD,
+                                request_serializer=messages_pb2.
+                                StreamingOutputCallRequest.SerializeToString,
+                                response_deserializer=messages_pb2.
+                                StreamingOutputCallResponse.FromString,
+                                insecure=True)
+        responses = [response async for response in call]
+
+        self.assertEqual(_NUM_STREAM_RESPONSES, len(responses))
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_stream_unary(self):
+        payload = messages_pb2.Payload(body=b'\0' * _REQUEST_PAYLOAD_SIZE)
+        requests = [
+            messages_pb2.StreamingInputCallRequest(payload=payload)
+            for _ in range(_NUM_STREAM_RESPONSES)
+        ]
+
+        response = await aio.stream_unary(
+            iter(requests),
+            self._server_target,
+            _STREAMING_INPUT_CALL_METHOD,
+            request_serializer=messages_pb2.StreamingInputCallRequest.
+            SerializeToString,
+            response_deserializer=messages_pb2.StreamingInputCallResponse.
+            FromString,
+            insecure=True)
+
+        self.assertEqual(_NUM_STREAM_RESPONSES * _REQUEST_PAYLOAD_SIZE,
+                         response.aggregated_payload_size)
+
+    async def test_stream_stream(self):
+        request = messages_pb2.StreamingOutputCallRequest()
+        request.response_parameters.append(
+            messages_pb2.ResponseParameters(size=_RESPONSE_PAYLOAD_SIZE))
+
+        call = aio.stream_stream(iter((request,) * _NUM_STREAM_RESPONSES),
+                                 self._server_target,
+                                 _FULL_DUPLEX_CALL_METHOD,
+                                 request_serializer=messages_pb2.
+                                 StreamingOutputCallRequest.SerializeToString,
+                                 response_deserializer=messages_pb2.
+                                 StreamingOutputCallResponse.FromString,
+                                 insecure=True)
+        responses = [response async for response in call]
+
+        self.assertEqual(_NUM_STREAM_RESPONSES, len(responses))
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+
+    async def test_channel_cached(self):
+        cache = _simple_stubs._channel_cache()
+        channel = cache.get_channel(self._server_target, (), None, True, None)
+        for _ in range(_NUM_STREAM_RESPONSES):
+            await aio.unary_unary(
+                messages_pb2.SimpleRequest(),
+                self._server_target,
+                _UNARY_CALL_METHOD,
+                request_serializer=messages_pb2.SimpleRequest.SerializeToString,
+                response_deserializer=messages_pb2.SimpleResponse.FromString,
+                insecure=True)
+        self.assertIs(
+            channel, cache.get_channel(self._server_target, (), None, True,
+                                       None))
+
+    async def test_channel_evicted_after_period(self):
+        eviction_period_seconds = _simple_stubs._EVICTION_PERIOD_SECONDS
+        _simple_stubs._EVICTION_PERIOD_SECONDS = _TEST_EVICTION_PERIOD_SECONDS
+        try:
+            cache = _simple_stubs._ChannelCache(self.loop)
+            channel = cache.get_channel(self._server_target, (), None, True,
+                                        None)
+            self.assertEqual(1, cache._test_only_channel_count())
+            deadline = self.loop.time() + _EVICTION_TIMEOUT_SECONDS
+            while (cache._test_only_channel_count() and
+                   self.loop.time() < deadline):
+                await asyncio.sleep(_TEST_EVICTION_PERIOD_SECONDS)
+            self.assertEqual(0, cache._test_only_channel_count())
+            self.assertIsNot(
+                channel,
+                cache.get_channel(self._server_target, (), None, True, None))
+        finally:
+            _simple_stubs._EVICTION_PERIOD_SECONDS = eviction_period_seconds
+        await self._close(cache)
+
+    async def test_least_recently_used_channel_evicted(self):
+        maximum_channels = _simple_stubs._MAXIMUM_CHANNELS
+        _simple_stubs._MAXIMUM_CHANNELS = _TEST_MAXIMUM_CHANNELS
+        try:
+            cache = _simple_stubs._ChannelCache(self.loop)
+            options = tuple(
+                (('test_least_recently_used_channel_evicted', str(index)),)
+                for index in range(_TEST_MAXIMUM_CHANNELS + 1))
+            channels = [
+                cache.get_channel(self._server_target, channel_options, None,
+                                  True, None)
+                for channel_options in options[:_TEST_MAXIMUM_CHANNELS]
+            ]
+            # Uses the first channel again, leaving the second one the least
+            # recently used.
+            cache.get_channel(self._server_target, options[0], None, True, None)
+            cache.get_channel(self._server_target, options[-1], None, True,
+                              None)
+            self.assertEqual(_TEST_MAXIMUM_CHANNELS,
+                             cache._test_only_channel_count())
+            self.assertIs(
+                channels[0],
+                cache.get_channel(self._server_target, options[0], None, True,
+                                  None))
+            self.assertIsNot(
+                channels[1],
+                cache.get_channel(self._server_target, options[1], None, True,
+                                  None))
+        finally:
+            _simple_stubs._MAXIMUM_CHANNELS = maximum_channels
+        await self._close(cache)
+
+    async def test_cache_closed_with_loop_tasks(self):
+        cache = _simple_stubs._channel_cache()
+        channel = cache.get_channel(self._server_target, (), None, True, None)
+        await self._close(cache)
+        self.assertNotIn(cache._loop, _simple_stubs._channel_caches)
+        self.assertEqual(0, cache._test_only_channel_count())
+        self.assertTrue(channel._channel.closed())
+        self.assertIsNot(cache, _simple_stubs._channel_cache())
+
+    async def test_insecure_mutually_exclusive(self):
+        with self.assertRaises(ValueError):
+            await aio.unary_unary(
+                messages_pb2.SimpleRequest(),
+                self._server_target,
+                _UNARY_CALL_METHOD,
+                insecure=True,
+                channel_credentials=grpc.local_channel_credentials())
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,90 @@
+# Copyright 2021 The gRPC Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests the zero-copy receive option of AsyncIO channels and servers."""
+
+import logging
+import unittest
+
+import grpc
+from grpc.experimental import aio
+
+from tests_aio.unit._test_base import AioTestBase
+
+_ZERO_COPY_OPTIONS = ((grpc.experimental.ChannelOptions.ZeroCopyReceive, 1),)
+_LARGE_MESSAGE = b'\x07' * (4 * 1024 * 1024)
+_STREAM_LENGTH = 8
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+class TestZeroCopyReceive(AioTestBase):
+
+    async def setUp(self):
+        self._request_types = []
+
+        def request_deserializer(serialized):
+            self._request_types.append(type(serialized))
+            return bytes(serialized)
+
+        async def unary_unary(request, unused_context):
+            return request
+
+        async def stream_stream(request_iterator, unused_context):
+            async for request in request_iterator:
+                yield request
+
+        handlers = grpc.method_handlers_generic_handler(
+            'test', {
+                'UnaryUnary':
+                    grpc.unary_unary_rpc_method_handler(
+                        unary_unary, request_deserializer=request_deserializer),
+                'StreamStream':
+                    grpc.stream_stream_rpc_method_handler(
+                        stream_stream,
+                        request_deserializer=request_deserializer),
+            })
+        self._server = aio.server(options=_ZERO_COPY_OPTIONS)
+        self._server.add_generic_rpc_handlers((handlers,))
+        port = self._server.add_insecure_port('[::]:0')
+        await self._server.start()
+        self._channel = aio.insecure_channel('localhost:%d' % port,
+                                             options=_ZERO_COPY_OPTIONS)
+
+    async def tearDown(self):
+        await self._channel.close()
+        await self._server.stop(None)
+
+    async def test_unary_unary(self):
+        response = await self._channel.unary_unary(_UNARY_UNARY)(_LARGE_MESSAGE)
+        self.assertIsInstance(response, memoryview)
+        self.assertTrue(response.readonly)
+        self.assertEqual(_LARGE_MESSAGE, response.tobytes())
+        self.assertEqual([memoryview], self._request_types)
+
+    async def test_stream_stream(self):
+        call = self._channel.stream_stream(_STREAM_STREAM,
+                                           response_deserializer=bytes)
+        for index in range(_STREAM_LENGTH):
+            request = b'\x01' * (index + 1)
+            await call.write(request)
+            self.assertEqual(request, await call.read())
+        await call.done_writing()
+        self.assertEqual(grpc.StatusCode.OK, await call.code())
+        self.assertEqual([memoryview] * _STREAM_LENGTH, self._request_types)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -252,6 +252,81 @@ class SimpleStubsTest(unittest.TestCase):
                     f"{grpc._simple_stubs.ChannelCache.get()._test_only_channel_count()} channels remain"
                 )
 
+    def test_cache_stats(self):
+        with _server(grpc.local_server_credentials()) as port:
+            target = f'localhost:{port}'
+            options = (("test_cache_stats", ""),)
+            before = grpc.experimental.channel_cache_stats()
+            for _ in range(_CACHE_TRIALS):
+                grpc.experimental.unary_unary(
+                    _REQUEST,
+                    target,
+                    _UNARY_UNARY,
+                    options=options,
+                    channel_credentials=grpc.local_channel_credentials())
+            after = grpc.experimental.channel_cache_stats()
+            self.assertEqual(before.misses + 1, after.misses)
+            self.assertEqual(before.hits + _CACHE_TRIALS - 1, after.hits)
+
+    def test_concurrent_lookups_share_channel(self):
+        with _server(None) as port:
+            target = f'localhost:{port}'
+            options = (("test_concurrent_lookups_share_channel", ""),)
+            cache = grpc._simple_stubs.ChannelCache.get()
+            before = grpc.experimental.channel_cache_stats()
+            channels = []
+            threads = [
+                threading.Thread(target=lambda: channels.append(
+                    cache.get_channel(target, options, None, True, None)))
+                for _ in range(_CACHE_TRIALS)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            after = grpc.experimental.channel_cache_stats()
+            self.assertEqual(_CACHE_TRIALS, len(channels))
+            for channel in channels:
+                self.assertIs(channels[0], channel)
+            self.assertEqual(before.misses + 1, after.misses)
+
+    def test_pinned_channel_not_evicted(self):
+        with _server(None) as port:
+            target = f'localhost:{port}'
+            options = (("test_pinned_channel_not_evicted", ""),)
+            grpc.experimental.prewarm_channel(target,
+                                              options=options,
+                                              insecure=True,
+                                              pin=True)
+            channel = grpc._simple_stubs.ChannelCache.get().get_channel(
+                target, options, None, True, None)
+            pinned_channels = grpc.experimental.channel_cache_stats(
+            ).pinned_channels
+            self.assertGreaterEqual(pinned_channels, 1)
+            # Outlast the eviction period of the test.
+            time.sleep(3)
+            self.assertIs(
+                channel,
+                grpc._simple_stubs.ChannelCache.get().get_channel(
+                    target, options, None, True, None))
+            self.assertEqual(
+                grpc.experimental.unary_unary(_REQUEST,
+                                              target,
+                                              _UNARY_UNARY,
+                                              options=options,
+                                              insecure=True), _REQUEST)
+            self.assertTrue(
+                grpc.experimental.unpin_channel(target,
+                                                options=options,
+                                                insecure=True))
+            self.assertFalse(
+                grpc.experimental.unpin_channel(target,
+                                                options=options,
+                                                insecure=True))
+            self.assertEqual(
+                pinned_channels - 1,
+                grpc.experimental.channel_cache_stats().pinned_channels)
+
     def test_unary_stream(self):
         with _server(grpc.local_server_credentials()) as port:
             target = f'localhost:{port}'